@@ -8,13 +8,9 @@ import os
 import argparse
 import binascii
 import logging
+import importlib
 from pprint import pformat
 
-from prompt_toolkit.completion import WordCompleter
-from prompt_toolkit import PromptSession
-from prompt_toolkit.history import FileHistory
-from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
-
 from .compiler import compile_dict
 from .compiler import compile_string
 from .compiler import compile_files
@@ -22,6 +18,10 @@ from .compiler import pre_process_dict
 from .parser import parse_string
 from .parser import parse_files
 from .parser import ParseError
+from .parser import BINARY_MAGIC
+from .parser import dump_binary
+from .parser import is_binary
+from .parser import load_binary
 from .errors import Error
 from .errors import EncodeError
 from .errors import DecodeError
@@ -32,6 +32,37 @@ from .errors import ConstraintsError
 __author__ = 'Erik Moqvist'
 __version__ = '0.137.0'
 
+# The prompt_toolkit names used by the shell subcommand. They are
+# imported on first use, as importing prompt_toolkit is slow.
+_PROMPT_TOOLKIT_NAMES = {
+    'WordCompleter': 'prompt_toolkit.completion',
+    'PromptSession': 'prompt_toolkit',
+    'FileHistory': 'prompt_toolkit.history',
+    'AutoSuggestFromHistory': 'prompt_toolkit.auto_suggest'
+}
+
+
+def _import_prompt_toolkit():
+    for name, module_name in _PROMPT_TOOLKIT_NAMES.items():
+        if name not in globals():
+            module = importlib.import_module(module_name)
+            globals()[name] = getattr(module, name)
+
+
+def __getattr__(name):
+    if name in _PROMPT_TOOLKIT_NAMES:
+        _import_prompt_toolkit()
+
+        return globals()[name]
+
+    raise AttributeError(
+        "module '{}' has no attribute '{}'".format(__name__, name))
+
+
+# Module __getattr__() requires Python 3.7 or later.
+if sys.version_info < (3, 7):
+    _import_prompt_toolkit()
+
 
 class ArgumentParserError(Error):
     pass
@@ -88,24 +119,58 @@ def _convert_hexstring(input_spec,
     print(decoded.decode('latin-1'))
 
 
-def _compile_files(specs, input_codec, output_codec, cache_dir):
-    py_count = [spec.endswith('.py') for spec in specs].count(True)
+def _is_binary_file(filename):
+    try:
+        with open(filename, 'rb') as fin:
+            return is_binary(fin.read(len(BINARY_MAGIC)))
+    except (IOError, OSError):
+        return False
+
 
-    if py_count > 0:
-        if py_count != 1:
-            raise Exception('Expected one .py-file, but got {}.'.format(py_count))
+def _load_parsed_file(filename):
+    """Returns the parsed specification in given .py-file or binary file,
+    both created by the parse subcommand.
 
-        module = _import_module(specs[0])
-        parsed = module.SPECIFICATION
-        input_spec = compile_dict(parsed, input_codec)
-        output_spec = compile_dict(parsed, output_codec)
+    """
+
+    if filename.endswith('.py'):
+        return _import_module(filename).SPECIFICATION
+    else:
+        with open(filename, 'rb') as fin:
+            return load_binary(fin.read())
+
+
+def _compile_files(specs,
+                   input_codec,
+                   output_codec,
+                   cache_dir,
+                   json_backend=None):
+    parsed_specs = [
+        spec for spec in specs
+        if spec.endswith('.py') or _is_binary_file(spec)
+    ]
+
+    if json_backend is not None:
+        json_backend = importlib.import_module(json_backend)
+
+    if parsed_specs:
+        if len(parsed_specs) != 1:
+            raise Exception(
+                'Expected one .py-file or binary file, but got {}.'.format(
+                    len(parsed_specs)))
+
+        parsed = _load_parsed_file(parsed_specs[0])
+        compiled = compile_dict(parsed,
+                                json_backend=json_backend,
+                                codecs=[input_codec, output_codec])
     else:
-        input_spec = compile_files(specs,
-                                   input_codec,
-                                   cache_dir=cache_dir)
-        output_spec = compile_files(specs,
-                                    output_codec,
-                                    cache_dir=cache_dir)
+        compiled = compile_files(specs,
+                                 cache_dir=cache_dir,
+                                 json_backend=json_backend,
+                                 codecs=[input_codec, output_codec])
+
+    input_spec = compiled[input_codec]
+    output_spec = compiled[output_codec]
 
     return input_spec, output_spec
 
@@ -114,7 +179,8 @@ def _do_convert(args):
     input_spec, output_spec = _compile_files(args.specification,
                                              args.input_codec,
                                              args.output_codec,
-                                             args.cache_dir)
+                                             args.cache_dir,
+                                             args.json_backend)
 
     if args.hexstring == '-':
         for hexstring in sys.stdin:
@@ -213,6 +279,7 @@ def _handle_command_help():
 
 
 def _do_shell(_args):
+    _import_prompt_toolkit()
     commands = ['compile', 'convert', 'help', 'exit']
     completer = WordCompleter(commands, WORD=True)
     user_home = os.path.expanduser('~')
@@ -255,8 +322,12 @@ def _do_shell(_args):
 def _do_parse(args):
     parsed = parse_files(args.specification)
 
-    with open(args.outfile, 'w') as fout:
-        fout.write('SPECIFICATION = {}'.format(pformat(parsed)))
+    if args.format == 'bin':
+        with open(args.outfile, 'wb') as fout:
+            fout.write(dump_binary(parsed))
+    else:
+        with open(args.outfile, 'w') as fout:
+            fout.write('SPECIFICATION = {}'.format(pformat(parsed)))
 
 
 def _main():
@@ -296,11 +367,15 @@ def _main():
         help='Output format (default: gser).')
     subparser.add_argument('-c', '--cache-dir',
                            help='Cache directory.')
+    subparser.add_argument(
+        '-j', '--json-backend',
+        help=('Name of the JSON module used by the JER codec, for example '
+              'ujson (default: json).'))
     subparser.add_argument(
         'specification',
         nargs='+',
-        help=('ASN.1 specification as one or more .asn files or one .py '
-              'file. The .py-file may be created with the parse subcommand.'))
+        help=('ASN.1 specification as one or more .asn files, or one .py '
+              'or binary file created with the parse subcommand.'))
     subparser.add_argument('type', help='Type to convert.')
     subparser.add_argument(
         'hexstring',
@@ -315,6 +390,12 @@ def _main():
     # The 'parse' subparser.
     subparser = subparsers.add_parser('parse',
                                       description='Convert to a Python dictionary.')
+    subparser.add_argument(
+        '-f', '--format',
+        choices=('py', 'bin'),
+        default='py',
+        help=('Output format; a Python dictionary in a .py-file, or a '
+              'compact binary file that loads faster (default: py).'))
     subparser.add_argument('specification',
                            nargs='+',
                            help='ASN.1 specification as one or more .asn files.')
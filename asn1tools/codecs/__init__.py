@@ -94,6 +94,15 @@ class DecodeContentsLengthError(DecodeError):
         self.contents_max = contents_max
 
 
+class DecodeLimitError(DecodeError):
+    """A configured decoding limit was exceeded. Never handled as a
+    decoding error of an optional member.
+
+    """
+
+    pass
+
+
 class OutOfDataError(DecodeError):
 
     def __init__(self, offset):
@@ -15,6 +15,7 @@ from . import EncodeError
 from . import DecodeError
 from . import DecodeTagError
 from . import DecodeContentsLengthError
+from . import DecodeLimitError
 from . import format_or
 from . import compiler
 from . import utc_time_to_datetime
@@ -72,6 +73,25 @@ class Tag(object):
     DATE_TIME         = 0x21
 
 
+class DecodeKind(object):
+    """How types are decoded by the iterative decoder.
+
+    """
+
+    LEAF           = 0
+    MEMBERS        = 1
+    ARRAY          = 2
+    SEGMENTS       = 3
+    CHOICE         = 4
+    EXPLICIT_TAG   = 5
+    RECURSIVE      = 6
+    ANY_DEFINED_BY = 7
+
+
+# Single byte tags by their value.
+TAGS = tuple([bytes(bytearray([byte])) for byte in range(256)])
+
+
 class DecodeChoiceError(Error):
     pass
 
@@ -130,6 +150,107 @@ def decode_length_constructed(encoded, offset):
         return decode_length_definite(encoded, offset)
 
 
+def validate_length_definite(encoded, offset, canonical):
+    """Same as decode_length_definite(), but also checks that the length
+    is encoded using the minimum number of octets if `canonical` is
+    ``True``.
+
+    """
+
+    length = encoded[offset]
+
+    if length < 128:
+        offset += 1
+
+        if offset + length > len(encoded):
+            raise DecodeContentsLengthError(length, offset, len(encoded))
+
+        return length, offset
+
+    if canonical and length > 128:
+        number_of_bytes = (length & 0x7f)
+
+        if (encoded[offset + 1] == 0
+            or (number_of_bytes == 1 and encoded[offset + 1] < 128)):
+            raise DecodeError(
+                'Expected length encoded in minimum number of octets at '
+                'offset {}.'.format(offset))
+
+    return decode_length_definite(encoded, offset)
+
+
+def validate_signed_integer(encoded, offset, length):
+    """Check that given signed integer contents are encoded in the minimum
+    number of octets.
+
+    """
+
+    if length == 0:
+        raise DecodeError(
+            'Expected at least one integer contents octet at offset {}.'.format(
+                offset))
+
+    if length > 1:
+        first = encoded[offset]
+        second = (encoded[offset + 1] & 0x80)
+
+        if (first == 0 and not second) or (first == 0xff and second):
+            raise DecodeError(
+                'Expected integer encoded in minimum number of octets at '
+                'offset {}.'.format(offset))
+
+
+def validate_bit_string(encoded, offset, length):
+    """Check that given bit string contents has all unused bits set to
+    zero.
+
+    """
+
+    if length == 0:
+        raise DecodeError(
+            'Expected at least one bit string contents octet at offset '
+            '{}.'.format(offset))
+
+    number_of_unused_bits = encoded[offset]
+
+    if number_of_unused_bits > 7 or (length == 1 and number_of_unused_bits > 0):
+        raise DecodeError(
+            'Expected 0 to 7 unused bits at offset {}, but got {}.'.format(
+                offset,
+                number_of_unused_bits))
+
+    if number_of_unused_bits > 0:
+        last_byte = encoded[offset + length - 1]
+
+        if last_byte & ((1 << number_of_unused_bits) - 1):
+            raise DecodeError(
+                'Expected unused bits set to zero at offset {}.'.format(
+                    offset + length - 1))
+
+
+def validate_sorted_elements(element_type, data, offset, end_offset):
+    """Validate all elements in given SET OF contents and check that they
+    are sorted in ascending order by their encodings.
+
+    """
+
+    previous = None
+
+    while offset < end_offset:
+        element_offset = offset
+        offset = element_type.validate(data, offset, True)
+        element = data[element_offset:offset]
+
+        if previous is not None and previous > element:
+            raise DecodeError(
+                'Expected SET OF elements sorted by their encodings at offset '
+                '{}.'.format(element_offset))
+
+        previous = element
+
+    return offset
+
+
 def encode_signed_integer(data):
     encoded = bytearray()
 
@@ -368,6 +489,10 @@ def decode_object_identifier_subidentifier(data, offset):
 
 class Type(object):
 
+    __slots__ = ('name', 'type_name', 'optional', 'default', 'tag')
+
+    decode_kind = DecodeKind.LEAF
+
     def __init__(self, name, type_name, number, flags=0):
         self.name = name
         self.type_name = type_name
@@ -397,12 +522,22 @@ class Type(object):
 
         return end_offset
 
+    def validate(self, data, offset, canonical):
+        offset = self.decode_tag(data, offset)
+        length, offset = validate_length_definite(data, offset, canonical)
+
+        return offset + length
+
     def is_default(self, value):
         return value == self.default
 
 
 class PrimitiveOrConstructedType(Type):
 
+    __slots__ = ('segment', 'constructed_tag')
+
+    decode_kind = DecodeKind.SEGMENTS
+
     def __init__(self, name, type_name, number, segment, flags=0):
         super(PrimitiveOrConstructedType, self).__init__(name,
                                                          type_name,
@@ -458,6 +593,41 @@ class PrimitiveOrConstructedType(Type):
 
             return self.decode_constructed_segments(segments), end_offset
 
+    def validate(self, data, offset, canonical):
+        tag_offset = offset
+        is_primitive, offset = self.decode_tag(data, offset)
+
+        if is_primitive:
+            length, offset = validate_length_definite(data, offset, canonical)
+
+            if canonical:
+                self.validate_primitive_contents(data, offset, length)
+
+            return offset + length
+        elif canonical:
+            raise DecodeError(
+                'Expected {} with primitive encoding at offset {}.'.format(
+                    self.type_name,
+                    tag_offset))
+        else:
+            length, offset = decode_length_constructed(data, offset)
+
+            if length is None:
+                while data[offset:offset + 2] != b'\x00\x00':
+                    offset = self.segment.validate(data, offset, canonical)
+
+                end_offset = offset + 2
+            else:
+                end_offset = offset + length
+
+                while offset < end_offset:
+                    offset = self.segment.validate(data, offset, canonical)
+
+            return end_offset
+
+    def validate_primitive_contents(self, data, offset, length):
+        pass
+
     def decode_primitive_contents(self, data, offset, length):
         raise NotImplementedError('To be implemented by subclasses.')
 
@@ -467,6 +637,8 @@ class PrimitiveOrConstructedType(Type):
 
 class StringType(PrimitiveOrConstructedType):
 
+    __slots__ = ()
+
     TAG = None
     ENCODING = None
 
@@ -495,6 +667,10 @@ class StringType(PrimitiveOrConstructedType):
 
 class MembersType(Type):
 
+    __slots__ = ('root_members', 'additions', 'decode_steps')
+
+    decode_kind = DecodeKind.MEMBERS
+
     def __init__(self, name, tag_name, tag, root_members, additions):
         super(MembersType, self).__init__(name,
                                           tag_name,
@@ -503,6 +679,17 @@ class MembersType(Type):
         self.root_members = root_members
         self.additions = additions
 
+        # Members in decoding order for the iterative decoder, each
+        # with the index of its extension addition, or None for root
+        # members.
+        self.decode_steps = [(member, None) for member in root_members]
+
+        for index, addition in enumerate(additions or []):
+            if isinstance(addition, list):
+                self.decode_steps += [(member, index) for member in addition]
+            else:
+                self.decode_steps.append((addition, index))
+
     def set_tag(self, number, flags):
         super(MembersType, self).set_tag(number,
                                          flags | Encoding.CONSTRUCTED)
@@ -635,6 +822,61 @@ class MembersType(Type):
 
         return offset
 
+    def validate(self, data, offset, canonical):
+        offset = self.decode_tag(data, offset)
+        length, offset = validate_length_definite(data, offset, canonical)
+
+        end_offset = offset + length
+
+        for member in self.root_members:
+            offset = self.validate_member(member,
+                                          data,
+                                          offset,
+                                          end_offset,
+                                          canonical)
+
+        if self.additions:
+            self.validate_additions(data, offset, end_offset, canonical)
+
+        return end_offset
+
+    def validate_additions(self, data, offset, end_offset, canonical):
+        try:
+            for addition in self.additions:
+                if isinstance(addition, list):
+                    for member in addition:
+                        offset = self.validate_member(member,
+                                                      data,
+                                                      offset,
+                                                      end_offset,
+                                                      canonical)
+                else:
+                    offset = self.validate_member(addition,
+                                                  data,
+                                                  offset,
+                                                  end_offset,
+                                                  canonical)
+        except DecodeError:
+            pass
+
+    def validate_member(self, member, data, offset, end_offset, canonical):
+        try:
+            if offset < end_offset:
+                offset = member.validate(data, offset, canonical)
+            else:
+                raise IndexError
+        except (DecodeError, IndexError) as e:
+            if member.optional or member.default is not None:
+                return offset
+
+            if isinstance(e, IndexError):
+                e = DecodeError('out of data at offset {}'.format(offset))
+
+            e.location.append(member.name)
+            raise e
+
+        return offset
+
     def __repr__(self):
         return '{}({}, [{}])'.format(
             self.__class__.__name__,
@@ -644,6 +886,10 @@ class MembersType(Type):
 
 class ArrayType(Type):
 
+    __slots__ = ('element_type',)
+
+    decode_kind = DecodeKind.ARRAY
+
     def __init__(self, name, tag_name, tag, element_type):
         super(ArrayType, self).__init__(name,
                                         tag_name,
@@ -683,6 +929,17 @@ class ArrayType(Type):
 
         return decoded, offset
 
+    def validate(self, data, offset, canonical):
+        offset = self.decode_tag(data, offset)
+        length, offset = validate_length_definite(data, offset, canonical)
+
+        end_offset = offset + length
+
+        while offset < end_offset:
+            offset = self.element_type.validate(data, offset, canonical)
+
+        return offset
+
     def __repr__(self):
         return '{}({}, {})'.format(self.__class__.__name__,
                                    self.name,
@@ -691,6 +948,8 @@ class ArrayType(Type):
 
 class Boolean(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(Boolean, self).__init__(name,
                                       'BOOLEAN',
@@ -713,12 +972,34 @@ class Boolean(Type):
 
         return bool(data[contents_offset]), contents_offset + length
 
+    def validate(self, data, offset, canonical):
+        offset = self.decode_tag(data, offset)
+        length, contents_offset = validate_length_definite(data,
+                                                           offset,
+                                                           canonical)
+
+        if length != 1:
+            raise DecodeError(
+                'Expected BOOLEAN contents length 1 at offset {}, but '
+                'got {}.'.format(offset,
+                                 length))
+
+        if canonical and data[contents_offset] not in [0x00, 0xff]:
+            raise DecodeError(
+                'Expected BOOLEAN contents 0x00 or 0xff at offset {}, but '
+                'got 0x{:02x}.'.format(contents_offset,
+                                       data[contents_offset]))
+
+        return contents_offset + length
+
     def __repr__(self):
         return 'Boolean({})'.format(self.name)
 
 
 class Integer(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(Integer, self).__init__(name,
                                       'INTEGER',
@@ -735,12 +1016,23 @@ class Integer(Type):
 
         return decode_signed_integer(data[offset:end_offset]), end_offset
 
+    def validate(self, data, offset, canonical):
+        offset = self.decode_tag(data, offset)
+        length, offset = validate_length_definite(data, offset, canonical)
+
+        if canonical:
+            validate_signed_integer(data, offset, length)
+
+        return offset + length
+
     def __repr__(self):
         return 'Integer({})'.format(self.name)
 
 
 class Real(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(Real, self).__init__(name, 'REAL', Tag.REAL)
 
@@ -764,6 +1056,8 @@ class Real(Type):
 
 class Null(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(Null, self).__init__(name, 'NULL', Tag.NULL)
 
@@ -779,12 +1073,25 @@ class Null(Type):
 
         return None, offset + 1
 
+    def validate(self, data, offset, canonical):
+        offset = self.decode_tag(data, offset)
+
+        if canonical and data[offset] != 0:
+            raise DecodeError(
+                'Expected NULL contents length 0 at offset {}, but got '
+                '{}.'.format(offset,
+                             data[offset]))
+
+        return offset + 1
+
     def __repr__(self):
         return 'Null({})'.format(self.name)
 
 
 class BitString(PrimitiveOrConstructedType):
 
+    __slots__ = ('has_named_bits',)
+
     def __init__(self, name, has_named_bits):
         super(BitString, self).__init__(name,
                                         'BIT STRING',
@@ -829,6 +1136,9 @@ class BitString(PrimitiveOrConstructedType):
 
         return (data[offset:offset + length], number_of_bits)
 
+    def validate_primitive_contents(self, data, offset, length):
+        validate_bit_string(data, offset, length)
+
     def decode_constructed_segments(self, segments):
         decoded = bytearray()
         number_of_bits = 0
@@ -845,6 +1155,8 @@ class BitString(PrimitiveOrConstructedType):
 
 class OctetString(PrimitiveOrConstructedType):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(OctetString, self).__init__(name,
                                           'OCTET STRING',
@@ -868,6 +1180,8 @@ class OctetString(PrimitiveOrConstructedType):
 
 class ObjectIdentifier(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(ObjectIdentifier, self).__init__(name,
                                                'OBJECT IDENTIFIER',
@@ -893,6 +1207,8 @@ class ObjectIdentifier(Type):
 
 class Enumerated(Type):
 
+    __slots__ = ('has_extension_marker', 'value_to_data', 'data_to_value')
+
     def __init__(self, name, values, numeric):
         super(Enumerated, self).__init__(name,
                                          'ENUMERATED',
@@ -940,12 +1256,33 @@ class Enumerated(Type):
                     self.format_values(),
                     value))
 
+    def validate(self, data, offset, canonical):
+        offset = self.decode_tag(data, offset)
+        length, offset = validate_length_definite(data, offset, canonical)
+        end_offset = offset + length
+
+        if canonical:
+            validate_signed_integer(data, offset, length)
+
+        if not self.has_extension_marker:
+            value = decode_signed_integer(data[offset:end_offset])
+
+            if value not in self.value_to_data:
+                raise DecodeError(
+                    'Expected enumeration value {}, but got {}.'.format(
+                        self.format_values(),
+                        value))
+
+        return end_offset
+
     def __repr__(self):
         return 'Enumerated({})'.format(self.name)
 
 
 class Sequence(MembersType):
 
+    __slots__ = ()
+
     def __init__(self, name, root_members, additions):
         super(Sequence, self).__init__(name,
                                        'SEQUENCE',
@@ -956,6 +1293,8 @@ class Sequence(MembersType):
 
 class SequenceOf(ArrayType):
 
+    __slots__ = ()
+
     def __init__(self, name, element_type):
         super(SequenceOf, self).__init__(name,
                                          'SEQUENCE OF',
@@ -965,6 +1304,8 @@ class SequenceOf(ArrayType):
 
 class Set(MembersType):
 
+    __slots__ = ()
+
     def __init__(self, name, root_members, additions):
         super(Set, self).__init__(name,
                                   'SET',
@@ -975,15 +1316,34 @@ class Set(MembersType):
 
 class SetOf(ArrayType):
 
+    __slots__ = ()
+
     def __init__(self, name, element_type):
         super(SetOf, self).__init__(name,
                                     'SET OF',
                                     Tag.SET,
                                     element_type)
 
+    def validate(self, data, offset, canonical):
+        if not canonical:
+            return super(SetOf, self).validate(data, offset, canonical)
+
+        offset = self.decode_tag(data, offset)
+        length, offset = validate_length_definite(data, offset, canonical)
+
+        return validate_sorted_elements(self.element_type,
+                                        data,
+                                        offset,
+                                        offset + length)
+
 
 class Choice(Type):
 
+    __slots__ = ('members', 'name_to_member', 'tag_to_member',
+                 'has_extension_marker')
+
+    decode_kind = DecodeKind.CHOICE
+
     def __init__(self, name, root_members, additions):
         super(Choice, self).__init__(name, 'CHOICE', None)
         members = root_members
@@ -1081,6 +1441,21 @@ class Choice(Type):
 
         return (member.name, decoded), offset
 
+    def validate(self, data, offset, canonical):
+        tag = bytes(read_tag(data, offset))
+
+        if tag in self.tag_to_member:
+            member = self.tag_to_member[tag]
+        elif self.has_extension_marker:
+            return skip_tag_length_contents(data, offset)
+        else:
+            raise DecodeError(
+                "Expected choice member tag {}, but got '{}'.".format(
+                    self.format_tags(),
+                    self.format_tag(tag)))
+
+        return member.validate(data, offset, canonical)
+
     def __repr__(self):
         return 'Choice({}, [{}])'.format(
             self.name,
@@ -1089,71 +1464,95 @@ class Choice(Type):
 
 class UTF8String(StringType):
 
+    __slots__ = ()
+
     TAG = Tag.UTF8_STRING
     ENCODING = 'utf-8'
 
 
 class NumericString(StringType):
 
+    __slots__ = ()
+
     TAG = Tag.NUMERIC_STRING
     ENCODING = 'ascii'
 
 
 class PrintableString(StringType):
 
+    __slots__ = ()
+
     TAG = Tag.PRINTABLE_STRING
     ENCODING = 'ascii'
 
 
 class IA5String(StringType):
 
+    __slots__ = ()
+
     TAG = Tag.IA5_STRING
     ENCODING = 'ascii'
 
 
 class VisibleString(StringType):
 
+    __slots__ = ()
+
     TAG = Tag.VISIBLE_STRING
     ENCODING = 'ascii'
 
 
 class GeneralString(StringType):
 
+    __slots__ = ()
+
     TAG = Tag.GENERAL_STRING
     ENCODING = 'latin-1'
 
 
 class BMPString(StringType):
 
+    __slots__ = ()
+
     TAG = Tag.BMP_STRING
     ENCODING = 'utf-16-be'
 
 
 class GraphicString(StringType):
 
+    __slots__ = ()
+
     TAG = Tag.GRAPHIC_STRING
     ENCODING = 'latin-1'
 
 
 class UniversalString(StringType):
 
+    __slots__ = ()
+
     TAG = Tag.UNIVERSAL_STRING
     ENCODING = 'utf-32-be'
 
 
 class TeletexString(StringType):
 
+    __slots__ = ()
+
     TAG = Tag.T61_STRING
     ENCODING = 'iso-8859-1'
 
 
 class ObjectDescriptor(GraphicString):
 
+    __slots__ = ()
+
     TAG = Tag.OBJECT_DESCRIPTOR
 
 
 class UTCTime(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(UTCTime, self).__init__(name,
                                       'UTCTime',
@@ -1179,6 +1578,8 @@ class UTCTime(Type):
 
 class GeneralizedTime(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(GeneralizedTime, self).__init__(name,
                                               'GeneralizedTime',
@@ -1204,6 +1605,8 @@ class GeneralizedTime(Type):
 
 class Date(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(Date, self).__init__(name, 'DATE', Tag.DATE)
 
@@ -1228,6 +1631,8 @@ class Date(Type):
 
 class TimeOfDay(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(TimeOfDay, self).__init__(name,
                                         'TIME-OF-DAY',
@@ -1254,6 +1659,8 @@ class TimeOfDay(Type):
 
 class DateTime(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(DateTime, self).__init__(name,
                                        'DATE-TIME',
@@ -1281,6 +1688,8 @@ class DateTime(Type):
 
 class Any(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(Any, self).__init__(name, 'ANY', None)
 
@@ -1295,12 +1704,22 @@ class Any(Type):
 
         return data[start:end_offset], end_offset
 
+    def validate(self, data, offset, canonical):
+        offset = skip_tag(data, offset)
+        length, offset = validate_length_definite(data, offset, canonical)
+
+        return offset + length
+
     def __repr__(self):
         return 'Any({})'.format(self.name)
 
 
 class AnyDefinedBy(Type):
 
+    __slots__ = ('type_member', 'choices')
+
+    decode_kind = DecodeKind.ANY_DEFINED_BY
+
     def __init__(self, name, type_member, choices):
         super(AnyDefinedBy, self).__init__(name,
                                            'ANY DEFINED BY',
@@ -1335,12 +1754,24 @@ class AnyDefinedBy(Type):
 
             return data[start:end_offset], end_offset
 
+    def validate(self, data, offset, canonical):
+        # The choice depends on the decoded value of another member,
+        # so only the tag and the length are checked.
+        offset = skip_tag(data, offset)
+        length, offset = validate_length_definite(data, offset, canonical)
+
+        return offset + length
+
     def __repr__(self):
         return 'AnyDefinedBy({})'.format(self.name)
 
 
 class ExplicitTag(Type):
 
+    __slots__ = ('inner',)
+
+    decode_kind = DecodeKind.EXPLICIT_TAG
+
     def __init__(self, name, inner):
         super(ExplicitTag, self).__init__(name, 'ExplicitTag', None)
         self.inner = inner
@@ -1361,12 +1792,23 @@ class ExplicitTag(Type):
         _, offset = decode_length_definite(data, offset)
         return self.inner.decode(data, offset)
 
+    def validate(self, data, offset, canonical):
+        offset = self.decode_tag(data, offset)
+        _, offset = validate_length_definite(data, offset, canonical)
+
+        return self.inner.validate(data, offset, canonical)
+
     def __repr__(self):
         return 'ExplicitTag()'
 
 
 class Recursive(Type, compiler.Recursive):
 
+    __slots__ = ('module_name', 'tag_number', 'tag_flags', 'inner',
+                 'choice_parents')
+
+    decode_kind = DecodeKind.RECURSIVE
+
     def __init__(self, name, type_name, module_name):
         super(Recursive, self).__init__(name, 'RECURSIVE', None)
         self.type_name = type_name
@@ -1395,10 +1837,437 @@ class Recursive(Type, compiler.Recursive):
     def decode(self, data, offset):
         return self.inner.decode(data, offset)
 
+    def validate(self, data, offset, canonical):
+        return self.inner.validate(data, offset, canonical)
+
     def __repr__(self):
         return 'Recursive({})'.format(self.type_name)
 
 
+class IterativeDecoder(object):
+    """Decodes data using an explicit stack instead of Python recursion,
+    with optional limits on the nesting depth and the total number of
+    decoded elements.
+
+    The state of the SEQUENCE, SET, SEQUENCE OF, SET OF or constructed
+    string being decoded is kept in local variables, and saved on the
+    stack while a nested one is decoded. CHOICE, explicit tags and
+    recursive types are resolved in place, and tags and lengths of
+    constructed encodings are read inline, so no frame objects are
+    created and few calls are made per nesting level. Elements without
+    nested elements are decoded by their decode() method.
+
+    The nesting depth is the number of enclosing constructed
+    encodings, and the number of elements is the number of decoded
+    tag-length-value encodings.
+
+    """
+
+    def __init__(self, maximum_depth=None, maximum_number_of_elements=None):
+        if maximum_depth is None:
+            maximum_depth = float('inf')
+
+        if maximum_number_of_elements is None:
+            maximum_number_of_elements = float('inf')
+
+        self.maximum_depth = maximum_depth
+        self.maximum_number_of_elements = maximum_number_of_elements
+
+    def too_deep_error(self):
+        return DecodeLimitError(
+            'Expected at most {} nesting levels.'.format(self.maximum_depth))
+
+    def too_many_elements_error(self, offset):
+        return DecodeLimitError(
+            'Expected at most {} elements, but got more at offset {}.'.format(
+                self.maximum_number_of_elements,
+                offset))
+
+    def decode(self, type_, data, offset):
+        maximum_depth = self.maximum_depth
+        maximum_number_of_elements = self.maximum_number_of_elements
+        number_of_elements = 0
+        stack = []
+
+        # Local names are faster than attribute lookups.
+        leaf = DecodeKind.LEAF
+        members = DecodeKind.MEMBERS
+        array = DecodeKind.ARRAY
+        segments = DecodeKind.SEGMENTS
+        choice = DecodeKind.CHOICE
+        explicit_tag = DecodeKind.EXPLICIT_TAG
+        recursive = DecodeKind.RECURSIVE
+        any_defined_by = DecodeKind.ANY_DEFINED_BY
+
+        # The frame being decoded. None is the outermost frame, taking
+        # the decoded value of given type.
+        kind = None
+        frame_type = None
+        element_type = None
+        end_offset = None
+        depth = 0
+        names = ()
+        items = None
+        steps = None
+        index = 0
+        member = None
+        member_offset = offset
+        addition = None
+        addition_values = None
+
+        # The type to decode next, or None to continue the frame.
+        child = type_
+
+        while True:
+            try:
+                if child is None:
+                    if kind == members:
+                        # Members without nested elements are decoded
+                        # right here.
+                        while index < len(steps):
+                            member, member_addition = steps[index]
+
+                            if member_addition != addition:
+                                items.update(addition_values)
+                                addition = member_addition
+                                addition_values = {}
+
+                            member_offset = offset
+
+                            if offset < end_offset:
+                                member_kind = member.decode_kind
+
+                                if member_kind != leaf:
+                                    if (member_kind != segments
+                                        or data[offset] == member.constructed_tag[0]):
+                                        child = member
+
+                                        break
+
+                                number_of_elements += 1
+
+                                if number_of_elements > maximum_number_of_elements:
+                                    raise self.too_many_elements_error(offset)
+
+                                value, offset = member.decode(data, offset)
+                                addition_values[member.name] = value
+                            elif member.optional:
+                                pass
+                            elif member.default is not None:
+                                addition_values[member.name] = member.default
+                            else:
+                                raise IndexError
+
+                            index += 1
+                        else:
+                            if addition_values is not items:
+                                items.update(addition_values)
+
+                            value = items
+                            offset = end_offset
+                    elif kind == array:
+                        element_kind = element_type.decode_kind
+
+                        if element_kind == leaf or element_kind == segments:
+                            # Elements without nested elements are
+                            # decoded right here.
+                            decode = element_type.decode
+
+                            if element_kind == segments:
+                                constructed = element_type.constructed_tag[0]
+                            else:
+                                constructed = None
+
+                            while offset < end_offset:
+                                if data[offset] == constructed:
+                                    child = element_type
+
+                                    break
+
+                                number_of_elements += 1
+
+                                if number_of_elements > maximum_number_of_elements:
+                                    raise self.too_many_elements_error(offset)
+
+                                value, offset = decode(data, offset)
+                                items.append(value)
+                            else:
+                                value = items
+                        elif offset < end_offset:
+                            child = element_type
+                        else:
+                            value = items
+                    elif end_offset is None:
+                        if data[offset:offset + 2] == b'\x00\x00':
+                            value = frame_type.decode_constructed_segments(items)
+                            offset += 2
+                        else:
+                            child = element_type
+                    elif offset < end_offset:
+                        child = element_type
+                    else:
+                        value = frame_type.decode_constructed_segments(items)
+                        offset = end_offset
+
+                    if child is None:
+                        # The frame is completed.
+                        for name in names:
+                            value = (name, value)
+
+                        (kind,
+                         frame_type,
+                         element_type,
+                         end_offset,
+                         depth,
+                         names,
+                         items,
+                         steps,
+                         index,
+                         member,
+                         member_offset,
+                         addition,
+                         addition_values) = stack.pop()
+                        child_names = ()
+
+                if child is not None:
+                    # Resolve recursive types, CHOICE and explicit tags.
+                    child_names = ()
+                    child_depth = depth
+
+                    while True:
+                        child_kind = child.decode_kind
+
+                        if child_kind == recursive:
+                            child = child.inner
+                        elif child_kind == choice:
+                            tag = data[offset]
+
+                            if tag & 0x1f == 0x1f:
+                                tag = bytes(read_tag(data, offset))
+                            else:
+                                tag = TAGS[tag]
+
+                            choice_member = child.tag_to_member.get(tag)
+
+                            # Let decode() skip unknown extensions and
+                            # raise errors.
+                            if choice_member is None:
+                                break
+
+                            child_names = (choice_member.name, ) + child_names
+                            child = choice_member
+                        elif child_kind == explicit_tag:
+                            number_of_elements += 1
+
+                            if number_of_elements > maximum_number_of_elements:
+                                raise self.too_many_elements_error(offset)
+
+                            child_depth += 1
+
+                            if child_depth > maximum_depth:
+                                raise self.too_deep_error()
+
+                            tag = child.tag
+                            tag_end_offset = offset + len(tag)
+
+                            if data[offset:tag_end_offset] != tag:
+                                child.decode_tag(data, offset)
+
+                            length = data[tag_end_offset]
+
+                            if length < 128:
+                                offset = tag_end_offset + 1
+
+                                if offset + length > len(data):
+                                    raise DecodeContentsLengthError(length,
+                                                                    offset,
+                                                                    len(data))
+                            else:
+                                _, offset = decode_length_definite(data,
+                                                                   tag_end_offset)
+
+                            child = child.inner
+                        else:
+                            break
+
+                    number_of_elements += 1
+
+                    if number_of_elements > maximum_number_of_elements:
+                        raise self.too_many_elements_error(offset)
+
+                    if child_kind == leaf:
+                        value, offset = child.decode(data, offset)
+                    elif child_kind == members or child_kind == array:
+                        if child_depth == maximum_depth:
+                            raise self.too_deep_error()
+
+                        tag = child.tag
+                        tag_end_offset = offset + len(tag)
+
+                        if data[offset:tag_end_offset] != tag:
+                            child.decode_tag(data, offset)
+
+                        length = data[tag_end_offset]
+
+                        if length < 128:
+                            offset = tag_end_offset + 1
+
+                            if offset + length > len(data):
+                                raise DecodeContentsLengthError(length,
+                                                                offset,
+                                                                len(data))
+                        else:
+                            length, offset = decode_length_definite(
+                                data,
+                                tag_end_offset)
+
+                        stack.append((kind,
+                                      frame_type,
+                                      element_type,
+                                      end_offset,
+                                      depth,
+                                      names,
+                                      items,
+                                      steps,
+                                      index,
+                                      member,
+                                      member_offset,
+                                      addition,
+                                      addition_values))
+                        kind = child_kind
+                        end_offset = offset + length
+                        depth = child_depth + 1
+                        names = child_names
+
+                        if kind == members:
+                            items = {}
+                            steps = child.decode_steps
+                            index = 0
+                            addition = None
+                            addition_values = items
+                        else:
+                            element_type = child.element_type
+                            items = []
+
+                        child = None
+
+                        continue
+                    elif child_kind == segments:
+                        tag = child.constructed_tag
+                        tag_end_offset = offset + len(tag)
+
+                        # Primitive encoding is far more common.
+                        if (data[offset] != tag[0]
+                            or data[offset:tag_end_offset] != tag):
+                            value, offset = child.decode(data, offset)
+                        else:
+                            if child_depth == maximum_depth:
+                                raise self.too_deep_error()
+
+                            length, offset = decode_length_constructed(
+                                data,
+                                tag_end_offset)
+                            stack.append((kind,
+                                          frame_type,
+                                          element_type,
+                                          end_offset,
+                                          depth,
+                                          names,
+                                          items,
+                                          steps,
+                                          index,
+                                          member,
+                                          member_offset,
+                                          addition,
+                                          addition_values))
+                            kind = segments
+                            frame_type = child
+                            element_type = child.segment
+
+                            if length is None:
+                                end_offset = None
+                            else:
+                                end_offset = offset + length
+
+                            depth = child_depth + 1
+                            names = child_names
+                            items = []
+                            child = None
+
+                            continue
+                    elif child_kind == any_defined_by:
+                        value, offset = child.decode(data,
+                                                     offset,
+                                                     addition_values)
+                    else:
+                        value, offset = child.decode(data, offset)
+
+                    child = None
+
+                for name in child_names:
+                    value = (name, value)
+
+                if kind == members:
+                    addition_values[member.name] = value
+                    index += 1
+                elif kind is None:
+                    return value, offset
+                else:
+                    items.append(value)
+            except Exception as e:
+                error = e
+
+                # Let the SEQUENCE or SET the error occurred in handle it,
+                # if any.
+                while True:
+                    if (kind == members
+                        and isinstance(error, (DecodeError, IndexError))
+                        and not isinstance(error, DecodeLimitError)):
+                        index += 1
+                        offset = member_offset
+
+                        if member.optional:
+                            break
+
+                        if member.default is not None:
+                            addition_values[member.name] = member.default
+
+                            break
+
+                        if isinstance(error, IndexError):
+                            error = DecodeError(
+                                'out of data at offset {}'.format(offset))
+
+                        error.location.append(member.name)
+
+                        if addition is not None:
+                            # Stop decoding extension additions, and
+                            # discard the values of the failing one.
+                            index = len(steps)
+                            addition_values = {}
+
+                            break
+
+                    if not stack:
+                        raise error
+
+                    (kind,
+                     frame_type,
+                     element_type,
+                     end_offset,
+                     depth,
+                     names,
+                     items,
+                     steps,
+                     index,
+                     member,
+                     member_offset,
+                     addition,
+                     addition_values) = stack.pop()
+
+                child = None
+
+
 class CompiledType(compiler.CompiledType):
 
     def __init__(self, type_):
@@ -1418,6 +2287,45 @@ class CompiledType(compiler.CompiledType):
     def decode(self, data):
         return self._type.decode(bytearray(data), 0)[0]
 
+    def decode_with_limits(self,
+                           data,
+                           maximum_depth,
+                           maximum_number_of_elements,
+                           maximum_string_length):
+        if maximum_string_length is not None:
+            raise DecodeError(
+                'String length limit is not supported for this codec.')
+
+        decoder = IterativeDecoder(maximum_depth, maximum_number_of_elements)
+
+        return decoder.decode(self._type, bytearray(data), 0)[0]
+
+    def iter_decode(self, data):
+        data = memoryview(data)
+        offset = 0
+
+        while offset < len(data):
+            try:
+                end_offset = skip_tag_length_contents(data, offset)
+            except (DecodeContentsLengthError, IndexError):
+                # Trailing partial data.
+                return
+
+            encoded = bytearray(data[offset:end_offset])
+
+            yield self._type.decode(encoded, 0)[0], offset, end_offset
+
+            offset = end_offset
+
+    def validate(self, data, canonical=False):
+        try:
+            self._type.validate(bytearray(data), 0, canonical)
+        except IndexError:
+            raise DecodeError('out of data')
+
+    def decode_length(self, data):
+        return decode_length(data)
+
     def __repr__(self):
         return repr(self._type)
 
@@ -1425,9 +2333,9 @@ class CompiledType(compiler.CompiledType):
 class Compiler(compiler.Compiler):
 
     def process_type(self, type_name, type_descriptor, module_name):
-        compiled_type = self.compile_type(type_name,
-                                          type_descriptor,
-                                          module_name)
+        compiled_type = self.compile_user_type(type_name,
+                                               type_name,
+                                               module_name)
 
         return CompiledType(compiled_type)
 
@@ -1617,8 +2525,8 @@ class Compiler(compiler.Compiler):
             additions.append(compiled_member)
 
 
-def compile_dict(specification, numeric_enums=False):
-    return Compiler(specification, numeric_enums).process()
+def compile_dict(specification, numeric_enums=False, lazy=False):
+    return Compiler(specification, numeric_enums).process(lazy)
 
 
 def decode_length(data):
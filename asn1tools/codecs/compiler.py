@@ -9,6 +9,12 @@ from copy import copy
 from copy import deepcopy
 from ..errors import CompileError
 from ..parser import EXTENSION_MARKER
+from . import EncodeError
+from . import DecodeError
+
+
+# Sections of a module that are pruned by prune().
+PRUNED_SECTIONS = ['types', 'values', 'object-classes', 'object-sets']
 
 
 def flatten(dlist):
@@ -93,9 +99,35 @@ class CompiledType(object):
     def check_constraints(self, data):
         return self.constraints_checker.encode(data)
 
+    def decode_with_limits(self,
+                           data,
+                           maximum_depth,
+                           maximum_number_of_elements,
+                           maximum_string_length):
+        raise DecodeError('Decoding limits are not supported for this codec.')
+
+    def iter_decode(self, data):
+        raise DecodeError('Iterative decoding is not supported for this codec.')
+
+    def iter_decode_xer(self, fileobj):
+        raise DecodeError('Iterative XER decoding is not supported for this codec.')
+
+    def encode_jer_stream(self, iterable, fileobj, indent=None):
+        raise EncodeError('Streaming JER encoding is not supported for this codec.')
+
+    def iter_decode_jer(self, fileobj):
+        raise DecodeError('Iterative JER decoding is not supported for this codec.')
+
+    def validate(self, data, canonical=False):
+        raise DecodeError('Validate is not supported for this codec.')
+
+    def decode_length(self, data):
+        raise DecodeError('Decode length is not supported for this codec.')
+
 
 class Recursive(object):
-    pass
+
+    __slots__ = ()
 
 
 class OpenType(object):
@@ -158,10 +190,84 @@ class CompiledOpenTypes(CompiledType):
     def decode(self, data):
         return self._inner.decode(data)
 
+    def decode_with_limits(self,
+                           data,
+                           maximum_depth,
+                           maximum_number_of_elements,
+                           maximum_string_length):
+        return self._inner.decode_with_limits(data,
+                                              maximum_depth,
+                                              maximum_number_of_elements,
+                                              maximum_string_length)
+
+    def iter_decode(self, data):
+        return self._inner.iter_decode(data)
+
+    def iter_decode_xer(self, fileobj):
+        return self._inner.iter_decode_xer(fileobj)
+
+    def encode_jer_stream(self, iterable, fileobj, indent=None):
+        return self._inner.encode_jer_stream(iterable, fileobj, indent)
+
+    def iter_decode_jer(self, fileobj):
+        return self._inner.iter_decode_jer(fileobj)
+
+    def validate(self, data, canonical=False):
+        return self._inner.validate(data, canonical)
+
+    def decode_length(self, data):
+        return self._inner.decode_length(data)
+
     def __repr__(self):
         return repr(self._inner)
 
 
+class LazyCompiledTypes(object):
+    """Types compiled by given compiler on first access. The caller must
+    serialize calls to :meth:`get()`.
+
+    """
+
+    def __init__(self, compiler):
+        self._compiler = compiler
+        self._compiled = {}
+
+    def get(self, module_name, type_name):
+        key = (module_name, type_name)
+
+        try:
+            return self._compiled[key]
+        except KeyError:
+            pass
+
+        compiler = self._compiler
+        types = compiler._specification[module_name]['types']
+
+        try:
+            compiled_type = compiler.process_top_level_type(
+                type_name,
+                types[type_name],
+                module_name)
+        except Exception:
+            del compiler.types_backtrace[:]
+            del compiler.recursive_types[:]
+            raise
+
+        self._compiled[key] = compiled_type
+
+        # Recursive types refer to top level types, possibly not yet
+        # compiled.
+        recursive_types = compiler.recursive_types
+        compiler.recursive_types = []
+
+        for recursive_type in recursive_types:
+            inner_type = self.get(recursive_type.module_name,
+                                  recursive_type.type_name).type
+            recursive_type.set_inner_type(inner_type)
+
+        return compiled_type
+
+
 class Compiler(object):
 
     def __init__(self, specification, numeric_enums=False):
@@ -181,8 +287,19 @@ class Compiler(object):
     def types_backtrace(self):
         return self._types_backtrace
 
-    def process(self):
-        self.pre_process()
+    def process(self, lazy=False, pre_processed=False):
+        """Compile all types in the specification. If `lazy` is ``True``,
+        return a :class:`LazyCompiledTypes` object compiling each type
+        on first access instead. Give `pre_processed` as ``True`` if
+        the specification is already pre-processed.
+
+        """
+
+        if not pre_processed:
+            self.pre_process()
+
+        if lazy:
+            return LazyCompiledTypes(self)
 
         compiled = {}
 
@@ -190,24 +307,13 @@ class Compiler(object):
             items = self._specification[module_name]['types'].items()
 
             for type_name, type_descriptor in items:
-                self.types_backtrace_push(type_name)
-                compiled_type = self.process_type(type_name,
-                                                  type_descriptor,
-                                                  module_name)
-                compiled_open_types = self.compile_open_types(type_name,
-                                                              type_descriptor,
-                                                              module_name)
-
-                if compiled_open_types:
-                    compiled_type = CompiledOpenTypes(compiled_open_types,
-                                                      compiled_type)
-
-                self.types_backtrace_pop()
-
                 if module_name not in compiled:
                     compiled[module_name] = {}
 
-                compiled[module_name][type_name] = compiled_type
+                compiled[module_name][type_name] = self.process_top_level_type(
+                    type_name,
+                    type_descriptor,
+                    module_name)
 
         for recursive_type in self.recursive_types:
             compiled_module = compiled[recursive_type.module_name]
@@ -216,6 +322,23 @@ class Compiler(object):
 
         return compiled
 
+    def process_top_level_type(self, type_name, type_descriptor, module_name):
+        self.types_backtrace_push(type_name)
+        compiled_type = self.process_type(type_name,
+                                          type_descriptor,
+                                          module_name)
+        compiled_open_types = self.compile_open_types(type_name,
+                                                      type_descriptor,
+                                                      module_name)
+
+        if compiled_open_types:
+            compiled_type = CompiledOpenTypes(compiled_open_types,
+                                              compiled_type)
+
+        self.types_backtrace_pop()
+
+        return compiled_type
+
     def pre_process(self):
         for module_name in self._specification:
             module = self._specification[module_name]
@@ -568,9 +691,13 @@ class Compiler(object):
         return compiled
 
     def compile_user_type(self, name, type_name, module_name):
-        compiled = self.get_compiled_type(name,
-                                          type_name,
-                                          module_name)
+        """Compile given user type once and return renamed shallow copies
+        of it for other names. The copies share everything but the name
+        with the first compiled type.
+
+        """
+
+        compiled = self.get_compiled_type(type_name, module_name)
 
         if compiled is None:
             self.types_backtrace_push(type_name)
@@ -580,10 +707,13 @@ class Compiler(object):
                     type_name,
                     module_name))
             self.types_backtrace_pop()
-            self.set_compiled_type(name,
-                                   type_name,
-                                   module_name,
-                                   compiled)
+
+            # Recursive types are resolved one by one and can
+            # therefore not be shared.
+            if not isinstance(compiled, Recursive):
+                self.set_compiled_type(type_name, module_name, compiled)
+        elif compiled.name != name:
+            compiled = self.copy_with_name(compiled, name)
 
         return compiled
 
@@ -784,20 +914,17 @@ class Compiler(object):
             if member['name'] == member_name:
                 return member['type'], module_name
 
-    def get_compiled_type(self, name, type_name, module_name):
+    def get_compiled_type(self, type_name, module_name):
         try:
-            return self.compiled[module_name][type_name][name]
+            return self.compiled[module_name][type_name]
         except KeyError:
             return None
 
-    def set_compiled_type(self, name, type_name, module_name, compiled):
+    def set_compiled_type(self, type_name, module_name, compiled):
         if module_name not in self.compiled:
             self.compiled[module_name] = {}
 
-        if type_name not in self.compiled[module_name]:
-            self.compiled[module_name][type_name] = {}
-
-        self.compiled[module_name][type_name][name] = compiled
+        self.compiled[module_name][type_name] = compiled
 
     def convert_object_class_type_descriptor(self, type_descriptor, module_name):
         type_name, module_name = self.lookup_object_class_type_name(
@@ -814,6 +941,12 @@ class Compiler(object):
 
         return compiled_type
 
+    def copy_with_name(self, compiled_type, name):
+        compiled_type = copy(compiled_type)
+        compiled_type.name = name
+
+        return compiled_type
+
     def set_compiled_restricted_to(self, compiled, type_descriptor, module_name):
         compiled = self.copy(compiled)
         compiled.set_restricted_to_range(
@@ -898,3 +1031,116 @@ def enum_values_split(values):
 
 def pre_process(specification):
     return Compiler(specification).pre_process()
+
+
+def referenced_names(descriptor):
+    """Return a set of all names possibly referred to by given type,
+    value, object class or object set descriptor. Object class field
+    names are replaced by their object class name.
+
+    """
+
+    names = set()
+    items = [descriptor]
+
+    while items:
+        item = items.pop()
+
+        if isinstance(item, dict):
+            items.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            items.extend(item)
+        elif isinstance(item, str):
+            names.add(item.split('.')[0])
+
+    return names
+
+
+def find_defining_module(specification, name, module_name):
+    """Return the name of the module defining given name referred to from
+    given module, following imports, or ``None`` if not found.
+
+    """
+
+    visited = set()
+
+    while module_name not in visited:
+        visited.add(module_name)
+        module = specification[module_name]
+
+        for section in PRUNED_SECTIONS:
+            if name in module.get(section, {}):
+                return module_name
+
+        for from_module_name, imports in module.get('imports', {}).items():
+            if name in imports and from_module_name in specification:
+                module_name = from_module_name
+                break
+
+    return None
+
+
+def prune(specification, roots):
+    """Return a copy of given specification with only given root types
+    and the types, values, object classes and object sets they refer
+    to, directly or indirectly.
+
+    """
+
+    reachable = set()
+    pending = []
+
+    for root in roots:
+        module_names = [
+            module_name
+            for module_name, module in specification.items()
+            if root in module.get('types', {})
+        ]
+
+        if not module_names:
+            raise CompileError(
+                "Type '{}' not found in any module.".format(root))
+
+        for module_name in module_names:
+            pending.append((module_name, root))
+
+    while pending:
+        key = pending.pop()
+
+        if key in reachable:
+            continue
+
+        reachable.add(key)
+        module_name, name = key
+        module = specification[module_name]
+
+        for section in PRUNED_SECTIONS:
+            descriptor = module.get(section, {}).get(name)
+
+            if descriptor is None:
+                continue
+
+            for referenced_name in referenced_names(descriptor):
+                defining_module_name = find_defining_module(specification,
+                                                            referenced_name,
+                                                            module_name)
+
+                if defining_module_name is not None:
+                    pending.append((defining_module_name, referenced_name))
+
+    pruned = {}
+
+    for module_name, module in specification.items():
+        module = dict(module)
+
+        for section in PRUNED_SECTIONS:
+            if section in module:
+                module[section] = {
+                    name: descriptor
+                    for name, descriptor in module[section].items()
+                    if (module_name, name) in reachable
+                }
+
+        pruned[module_name] = module
+
+    return pruned
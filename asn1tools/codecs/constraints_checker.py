@@ -41,6 +41,8 @@ TIME_TYPES = [
 
 class Type(object):
 
+    __slots__ = ('name', 'optional', 'default')
+
     def __init__(self, name):
         self.name = name
 
@@ -56,6 +58,8 @@ class Type(object):
 
 class String(Type):
 
+    __slots__ = ('permitted_alphabet', 'minimum', 'maximum')
+
     PERMITTED_ALPHABET = ''
 
     def __init__(self,
@@ -101,12 +105,16 @@ class String(Type):
 
 class Boolean(Type):
 
+    __slots__ = ()
+
     def encode(self, data):
         pass
 
 
 class Integer(Type):
 
+    __slots__ = ('minimum', 'maximum')
+
     def __init__(self, name):
         super(Integer, self).__init__(name)
         self.minimum = 'MIN'
@@ -136,18 +144,24 @@ class Integer(Type):
 
 class Float(Type):
 
+    __slots__ = ()
+
     def encode(self, data):
         pass
 
 
 class Null(Type):
 
+    __slots__ = ()
+
     def encode(self, data):
         pass
 
 
 class BitString(Type):
 
+    __slots__ = ('minimum', 'maximum')
+
     def __init__(self, name, minimum, maximum, has_extension_marker):
         super(BitString, self).__init__(name)
 
@@ -174,12 +188,16 @@ class BitString(Type):
 
 class Enumerated(Type):
 
+    __slots__ = ()
+
     def encode(self, data):
         pass
 
 
 class Bytes(Type):
 
+    __slots__ = ('minimum', 'maximum')
+
     def __init__(self, name, minimum, maximum, has_extension_marker):
         super(Bytes, self).__init__(name)
 
@@ -206,6 +224,8 @@ class Bytes(Type):
 
 class Dict(Type):
 
+    __slots__ = ('members',)
+
     def __init__(self, name, members):
         super(Dict, self).__init__(name)
         self.members = members
@@ -224,6 +244,8 @@ class Dict(Type):
 
 class List(Type):
 
+    __slots__ = ('element_type', 'minimum', 'maximum')
+
     def __init__(self, name, element_type, minimum, maximum, has_extension_marker):
         super(List, self).__init__(name)
         self.element_type = element_type
@@ -252,6 +274,8 @@ class List(Type):
 
 class Choice(Type):
 
+    __slots__ = ('members', 'name_to_member', 'has_extension_marker')
+
     def __init__(self, name, members, has_extension_marker):
         super(Choice, self).__init__(name)
         self.members = members
@@ -283,38 +307,52 @@ class Choice(Type):
 
 class NumericString(String):
 
+    __slots__ = ()
+
     PERMITTED_ALPHABET = NUMERIC_STRING
 
 
 class PrintableString(String):
 
+    __slots__ = ()
+
     PERMITTED_ALPHABET = PRINTABLE_STRING
 
 
 class IA5String(String):
 
+    __slots__ = ()
+
     PERMITTED_ALPHABET = IA5_STRING
 
 
 class VisibleString(String):
 
+    __slots__ = ()
+
     PERMITTED_ALPHABET = VISIBLE_STRING
 
 
 class Time(Type):
 
+    __slots__ = ()
+
     def encode(self, data):
         pass
 
 
 class Skip(Type):
 
+    __slots__ = ()
+
     def encode(self, data):
         pass
 
 
 class Recursive(Type, compiler.Recursive):
 
+    __slots__ = ('type_name', 'module_name', 'inner')
+
     def __init__(self, name, type_name, module_name):
         super(Recursive, self).__init__(name)
         self.type_name = type_name
@@ -345,9 +383,9 @@ class CompiledType(compiler.CompiledType):
 class Compiler(compiler.Compiler):
 
     def process_type(self, type_name, type_descriptor, module_name):
-        compiled_type = self.compile_type(type_name,
-                                          type_descriptor,
-                                          module_name)
+        compiled_type = self.compile_user_type(type_name,
+                                               type_name,
+                                               module_name)
 
         return CompiledType(compiled_type)
 
@@ -461,5 +499,5 @@ class Compiler(compiler.Compiler):
         return ''.join(sorted(value))
 
 
-def compile_dict(specification, numeric_enums=False):
-    return Compiler(specification, numeric_enums).process()
+def compile_dict(specification, numeric_enums=False, lazy=False):
+    return Compiler(specification, numeric_enums).process(lazy)
@@ -14,6 +14,10 @@ from .ber import Encoding
 from .ber import Tag
 from .ber import encode_length_definite
 from .ber import decode_length_definite
+from .ber import validate_length_definite
+from .ber import validate_signed_integer
+from .ber import validate_bit_string
+from .ber import validate_sorted_elements
 from .ber import encode_signed_integer
 from .ber import decode_signed_integer
 from .ber import encode_tag
@@ -35,10 +39,15 @@ from .ber import DateTime
 from .ber import decode_length
 from .ber import encode_real
 from .ber import decode_real
+from .ber import DecodeKind
 
 
 class Type(object):
 
+    __slots__ = ('name', 'type_name', 'optional', 'default', 'tag')
+
+    decode_kind = DecodeKind.LEAF
+
     def __init__(self, name, type_name, number, flags=0):
         self.name = name
         self.type_name = type_name
@@ -71,12 +80,20 @@ class Type(object):
 
         return end_offset
 
+    def validate(self, data, offset, canonical):
+        offset = self.decode_tag(data, offset)
+        length, offset = validate_length_definite(data, offset, canonical)
+
+        return offset + length
+
     def is_default(self, value):
         return value == self.default
 
 
 class StringType(Type):
 
+    __slots__ = ()
+
     TAG = None
     ENCODING = None
 
@@ -105,6 +122,10 @@ class StringType(Type):
 
 class ArrayType(Type):
 
+    __slots__ = ('element_type',)
+
+    decode_kind = DecodeKind.ARRAY
+
     def __init__(self, name, tag_name, tag, element_type):
         super(ArrayType, self).__init__(name,
                                         tag_name,
@@ -138,6 +159,16 @@ class ArrayType(Type):
 
         return decoded, offset
 
+    def validate(self, data, offset, canonical):
+        offset = self.decode_tag(data, offset)
+        length, offset = validate_length_definite(data, offset, canonical)
+        end_offset = offset + length
+
+        while offset < end_offset:
+            offset = self.element_type.validate(data, offset, canonical)
+
+        return offset
+
     def __repr__(self):
         return '{}({}, {})'.format(self.__class__.__name__,
                                    self.name,
@@ -146,6 +177,8 @@ class ArrayType(Type):
 
 class Integer(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(Integer, self).__init__(name,
                                       'INTEGER',
@@ -162,12 +195,23 @@ class Integer(Type):
 
         return decode_signed_integer(data[offset:end_offset]), end_offset
 
+    def validate(self, data, offset, canonical):
+        offset = self.decode_tag(data, offset)
+        length, offset = validate_length_definite(data, offset, canonical)
+
+        if canonical:
+            validate_signed_integer(data, offset, length)
+
+        return offset + length
+
     def __repr__(self):
         return 'Integer({})'.format(self.name)
 
 
 class BitString(Type):
 
+    __slots__ = ('has_named_bits',)
+
     def __init__(self, name, has_named_bits):
         super(BitString, self).__init__(name,
                                         'BIT STRING',
@@ -213,12 +257,23 @@ class BitString(Type):
 
         return (bytes(data[offset:end_offset]), number_of_bits), end_offset
 
+    def validate(self, data, offset, canonical):
+        offset = self.decode_tag(data, offset)
+        length, offset = validate_length_definite(data, offset, canonical)
+
+        if canonical:
+            validate_bit_string(data, offset, length)
+
+        return offset + length
+
     def __repr__(self):
         return 'BitString({})'.format(self.name)
 
 
 class OctetString(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(OctetString, self).__init__(name,
                                           'OCTET STRING',
@@ -242,6 +297,8 @@ class OctetString(Type):
 
 class SequenceOf(ArrayType):
 
+    __slots__ = ()
+
     def __init__(self, name, element_type):
         super(SequenceOf, self).__init__(name,
                                          'SEQUENCE OF',
@@ -251,75 +308,136 @@ class SequenceOf(ArrayType):
 
 class SetOf(ArrayType):
 
+    __slots__ = ()
+
     def __init__(self, name, element_type):
         super(SetOf, self).__init__(name,
                                     'SET OF',
                                     Tag.SET,
                                     element_type)
 
+    def encode(self, data, encoded):
+        # Encode all elements into one buffer and sort their offsets
+        # by the encodings, as required by DER.
+        encoded_elements = bytearray()
+        offsets = []
+
+        for entry in data:
+            start_offset = len(encoded_elements)
+            self.element_type.encode(entry, encoded_elements)
+            offsets.append((start_offset, len(encoded_elements)))
+
+        if len(offsets) > 1:
+            offsets.sort(key=lambda offset: encoded_elements[offset[0]:offset[1]])
+
+            sorted_elements = bytearray()
+
+            for start_offset, end_offset in offsets:
+                sorted_elements += encoded_elements[start_offset:end_offset]
+
+            encoded_elements = sorted_elements
+
+        encoded.extend(self.tag)
+        encoded.extend(encode_length_definite(len(encoded_elements)))
+        encoded.extend(encoded_elements)
+
+    def validate(self, data, offset, canonical):
+        if not canonical:
+            return super(SetOf, self).validate(data, offset, canonical)
+
+        offset = self.decode_tag(data, offset)
+        length, offset = validate_length_definite(data, offset, canonical)
+
+        return validate_sorted_elements(self.element_type,
+                                        data,
+                                        offset,
+                                        offset + length)
+
 
 class UTF8String(StringType):
 
+    __slots__ = ()
+
     TAG = Tag.UTF8_STRING
     ENCODING = 'utf-8'
 
 
 class NumericString(StringType):
 
+    __slots__ = ()
+
     TAG = Tag.NUMERIC_STRING
     ENCODING = 'ascii'
 
 
 class PrintableString(StringType):
 
+    __slots__ = ()
+
     TAG = Tag.PRINTABLE_STRING
     ENCODING = 'ascii'
 
 
 class IA5String(StringType):
 
+    __slots__ = ()
+
     TAG = Tag.IA5_STRING
     ENCODING = 'ascii'
 
 
 class VisibleString(StringType):
 
+    __slots__ = ()
+
     TAG = Tag.VISIBLE_STRING
     ENCODING = 'ascii'
 
 
 class GeneralString(StringType):
 
+    __slots__ = ()
+
     TAG = Tag.GENERAL_STRING
     ENCODING = 'latin-1'
 
 
 class BMPString(StringType):
 
+    __slots__ = ()
+
     TAG = Tag.BMP_STRING
     ENCODING = 'utf-16-be'
 
 
 class UniversalString(StringType):
 
+    __slots__ = ()
+
     TAG = Tag.UNIVERSAL_STRING
     ENCODING = 'utf-32-be'
 
 
 class GraphicString(StringType):
 
+    __slots__ = ()
+
     TAG = Tag.GRAPHIC_STRING
     ENCODING = 'latin-1'
 
 
 class TeletexString(StringType):
 
+    __slots__ = ()
+
     TAG = Tag.T61_STRING
     ENCODING = 'iso-8859-1'
 
 
 class UTCTime(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(UTCTime, self).__init__(name,
                                       'UTCTime',
@@ -345,6 +463,8 @@ class UTCTime(Type):
 
 class GeneralizedTime(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(GeneralizedTime, self).__init__(name,
                                               'GeneralizedTime',
@@ -482,5 +602,5 @@ class Compiler(ber.Compiler):
         return compiled
 
 
-def compile_dict(specification, numeric_enums=False):
-    return Compiler(specification, numeric_enums).process()
+def compile_dict(specification, numeric_enums=False, lazy=False):
+    return Compiler(specification, numeric_enums).process(lazy)
@@ -5,19 +5,102 @@
 import time
 import binascii
 import math
+import re
 from copy import copy
 import datetime
 
+from ..parser import EXTENSION_MARKER
 from . import EncodeError
 from . import DecodeError
 from . import compiler
 from . import format_or
+from . import utc_time_to_datetime
 from . import utc_time_from_datetime
+from . import generalized_time_to_datetime
 from . import generalized_time_from_datetime
 from .compiler import enum_values_as_dict
 
 
+# Splits GSER text into tokens; quoted strings, bit and hex strings,
+# the assignment operator, punctuation and words (identifiers,
+# numbers and object identifiers). Any other non-whitespace character
+# is a token of its own, rejected by the parser.
+TOKEN_RE = re.compile(r"""\s*("(?:[^"]|"")*"|'[^']*'[BH]|::=|[{},:]|[\w.+-]+|\S)""")
+
+
+def unexpected_token(expected, token):
+    if token:
+        token = "'{}'".format(token)
+    else:
+        token = 'end of data'
+
+    return DecodeError('Expected {}, but got {}.'.format(expected, token))
+
+
+def skip_value(tokens, offset):
+    """Returns the offset of the first token after the value starting at
+    given offset, without decoding it. Used to skip unknown extension
+    additions.
+
+    """
+
+    token = tokens[offset]
+
+    if token == '{':
+        depth = 0
+
+        while True:
+            if token == '{':
+                depth += 1
+            elif token == '}':
+                depth -= 1
+
+                if depth == 0:
+                    return offset + 1
+            elif token == '':
+                raise unexpected_token("'}'", token)
+
+            offset += 1
+            token = tokens[offset]
+    elif token in ['', '}', ',', ':', '::=']:
+        raise unexpected_token('a value', token)
+    elif tokens[offset + 1] == ':':
+        return skip_value(tokens, offset + 2)
+    else:
+        return offset + 1
+
+
+def decode_string(tokens, offset):
+    token = tokens[offset]
+
+    if token[:1] != '"' or len(token) < 2:
+        raise unexpected_token('a quoted string', token)
+
+    return token[1:-1].replace('""', '"'), offset + 1
+
+
+def decode_hstring(tokens, offset):
+    token = tokens[offset]
+
+    if token[:1] != "'" or token[-2:] != "'H":
+        raise unexpected_token('a hex string', token)
+
+    try:
+        return binascii.unhexlify(token[1:-2]), offset + 1
+    except (binascii.Error, TypeError):
+        raise unexpected_token('a hex string', token)
+
+
 class Type(object):
+    """Types are encoded by appending strings to the list `encoded`,
+    joined once the whole value is encoded. `separator` is written
+    before the closing bracket of a value in curly brackets, and
+    `indent` is one level of indentation. The separator is a space and
+    the indentation an empty string if not indenting.
+
+    """
+
+    __slots__ = ('name', 'type_name', 'optional', 'default')
 
     def __init__(self, name, type_name):
         self.name = name
@@ -29,32 +112,48 @@ class Type(object):
         pass
 
 
+class StringType(Type):
+
+    __slots__ = ()
+
+    def encode(self, data, encoded, _separator, _indent):
+        encoded.append(u'"{}"'.format(data.replace('"', '""')))
+
+    def decode(self, tokens, offset):
+        return decode_string(tokens, offset)
+
+
 class MembersType(Type):
 
-    def __init__(self, name, members, type_name):
+    __slots__ = ('members', 'name_to_member', 'default_members',
+                 'has_extension_marker')
+
+    def __init__(self, name, members, has_extension_marker, type_name):
         super(MembersType, self).__init__(name, type_name)
         self.members = members
+        self.name_to_member = {member.name: member for member in members}
+        self.default_members = [
+            member for member in members if member.default is not None
+        ]
+        self.has_extension_marker = has_extension_marker
 
-    def encode(self, data, separator, indent):
-        encoded_members = []
-        member_separator = separator + ' ' * indent
+    def encode(self, data, encoded, separator, indent):
+        member_separator = separator + indent
+        delimiter = member_separator
+        encoded.append('{')
 
         for member in self.members:
             name = member.name
 
             if name in data:
+                encoded.append(delimiter + name + ' ')
+                delimiter = ',' + member_separator
+
                 try:
-                    encoded_member = member.encode(data[name],
-                                                   member_separator,
-                                                   indent)
+                    member.encode(data[name], encoded, member_separator, indent)
                 except EncodeError as e:
                     e.location.append(member.name)
                     raise
-
-                encoded_member = u'{}{} {}'.format(member_separator,
-                                                   member.name,
-                                                   encoded_member)
-                encoded_members.append(encoded_member)
             elif member.optional:
                 pass
             elif member.default is None:
@@ -64,9 +163,49 @@ class MembersType(Type):
                         name,
                         data))
 
-        encoded_members = ','.join(encoded_members)
+        encoded.append(separator + '}')
+
+    def decode(self, tokens, offset):
+        if tokens[offset] != '{':
+            raise unexpected_token("'{'", tokens[offset])
 
-        return separator.join(['{' + encoded_members, '}'])
+        offset += 1
+        values = {}
+
+        if tokens[offset] == '}':
+            offset += 1
+        else:
+            while True:
+                name = tokens[offset]
+                member = self.name_to_member.get(name)
+
+                if member is not None:
+                    try:
+                        values[name], offset = member.decode(tokens, offset + 1)
+                    except DecodeError as e:
+                        e.location.append(name)
+                        raise
+                elif self.has_extension_marker and name[:1].isalpha():
+                    offset = skip_value(tokens, offset + 1)
+                else:
+                    raise unexpected_token(
+                        'member {}'.format(
+                            format_or(sorted(self.name_to_member))),
+                        name)
+
+                token = tokens[offset]
+                offset += 1
+
+                if token == '}':
+                    break
+                elif token != ',':
+                    raise unexpected_token("',' or '}'", token)
+
+        for member in self.default_members:
+            if member.name not in values:
+                values[member.name] = member.default
+
+        return values, offset
 
     def __repr__(self):
         return '{}({}, [{}])'.format(
@@ -77,25 +216,47 @@ class MembersType(Type):
 
 class ArrayType(Type):
 
+    __slots__ = ('element_type',)
+
     def __init__(self, name, type_name, element_type):
         super(ArrayType, self).__init__(name, type_name)
         self.element_type = element_type
 
-    def encode(self, data, separator, indent):
-        encoded_elements = []
-        element_separator = separator + ' ' * indent
+    def encode(self, data, encoded, separator, indent):
+        element_separator = separator + indent
+        delimiter = element_separator
+        encode_element = self.element_type.encode
+        encoded.append('{')
 
         for entry in data:
-            encoded_element = self.element_type.encode(entry,
-                                                       element_separator,
-                                                       indent)
-            encoded_element = u'{}{}'.format(element_separator,
-                                             encoded_element)
-            encoded_elements.append(encoded_element)
+            encoded.append(delimiter)
+            delimiter = ',' + element_separator
+            encode_element(entry, encoded, element_separator, indent)
+
+        encoded.append(separator + '}')
 
-        encoded_elements = ','.join(encoded_elements)
+    def decode(self, tokens, offset):
+        if tokens[offset] != '{':
+            raise unexpected_token("'{'", tokens[offset])
 
-        return separator.join(['{' + encoded_elements, '}'])
+        offset += 1
+        values = []
+
+        if tokens[offset] == '}':
+            return values, offset + 1
+
+        decode_element = self.element_type.decode
+
+        while True:
+            value, offset = decode_element(tokens, offset)
+            values.append(value)
+            token = tokens[offset]
+            offset += 1
+
+            if token == '}':
+                return values, offset
+            elif token != ',':
+                raise unexpected_token("',' or '}'", token)
 
     def __repr__(self):
         return '{}({}, {})'.format(self.__class__.__name__,
@@ -105,11 +266,23 @@ class ArrayType(Type):
 
 class Boolean(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(Boolean, self).__init__(name, 'BOOLEAN')
 
-    def encode(self, data, _separator, _indent):
-        return 'TRUE' if data else 'FALSE'
+    def encode(self, data, encoded, _separator, _indent):
+        encoded.append('TRUE' if data else 'FALSE')
+
+    def decode(self, tokens, offset):
+        token = tokens[offset]
+
+        if token == 'TRUE':
+            return True, offset + 1
+        elif token == 'FALSE':
+            return False, offset + 1
+        else:
+            raise unexpected_token("'TRUE' or 'FALSE'", token)
 
     def __repr__(self):
         return 'Boolean({})'.format(self.name)
@@ -117,11 +290,21 @@ class Boolean(Type):
 
 class Integer(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(Integer, self).__init__(name, 'INTEGER')
 
-    def encode(self, data, _separator, _indent):
-        return str(data)
+    def encode(self, data, encoded, _separator, _indent):
+        encoded.append(str(data))
+
+    def decode(self, tokens, offset):
+        token = tokens[offset]
+
+        try:
+            return int(token), offset + 1
+        except ValueError:
+            raise unexpected_token('an integer', token)
 
     def __repr__(self):
         return 'Integer({})'.format(self.name)
@@ -129,10 +312,12 @@ class Integer(Type):
 
 class Real(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(Real, self).__init__(name, 'REAL')
 
-    def encode(self, data, _separator, _indent):
+    def encode(self, data, encoded, _separator, _indent):
         if data == float('inf'):
             data = 'PLUS-INFINITY'
         elif data == float('-inf'):
@@ -144,7 +329,25 @@ class Real(Type):
         else:
             data = '{}E0'.format(data)
 
-        return data
+        encoded.append(data)
+
+    def decode(self, tokens, offset):
+        token = tokens[offset]
+
+        if token == 'PLUS-INFINITY':
+            return float('inf'), offset + 1
+        elif token == 'MINUS-INFINITY':
+            return float('-inf'), offset + 1
+
+        # Numbers in exponent notation, for example 1e-07, are encoded
+        # with an additional exponent, 1e-07E0.
+        if token.endswith('E0') and ('e' in token or 'E' in token[:-2]):
+            token = token[:-2]
+
+        try:
+            return float(token), offset + 1
+        except ValueError:
+            raise unexpected_token('a real number', tokens[offset])
 
     def __repr__(self):
         return 'Real({})'.format(self.name)
@@ -152,11 +355,21 @@ class Real(Type):
 
 class Null(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(Null, self).__init__(name, 'NULL')
 
-    def encode(self, _data, _separator, _indent):
-        return 'NULL'
+    def encode(self, _data, encoded, _separator, _indent):
+        encoded.append('NULL')
+
+    def decode(self, tokens, offset):
+        token = tokens[offset]
+
+        if token != 'NULL':
+            raise unexpected_token("'NULL'", token)
+
+        return None, offset + 1
 
     def __repr__(self):
         return 'Null({})'.format(self.name)
@@ -164,14 +377,50 @@ class Null(Type):
 
 class BitString(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(BitString, self).__init__(name, 'BIT STRING')
 
-    def encode(self, data, _separator, _indent):
-        encoded = int(binascii.hexlify(data[0]), 16)
-        encoded |= (0x80 << (8 * len(data[0])))
+    def encode(self, data, encoded, _separator, _indent):
+        if data[1] == 0:
+            encoded.append("''B")
+        else:
+            value = int(binascii.hexlify(data[0]), 16)
+            value |= (0x80 << (8 * len(data[0])))
+            encoded.append("'{}'B".format(bin(value)[10:10 + data[1]]).upper())
+
+    def decode(self, tokens, offset):
+        token = tokens[offset]
+
+        if token[-2:] == "'H":
+            decoded, offset = decode_hstring(tokens, offset)
+
+            return (decoded, 8 * len(decoded)), offset
+
+        if token[:1] != "'" or token[-2:] != "'B":
+            raise unexpected_token('a bit string', token)
+
+        encoded = token[1:-2]
+        number_of_bits = len(encoded)
+
+        if number_of_bits == 0:
+            return (b'', 0), offset + 1
+
+        try:
+            decoded = int(encoded, 2)
+        except ValueError:
+            raise unexpected_token('a bit string', token)
+
+        decoded |= (0x80 << number_of_bits)
+        rest = (number_of_bits % 8)
+
+        if rest != 0:
+            decoded <<= (8 - rest)
+
+        decoded = binascii.unhexlify(hex(decoded).rstrip('L')[4:])
 
-        return "'{}'B".format(bin(encoded)[10:10 + data[1]]).upper()
+        return (decoded, number_of_bits), offset + 1
 
     def __repr__(self):
         return 'BitString({})'.format(self.name)
@@ -179,11 +428,16 @@ class BitString(Type):
 
 class OctetString(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(OctetString, self).__init__(name, 'OCTET STRING')
 
-    def encode(self, data, _separator, _indent):
-        return "'{}'H".format(binascii.hexlify(data).decode('ascii')).upper()
+    def encode(self, data, encoded, _separator, _indent):
+        encoded.append("'{}'H".format(binascii.hexlify(data).decode('ascii')).upper())
+
+    def decode(self, tokens, offset):
+        return decode_hstring(tokens, offset)
 
     def __repr__(self):
         return 'OctetString({})'.format(self.name)
@@ -191,11 +445,21 @@ class OctetString(Type):
 
 class ObjectIdentifier(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(ObjectIdentifier, self).__init__(name, 'OBJECT IDENTIFIER')
 
-    def encode(self, data, _separator, _indent):
-        return data
+    def encode(self, data, encoded, _separator, _indent):
+        encoded.append(data)
+
+    def decode(self, tokens, offset):
+        token = tokens[offset]
+
+        if not token[:1].isdigit():
+            raise unexpected_token('an object identifier', token)
+
+        return token, offset + 1
 
     def __repr__(self):
         return 'ObjectIdentifier({})'.format(self.name)
@@ -203,6 +467,8 @@ class ObjectIdentifier(Type):
 
 class Enumerated(Type):
 
+    __slots__ = ('value_to_data', 'has_extension_marker', 'data_to_value')
+
     def __init__(self, name, values, numeric):
         super(Enumerated, self).__init__(name, 'ENUMERATED')
 
@@ -213,8 +479,24 @@ class Enumerated(Type):
                 v: v for v in enum_values_as_dict(values).values()
             }
 
-    def encode(self, data, _separator, _indent):
-        return self.data_to_value[data]
+        self.value_to_data = {v: k for k, v in self.data_to_value.items()}
+        self.has_extension_marker = (EXTENSION_MARKER in values)
+
+    def encode(self, data, encoded, _separator, _indent):
+        encoded.append(self.data_to_value[data])
+
+    def decode(self, tokens, offset):
+        value = tokens[offset]
+
+        if value in self.value_to_data:
+            return self.value_to_data[value], offset + 1
+        elif self.has_extension_marker and value[:1].isalpha():
+            return None, offset + 1
+        else:
+            raise unexpected_token(
+                'enumeration value {}'.format(
+                    format_or(sorted(self.value_to_data))),
+                value)
 
     def __repr__(self):
         return 'Enumerated({})'.format(self.name)
@@ -222,12 +504,19 @@ class Enumerated(Type):
 
 class Sequence(MembersType):
 
-    def __init__(self, name, members):
-        super(Sequence, self).__init__(name, members, 'SEQUENCE')
+    __slots__ = ()
+
+    def __init__(self, name, members, has_extension_marker):
+        super(Sequence, self).__init__(name,
+                                       members,
+                                       has_extension_marker,
+                                       'SEQUENCE')
 
 
 class SequenceOf(ArrayType):
 
+    __slots__ = ()
+
     def __init__(self, name, element_type):
         super(SequenceOf, self).__init__(name,
                                          'SEQUENCE OF',
@@ -236,12 +525,19 @@ class SequenceOf(ArrayType):
 
 class Set(MembersType):
 
-    def __init__(self, name, members):
-        super(Set, self).__init__(name, members, 'SET')
+    __slots__ = ()
+
+    def __init__(self, name, members, has_extension_marker):
+        super(Set, self).__init__(name,
+                                  members,
+                                  has_extension_marker,
+                                  'SET')
 
 
 class SetOf(ArrayType):
 
+    __slots__ = ()
+
     def __init__(self, name, element_type):
         super(SetOf, self).__init__(name,
                                     'SET OF',
@@ -250,15 +546,18 @@ class SetOf(ArrayType):
 
 class Choice(Type):
 
-    def __init__(self, name, members):
+    __slots__ = ('members', 'name_to_member', 'has_extension_marker')
+
+    def __init__(self, name, members, has_extension_marker):
         super(Choice, self).__init__(name, 'CHOICE')
         self.members = members
         self.name_to_member = {member.name: member for member in self.members}
+        self.has_extension_marker = has_extension_marker
 
     def format_names(self):
         return format_or(sorted([member.name for member in self.members]))
 
-    def encode(self, data, separator, indent):
+    def encode(self, data, encoded, separator, indent):
         try:
             member = self.name_to_member[data[0]]
         except KeyError:
@@ -267,13 +566,36 @@ class Choice(Type):
                     self.format_names(),
                     data[0]))
 
+        encoded.append(member.name + ' : ')
+
         try:
-            encoded = member.encode(data[1], separator, indent)
+            member.encode(data[1], encoded, separator, indent)
         except EncodeError as e:
             e.location.append(member.name)
             raise
 
-        return u'{} : {}'.format(data[0], encoded)
+    def decode(self, tokens, offset):
+        name = tokens[offset]
+
+        if name in self.name_to_member:
+            member = self.name_to_member[name]
+        elif (self.has_extension_marker
+              and name[:1].isalpha()
+              and tokens[offset + 1] == ':'):
+            return (None, None), skip_value(tokens, offset + 2)
+        else:
+            raise unexpected_token('choice {}'.format(self.format_names()), name)
+
+        if tokens[offset + 1] != ':':
+            raise unexpected_token("':'", tokens[offset + 1])
+
+        try:
+            decoded, offset = member.decode(tokens, offset + 2)
+        except DecodeError as e:
+            e.location.append(member.name)
+            raise
+
+        return (name, decoded), offset
 
     def __repr__(self):
         return 'Choice({}, [{}])'.format(
@@ -281,139 +603,138 @@ class Choice(Type):
             ', '.join([repr(member) for member in self.members]))
 
 
-class UTF8String(Type):
+class UTF8String(StringType):
+
+    __slots__ = ()
 
     def __init__(self, name):
         super(UTF8String, self).__init__(name, 'UTF8String')
 
-    def encode(self, data, _separator, _indent):
-        return u'"{}"'.format(data)
-
     def __repr__(self):
         return 'UTF8String({})'.format(self.name)
 
 
-class NumericString(Type):
+class NumericString(StringType):
+
+    __slots__ = ()
 
     def __init__(self, name):
         super(NumericString, self).__init__(name, 'NumericString')
 
-    def encode(self, data, _separator, _indent):
-        return u'"{}"'.format(data)
-
     def __repr__(self):
         return 'NumericString({})'.format(self.name)
 
 
-class PrintableString(Type):
+class PrintableString(StringType):
+
+    __slots__ = ()
 
     def __init__(self, name):
         super(PrintableString, self).__init__(name, 'PrintableString')
 
-    def encode(self, data, _separator, _indent):
-        return u'"{}"'.format(data)
-
     def __repr__(self):
         return 'PrintableString({})'.format(self.name)
 
 
-class IA5String(Type):
+class IA5String(StringType):
+
+    __slots__ = ()
 
     def __init__(self, name):
         super(IA5String, self).__init__(name, 'IA5String')
 
-    def encode(self, data, _separator, _indent):
-        return u'"{}"'.format(data)
-
     def __repr__(self):
         return 'IA5String({})'.format(self.name)
 
 
-class VisibleString(Type):
+class VisibleString(StringType):
+
+    __slots__ = ()
 
     def __init__(self, name):
         super(VisibleString, self).__init__(name, 'VisibleString')
 
-    def encode(self, data, _separator, _indent):
-        return u'"{}"'.format(data)
-
     def __repr__(self):
         return 'VisibleString({})'.format(self.name)
 
 
-class GeneralString(Type):
+class GeneralString(StringType):
+
+    __slots__ = ()
 
     def __init__(self, name):
         super(GeneralString, self).__init__(name, 'GeneralString')
 
-    def encode(self, data, _separator, _indent):
-        return u'"{}"'.format(data)
-
     def __repr__(self):
         return 'GeneralString({})'.format(self.name)
 
 
-class BMPString(Type):
+class BMPString(StringType):
+
+    __slots__ = ()
 
     def __init__(self, name):
         super(BMPString, self).__init__(name, 'BMPString')
 
-    def encode(self, data, _separator, _indent):
-        return u'"{}"'.format(data)
-
     def __repr__(self):
         return 'BMPString({})'.format(self.name)
 
 
-class GraphicString(Type):
+class GraphicString(StringType):
+
+    __slots__ = ()
 
     def __init__(self, name):
         super(GraphicString, self).__init__(name, 'GraphicString')
 
-    def encode(self, data, _separator, _indent):
-        return u'"{}"'.format(data)
-
     def __repr__(self):
         return 'GraphicString({})'.format(self.name)
 
 
-class UniversalString(Type):
+class UniversalString(StringType):
+
+    __slots__ = ()
 
     def __init__(self, name):
         super(UniversalString, self).__init__(name, 'UniversalString')
 
-    def encode(self, data, _separator, _indent):
-        return u'"{}"'.format(data)
-
     def __repr__(self):
         return 'UniversalString({})'.format(self.name)
 
 
-class TeletexString(Type):
+class TeletexString(StringType):
+
+    __slots__ = ()
 
     def __init__(self, name):
         super(TeletexString, self).__init__(name, 'TeletexString')
 
-    def encode(self, data, _separator, _indent):
-        return u'"{}"'.format(data)
-
     def __repr__(self):
         return 'TeletexString({})'.format(self.name)
 
 
 class ObjectDescriptor(GraphicString):
 
+    __slots__ = ()
+
     def __repr__(self):
         return 'ObjectDescriptor({})'.format(self.name)
 
 
 class UTCTime(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(UTCTime, self).__init__(name, 'UTCTime')
 
-    def encode(self, data, _separator, _indent):
-        return u'"{}"'.format(utc_time_from_datetime(data))
+    def encode(self, data, encoded, _separator, _indent):
+        encoded.append(u'"{}"'.format(utc_time_from_datetime(data)))
+
+    def decode(self, tokens, offset):
+        decoded, offset = decode_string(tokens, offset)
+
+        return utc_time_to_datetime(decoded), offset
 
     def __repr__(self):
         return 'UTCTime({})'.format(self.name)
@@ -421,11 +742,18 @@ class UTCTime(Type):
 
 class GeneralizedTime(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(GeneralizedTime, self).__init__(name, 'GeneralizedTime')
 
-    def encode(self, data, _separator, _indent):
-        return u'"{}"'.format(generalized_time_from_datetime(data))
+    def encode(self, data, encoded, _separator, _indent):
+        encoded.append(u'"{}"'.format(generalized_time_from_datetime(data)))
+
+    def decode(self, tokens, offset):
+        decoded, offset = decode_string(tokens, offset)
+
+        return generalized_time_to_datetime(decoded), offset
 
     def __repr__(self):
         return 'GeneralizedTime({})'.format(self.name)
@@ -433,40 +761,67 @@ class GeneralizedTime(Type):
 
 class Date(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(Date, self).__init__(name, 'DATE')
 
-    def encode(self, data, _separator, _indent):
-        return u'"{}"'.format(str(data))
+    def encode(self, data, encoded, _separator, _indent):
+        encoded.append(u'"{}"'.format(str(data)))
+
+    def decode(self, tokens, offset):
+        decoded, offset = decode_string(tokens, offset)
+
+        return datetime.date(*time.strptime(decoded, '%Y-%m-%d')[:3]), offset
 
 
 class TimeOfDay(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(TimeOfDay, self).__init__(name, 'TIME-OF-DAY')
 
-    def encode(self, data, _separator, _indent):
-        return u'"{}"'.format(str(data))
+    def encode(self, data, encoded, _separator, _indent):
+        encoded.append(u'"{}"'.format(str(data)))
+
+    def decode(self, tokens, offset):
+        decoded, offset = decode_string(tokens, offset)
+
+        return datetime.time(*time.strptime(decoded, '%H:%M:%S')[3:6]), offset
 
 
 class DateTime(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(DateTime, self).__init__(name, 'DATE-TIME')
 
-    def encode(self, data, _separator, _indent):
-        return u'"{}"'.format(str(data).replace(' ', 'T'))
+    def encode(self, data, encoded, _separator, _indent):
+        encoded.append(u'"{}"'.format(str(data).replace(' ', 'T')))
+
+    def decode(self, tokens, offset):
+        decoded, offset = decode_string(tokens, offset)
+        decoded = datetime.datetime(
+            *time.strptime(decoded, '%Y-%m-%dT%H:%M:%S')[:6])
+
+        return decoded, offset
 
 
 class Any(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(Any, self).__init__(name, 'ANY')
 
-    def encode(self, data, _separator, _indent):
+    def encode(self, data, encoded, _separator, _indent):
         data = binascii.hexlify(data).decode('ascii').upper()
+        encoded.append("'{}'H".format(data))
 
-        return "'{}'H".format(data)
+    def decode(self, tokens, offset):
+        return decode_hstring(tokens, offset)
 
     def __repr__(self):
         return 'Any({})'.format(self.name)
@@ -474,6 +829,8 @@ class Any(Type):
 
 class Recursive(Type, compiler.Recursive):
 
+    __slots__ = ('module_name', 'inner')
+
     def __init__(self, name, type_name, module_name):
         super(Recursive, self).__init__(name, 'RECURSIVE')
         self.type_name = type_name
@@ -483,8 +840,11 @@ class Recursive(Type, compiler.Recursive):
     def set_inner_type(self, inner):
         self.inner = copy(inner)
 
-    def encode(self, data, separator, indent):
-        return self.inner.encode(data, separator, indent)
+    def encode(self, data, encoded, separator, indent):
+        self.inner.encode(data, encoded, separator, indent)
+
+    def decode(self, tokens, offset):
+        return self.inner.decode(tokens, offset)
 
     def __repr__(self):
         return 'Recursive({})'.format(self.type_name)
@@ -494,8 +854,8 @@ class CompiledType(compiler.CompiledType):
 
     def __init__(self, type_name, compiled_type):
         super(CompiledType, self).__init__()
-        self._value_name = type_name.lower()
-        self._value_type = type_name
+        self._value_assignment = u'{} {} ::= '.format(type_name.lower(),
+                                                      type_name)
         self._type = compiled_type
 
     @property
@@ -503,19 +863,32 @@ class CompiledType(compiler.CompiledType):
         return self._type
 
     def encode(self, data, indent=None):
+        encoded = [self._value_assignment]
+
         if indent is None:
-            encoded = self._type.encode(data, ' ', 0)
+            self._type.encode(data, encoded, ' ', '')
         else:
-            encoded = self._type.encode(data, '\n', indent)
+            self._type.encode(data, encoded, '\n', indent * ' ')
 
-        encoded = u'{} {} ::= {}'.format(self._value_name,
-                                         self._value_type,
-                                         encoded.lstrip(' '))
-
-        return encoded.encode('utf-8')
+        return ''.join(encoded).encode('utf-8')
 
     def decode(self, data):
-        raise NotImplementedError('GSER decoding is not implemented.')
+        tokens = TOKEN_RE.findall(data.decode('utf-8'))
+        # An empty string marks the end of data.
+        tokens.append('')
+
+        # Skip the value assignment, if present.
+        if tokens[2:3] == ['::=']:
+            offset = 3
+        else:
+            offset = 0
+
+        decoded, offset = self._type.decode(tokens, offset)
+
+        if tokens[offset] != '':
+            raise unexpected_token('end of data', tokens[offset])
+
+        return decoded
 
     def __repr__(self):
         return repr(self._type)
@@ -524,9 +897,9 @@ class CompiledType(compiler.CompiledType):
 class Compiler(compiler.Compiler):
 
     def process_type(self, type_name, type_descriptor, module_name):
-        compiled_type = self.compile_type(type_name,
-                                          type_descriptor,
-                                          module_name)
+        compiled_type = self.compile_user_type(type_name,
+                                               type_name,
+                                               module_name)
 
         return CompiledType(type_name, compiled_type)
 
@@ -534,30 +907,30 @@ class Compiler(compiler.Compiler):
         type_name = type_descriptor['type']
 
         if type_name == 'SEQUENCE':
-            members, _ = self.compile_members(
-                type_descriptor['members'],
-                module_name)
-            compiled = Sequence(name, members)
+            compiled = Sequence(name,
+                                *self.compile_members(
+                                    type_descriptor['members'],
+                                    module_name))
         elif type_name == 'SEQUENCE OF':
             compiled = SequenceOf(name,
                                   self.compile_type('',
                                                     type_descriptor['element'],
                                                     module_name))
         elif type_name == 'SET':
-            members, _ = self.compile_members(
-                type_descriptor['members'],
-                module_name)
-            compiled = Set(name, members)
+            compiled = Set(name,
+                           *self.compile_members(
+                               type_descriptor['members'],
+                               module_name))
         elif type_name == 'SET OF':
             compiled = SetOf(name,
                              self.compile_type('',
                                                type_descriptor['element'],
                                                module_name))
         elif type_name == 'CHOICE':
-            members, _ = self.compile_members(
-                type_descriptor['members'],
-                module_name)
-            compiled = Choice(name, members)
+            compiled = Choice(name,
+                              *self.compile_members(
+                                  type_descriptor['members'],
+                                  module_name))
         elif type_name == 'INTEGER':
             compiled = Integer(name)
         elif type_name == 'REAL':
@@ -611,10 +984,10 @@ class Compiler(compiler.Compiler):
         elif type_name == 'NULL':
             compiled = Null(name)
         elif type_name == 'EXTERNAL':
-            members, _ = self.compile_members(
-                self.external_type_descriptor()['members'],
-                module_name)
-            compiled = Sequence(name, members)
+            compiled = Sequence(name,
+                                *self.compile_members(
+                                    self.external_type_descriptor()['members'],
+                                    module_name))
         elif type_name == 'ObjectDescriptor':
             compiled = ObjectDescriptor(name)
         else:
@@ -631,8 +1004,8 @@ class Compiler(compiler.Compiler):
         return compiled
 
 
-def compile_dict(specification, numeric_enums=False):
-    return Compiler(specification, numeric_enums).process()
+def compile_dict(specification, numeric_enums=False, lazy=False):
+    return Compiler(specification, numeric_enums).process(lazy)
 
 
 def decode_length(_data):
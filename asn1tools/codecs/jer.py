@@ -4,13 +4,19 @@
 
 import time
 import json
+from json.encoder import encode_basestring_ascii
 import binascii
 import math
 import datetime
+import re
+import codecs
+from types import ModuleType
+from importlib import import_module
 
 from ..parser import EXTENSION_MARKER
 from . import EncodeError
 from . import DecodeError
+from . import DecodeLimitError
 from . import compiler
 from . import format_or
 from . import utc_time_to_datetime
@@ -20,7 +26,179 @@ from . import generalized_time_from_datetime
 from .compiler import enum_values_as_dict
 
 
+ITER_DECODE_READ_SIZE = 65536
+
+NON_WHITESPACE_RE = re.compile(r'[^ \t\n\r]')
+
+# A string, number or literal that may continue in data not yet read.
+INCOMPLETE_VALUE_RE = re.compile(r'(?:"(?:[^"\\]|\\.)*\\?|[-+.0-9A-Za-z]*)\Z')
+
+# Used to check decoding limits before the JSON text is parsed.
+STRING_RE = re.compile(r'("[^"\\]*(?:\\.[^"\\]*)*")')
+EMPTY_CONTAINER_RE = re.compile(r'{[ \t\n\r]*}|\[[ \t\n\r]*\]')
+BRACKET_RE = re.compile(r'[][{}]')
+BRACKET_TO_DEPTH_CHANGE = {'[': 1, '{': 1, ']': -1, '}': -1}
+
+
+def dumps(value, indent, json_backend):
+    """Returns given value as JSON encoded bytes using given JSON backend.
+    The standard library json module writes compact JSON if not
+    indenting, just as without a backend, while other backends are
+    called with default arguments.
+
+    """
+
+    if indent is not None:
+        string = json_backend.dumps(value, indent=indent)
+    elif json_backend is json:
+        string = json.dumps(value, separators=(',', ':'))
+    else:
+        string = json_backend.dumps(value)
+
+    if not isinstance(string, bytes):
+        string = string.encode('utf-8')
+
+    return string
+
+
+def dumps_value(value):
+    """Returns given JSON compatible value as JSON text, as written by
+    json.dumps().
+
+    """
+
+    value_type = type(value)
+
+    if value_type is str:
+        return encode_basestring_ascii(value)
+    elif value_type is int:
+        return int.__repr__(value)
+    elif value is None:
+        return 'null'
+    elif value is True:
+        return 'true'
+    elif value is False:
+        return 'false'
+    elif value_type is float and not (math.isinf(value) or math.isnan(value)):
+        return float.__repr__(value)
+    else:
+        return json.dumps(value)
+
+
+def encode_text(type_, data, indent):
+    """Returns given data encoded as given type as JSON text, in one pass
+    over the data. The text is identical to what json.dumps() writes
+    for the value returned by the encode() method of given type, with
+    compact separators if not indenting.
+
+    """
+
+    encoded = []
+
+    if indent is None:
+        type_.encode_text(data, encoded, '', '')
+    else:
+        if not isinstance(indent, str):
+            indent *= ' '
+
+        type_.encode_text(data, encoded, '\n', indent)
+
+    return ''.join(encoded)
+
+
+def check_limits(string,
+                 maximum_depth,
+                 maximum_number_of_elements,
+                 maximum_string_length):
+    """Raises a DecodeLimitError if given JSON text exceeds any of given
+    limits. Only the text is searched, without creating any values.
+    The elements are the JSON values; objects, arrays, strings (but
+    not object keys), numbers, booleans and nulls.
+
+    """
+
+    if maximum_depth is None:
+        maximum_depth = float('inf')
+
+    if maximum_number_of_elements is None:
+        maximum_number_of_elements = float('inf')
+
+    if maximum_string_length is None:
+        maximum_string_length = float('inf')
+
+    # Upper bounds of the nesting depth, the number of elements and
+    # the string lengths, as brackets and commas in strings are
+    # counted as well. Strings are only searched if a bound exceeds
+    # its limit.
+    number_of_containers = string.count('{') + string.count('[')
+    number_of_elements = 1 + string.count(',') + number_of_containers
+    check_string_lengths = (len(string) - 2 > maximum_string_length)
+
+    if (number_of_containers <= maximum_depth
+        and number_of_elements <= maximum_number_of_elements
+        and not check_string_lengths):
+        return
+
+    # Strings at odd indexes.
+    parts = STRING_RE.split(string)
+    strings = parts[1::2]
+    string = '""'.join(parts[0::2])
+
+    # Values in arrays and objects are separated by commas.
+    number_of_containers = string.count('{') + string.count('[')
+    number_of_elements = (1
+                          + string.count(',')
+                          + number_of_containers
+                          - len(EMPTY_CONTAINER_RE.findall(string)))
+
+    if number_of_elements > maximum_number_of_elements:
+        raise DecodeLimitError(
+            'Expected at most {} elements, but got {}.'.format(
+                maximum_number_of_elements,
+                number_of_elements))
+
+    if number_of_containers > maximum_depth:
+        depth = 0
+
+        for bracket in BRACKET_RE.findall(string):
+            depth += BRACKET_TO_DEPTH_CHANGE[bracket]
+
+            if depth > maximum_depth:
+                raise DecodeLimitError(
+                    'Expected at most {} nesting levels.'.format(maximum_depth))
+
+    if not check_string_lengths:
+        return
+
+    # Strings are at least as long as their escaped characters.
+    for value in strings:
+        if len(value) - 2 > maximum_string_length:
+            length = len(json.loads(value))
+
+            if length > maximum_string_length:
+                raise DecodeLimitError(
+                    'Expected at most {} characters in a string, but '
+                    'got {}.'.format(maximum_string_length, length))
+
+
+def loads(data, json_backend=None):
+    if json_backend is None:
+        return json.loads(data.decode('utf-8'))
+    else:
+        return json_backend.loads(data)
+
+
 class Type(object):
+    """Types are encoded to JSON text by appending strings to the list
+    `encoded`. `newline` is the newline and indentation of the line
+    with the closing bracket of the encoded object or array, and
+    `indent` is one level of indentation. Both are empty strings if
+    not indenting.
+
+    """
+
+    __slots__ = ('name', 'type_name', 'optional', 'default',
+                 'decode_is_identity')
 
     def __init__(self, name, type_name):
         self.name = name
@@ -28,12 +206,25 @@ class Type(object):
         self.optional = False
         self.default = None
 
+        # Decoded values of types not overriding decode() are the
+        # values returned by the JSON decoder, and are not decoded
+        # again.
+        self.decode_is_identity = (type(self).decode == Type.decode)
+
     def set_size_range(self, minimum, maximum, has_extension_marker):
         pass
 
+    def encode_text(self, data, encoded, newline, indent):
+        encoded.append(dumps_value(self.encode(data)))
+
+    def decode(self, data):
+        return data
+
 
 class StringType(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(StringType, self).__init__(name,
                                          self.__class__.__name__)
@@ -41,9 +232,6 @@ class StringType(Type):
     def encode(self, data):
         return data
 
-    def decode(self, data):
-        return data
-
     def __repr__(self):
         return '{}({})'.format(self.__class__.__name__,
                                self.name)
@@ -51,12 +239,16 @@ class StringType(Type):
 
 class MembersType(Type):
 
+    __slots__ = ('members', 'member_keys')
+
     def __init__(self,
                  name,
                  members,
                  type_name):
         super(MembersType, self).__init__(name, type_name)
         self.members = members
+        self.member_keys = [encode_basestring_ascii(member.name)
+                            for member in members]
 
     def encode(self, data):
         values = {}
@@ -83,6 +275,43 @@ class MembersType(Type):
 
         return values
 
+    def encode_text(self, data, encoded, newline, indent):
+        member_newline = newline + indent
+        separator = member_newline
+
+        if newline:
+            key_separator = ': '
+        else:
+            key_separator = ':'
+
+        encoded.append('{')
+
+        for member, key in zip(self.members, self.member_keys):
+            name = member.name
+
+            if name in data:
+                encoded.append(separator + key + key_separator)
+                separator = ',' + member_newline
+
+                try:
+                    member.encode_text(data[name], encoded, member_newline, indent)
+                except EncodeError as e:
+                    e.location.append(member.name)
+                    raise
+            elif member.optional or member.default is not None:
+                continue
+            else:
+                raise EncodeError(
+                    "{} member '{}' not found in {}.".format(
+                        self.__class__.__name__,
+                        name,
+                        data))
+
+        if separator is member_newline:
+            encoded.append('}')
+        else:
+            encoded.append(newline + '}')
+
     def decode(self, data):
         values = {}
 
@@ -90,8 +319,10 @@ class MembersType(Type):
             name = member.name
 
             if name in data:
-                value = member.decode(data[name])
-                values[name] = value
+                if member.decode_is_identity:
+                    values[name] = data[name]
+                else:
+                    values[name] = member.decode(data[name])
             elif member.optional:
                 pass
             elif member.default is not None:
@@ -106,38 +337,88 @@ class MembersType(Type):
             ', '.join([repr(member) for member in self.members]))
 
 
+class ArrayType(Type):
+
+    __slots__ = ('element_type',)
+
+    def __init__(self, name, element_type, type_name):
+        super(ArrayType, self).__init__(name, type_name)
+        self.element_type = element_type
+
+    def encode(self, data):
+        values = []
+
+        for entry in data:
+            value = self.element_type.encode(entry)
+            values.append(value)
+
+        return values
+
+    def encode_text(self, data, encoded, newline, indent):
+        element_newline = newline + indent
+        separator = element_newline
+        encoded.append('[')
+
+        for entry in data:
+            encoded.append(separator)
+            separator = ',' + element_newline
+            self.element_type.encode_text(entry, encoded, element_newline, indent)
+
+        if separator is element_newline:
+            encoded.append(']')
+        else:
+            encoded.append(newline + ']')
+
+    def decode(self, data):
+        if self.element_type.decode_is_identity:
+            return list(data)
+
+        values = []
+
+        for element_data in data:
+            value = self.element_type.decode(element_data)
+            values.append(value)
+
+        return values
+
+    def __repr__(self):
+        return '{}({}, {})'.format(self.__class__.__name__,
+                                   self.name,
+                                   self.element_type)
+
+
 class Boolean(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(Boolean, self).__init__(name, 'BOOLEAN')
 
     def encode(self, data):
         return data
 
-    def decode(self, data):
-        return data
-
     def __repr__(self):
         return 'Boolean({})'.format(self.name)
 
 
 class Integer(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(Integer, self).__init__(name, 'INTEGER')
 
     def encode(self, data):
         return data
 
-    def decode(self, data):
-        return data
-
     def __repr__(self):
         return 'Integer({})'.format(self.name)
 
 
 class Real(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(Real, self).__init__(name, 'REAL')
 
@@ -169,21 +450,22 @@ class Real(Type):
 
 class Null(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(Null, self).__init__(name, 'NULL')
 
     def encode(self, data):
         return data
 
-    def decode(self, data):
-        return data
-
     def __repr__(self):
         return 'Null({})'.format(self.name)
 
 
 class BitString(Type):
 
+    __slots__ = ('size',)
+
     def __init__(self, name, minimum, maximum):
         super(BitString, self).__init__(name, 'BIT STRING')
 
@@ -205,6 +487,29 @@ class BitString(Type):
 
         return value
 
+    def encode_text(self, data, encoded, newline, indent):
+        value = binascii.hexlify(data[0]).decode('ascii').upper()
+
+        if self.size is None:
+            member_newline = newline + indent
+
+            if newline:
+                key_separator = ': '
+            else:
+                key_separator = ':'
+
+            encoded.append('{}{}"value"{}"{}",{}"length"{}{}{}}}'.format(
+                '{',
+                member_newline,
+                key_separator,
+                value,
+                member_newline,
+                key_separator,
+                dumps_value(data[1]),
+                newline))
+        else:
+            encoded.append('"' + value + '"')
+
     def decode(self, data):
         if self.size is None:
             return (binascii.unhexlify(data['value']), data['length'])
@@ -217,12 +522,17 @@ class BitString(Type):
 
 class OctetString(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(OctetString, self).__init__(name, 'OCTET STRING')
 
     def encode(self, data):
         return binascii.hexlify(data).decode('ascii').upper()
 
+    def encode_text(self, data, encoded, newline, indent):
+        encoded.append('"' + binascii.hexlify(data).decode('ascii').upper() + '"')
+
     def decode(self, data):
         return binascii.unhexlify(data)
 
@@ -232,6 +542,8 @@ class OctetString(Type):
 
 class ObjectIdentifier(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(ObjectIdentifier, self).__init__(name, 'OBJECT IDENTIFIER')
 
@@ -247,6 +559,8 @@ class ObjectIdentifier(Type):
 
 class Enumerated(Type):
 
+    __slots__ = ('has_extension_marker', 'values')
+
     def __init__(self, name, values, numeric):
         super(Enumerated, self).__init__(name, 'ENUMERATED')
 
@@ -290,76 +604,40 @@ class Enumerated(Type):
 
 class Sequence(MembersType):
 
+    __slots__ = ()
+
     def __init__(self, name, members):
         super(Sequence, self).__init__(name, members, 'SEQUENCE')
 
 
-class SequenceOf(Type):
-
-    def __init__(self, name, element_type):
-        super(SequenceOf, self).__init__(name, 'SEQUENCE OF')
-        self.element_type = element_type
-
-    def encode(self, data):
-        values = []
+class SequenceOf(ArrayType):
 
-        for entry in data:
-            value = self.element_type.encode(entry)
-            values.append(value)
-
-        return values
-
-    def decode(self, data):
-        values = []
+    __slots__ = ()
 
-        for element_data in data:
-            value = self.element_type.decode(element_data)
-            values.append(value)
-
-        return values
-
-    def __repr__(self):
-        return 'SequenceOf({}, {})'.format(self.name,
-                                           self.element_type)
+    def __init__(self, name, element_type):
+        super(SequenceOf, self).__init__(name, element_type, 'SEQUENCE OF')
 
 
 class Set(MembersType):
 
+    __slots__ = ()
+
     def __init__(self, name, members):
         super(Set, self).__init__(name, members, 'SET')
 
 
-class SetOf(Type):
-
-    def __init__(self, name, element_type):
-        super(SetOf, self).__init__(name, 'SET OF')
-        self.element_type = element_type
+class SetOf(ArrayType):
 
-    def encode(self, data):
-        values = []
+    __slots__ = ()
 
-        for entry in data:
-            value = self.element_type.encode(entry)
-            values.append(value)
-
-        return values
-
-    def decode(self, data):
-        values = []
-
-        for element_data in data:
-            value = self.element_type.decode(element_data)
-            values.append(value)
-
-        return values
-
-    def __repr__(self):
-        return 'SetOf({}, {})'.format(self.name,
-                                      self.element_type)
+    def __init__(self, name, element_type):
+        super(SetOf, self).__init__(name, element_type, 'SET OF')
 
 
 class Choice(Type):
 
+    __slots__ = ('members', 'name_to_member', 'has_extension_marker')
+
     def __init__(self, name, members, has_extension_marker):
         super(Choice, self).__init__(name, 'CHOICE')
         self.members = members
@@ -384,6 +662,35 @@ class Choice(Type):
             e.location.append(member.name)
             raise
 
+    def encode_text(self, data, encoded, newline, indent):
+        try:
+            member = self.name_to_member[data[0]]
+        except KeyError:
+            raise EncodeError(
+                "Expected choice {}, but got '{}'.".format(
+                    self.format_names(),
+                    data[0]))
+
+        member_newline = newline + indent
+
+        if newline:
+            key_separator = ': '
+        else:
+            key_separator = ':'
+
+        encoded.append('{'
+                       + member_newline
+                       + encode_basestring_ascii(member.name)
+                       + key_separator)
+
+        try:
+            member.encode_text(data[1], encoded, member_newline, indent)
+        except EncodeError as e:
+            e.location.append(member.name)
+            raise
+
+        encoded.append(newline + '}')
+
     def decode(self, data):
         name, value = list(data.items())[0]
 
@@ -406,51 +713,53 @@ class Choice(Type):
 
 
 class UTF8String(StringType):
-    pass
+    __slots__ = ()
 
 
 class NumericString(StringType):
-    pass
+    __slots__ = ()
 
 
 class PrintableString(StringType):
-    pass
+    __slots__ = ()
 
 
 class IA5String(StringType):
-    pass
+    __slots__ = ()
 
 
 class VisibleString(StringType):
-    pass
+    __slots__ = ()
 
 
 class GeneralString(StringType):
-    pass
+    __slots__ = ()
 
 
 class BMPString(StringType):
-    pass
+    __slots__ = ()
 
 
 class GraphicString(StringType):
-    pass
+    __slots__ = ()
 
 
 class UniversalString(StringType):
-    pass
+    __slots__ = ()
 
 
 class TeletexString(StringType):
-    pass
+    __slots__ = ()
 
 
 class ObjectDescriptor(GraphicString):
-    pass
+    __slots__ = ()
 
 
 class UTCTime(StringType):
 
+    __slots__ = ()
+
     def encode(self, data):
         return utc_time_from_datetime(data)
 
@@ -460,6 +769,8 @@ class UTCTime(StringType):
 
 class GeneralizedTime(StringType):
 
+    __slots__ = ()
+
     def encode(self, data):
         return generalized_time_from_datetime(data)
 
@@ -469,6 +780,8 @@ class GeneralizedTime(StringType):
 
 class Date(StringType):
 
+    __slots__ = ()
+
     def encode(self, data):
         return str(data)
 
@@ -478,6 +791,8 @@ class Date(StringType):
 
 class TimeOfDay(StringType):
 
+    __slots__ = ()
+
     def encode(self, data):
         return str(data)
 
@@ -487,6 +802,8 @@ class TimeOfDay(StringType):
 
 class DateTime(StringType):
 
+    __slots__ = ()
+
     def encode(self, data):
         return str(data).replace(' ', 'T')
 
@@ -496,6 +813,8 @@ class DateTime(StringType):
 
 class Any(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(Any, self).__init__(name, 'ANY')
 
@@ -511,6 +830,8 @@ class Any(Type):
 
 class Recursive(Type, compiler.Recursive):
 
+    __slots__ = ('module_name', '_inner')
+
     def __init__(self, name, type_name, module_name):
         super(Recursive, self).__init__(name, 'RECURSIVE')
         self.type_name = type_name
@@ -523,6 +844,9 @@ class Recursive(Type, compiler.Recursive):
     def encode(self, data):
         return self._inner.encode(data)
 
+    def encode_text(self, data, encoded, newline, indent):
+        self._inner.encode_text(data, encoded, newline, indent)
+
     def decode(self, data):
         return self._inner.decode(data)
 
@@ -532,39 +856,233 @@ class Recursive(Type, compiler.Recursive):
 
 class CompiledType(compiler.CompiledType):
 
-    def __init__(self, type_):
+    def __init__(self, type_, json_backend=None):
         super(CompiledType, self).__init__()
         self._type = type_
+        self._json_backend = json_backend
 
     @property
     def type(self):
         return self._type
 
     def encode(self, data, indent=None):
-        dictionary = self._type.encode(data)
+        return self.encode_type(self._type, data, indent)
+
+    def decode(self, data):
+        return self._type.decode(loads(data, self._json_backend))
+
+    def decode_with_limits(self,
+                           data,
+                           maximum_depth,
+                           maximum_number_of_elements,
+                           maximum_string_length):
+        check_limits(data.decode('utf-8'),
+                     maximum_depth,
+                     maximum_number_of_elements,
+                     maximum_string_length)
+
+        return self.decode(data)
+
+    def encode_jer_stream(self, iterable, fileobj, indent=None):
+        if not isinstance(self._type, ArrayType):
+            raise EncodeError(
+                'Expected a SEQUENCE OF or SET OF type, but got {}.'.format(
+                    self._type.type_name))
 
+        # Written as json.dumps() would write the whole list.
         if indent is None:
-            string = json.dumps(dictionary, separators=(',', ':'))
+            separator = b''
         else:
-            string = json.dumps(dictionary, indent=indent)
+            if isinstance(indent, str):
+                separator = indent
+            else:
+                separator = indent * ' '
 
-        return string.encode('utf-8')
+            separator = ('\n' + separator).encode('ascii')
 
-    def decode(self, data):
-        return self._type.decode(json.loads(data.decode('utf-8')))
+        element_type = self._type.element_type
+        fileobj.write(b'[')
+        empty = True
+
+        for entry in iterable:
+            string = self.encode_type(element_type, entry, indent)
+
+            if not empty:
+                fileobj.write(b',')
+
+            if separator:
+                string = separator + string.replace(b'\n', separator)
+
+            fileobj.write(string)
+            empty = False
+
+        if separator and not empty:
+            fileobj.write(b'\n')
+
+        fileobj.write(b']')
+
+    def iter_decode_jer(self, fileobj):
+        if not isinstance(self._type, ArrayType):
+            raise DecodeError(
+                'Expected a SEQUENCE OF or SET OF type, but got {}.'.format(
+                    self._type.type_name))
+
+        element_type = self._type.element_type
+
+        for value in ArrayReader(fileobj):
+            yield element_type.decode(value)
+
+    def encode_type(self, type_, data, indent):
+        if self._json_backend is not None:
+            return dumps(type_.encode(data), indent, self._json_backend)
+        else:
+            # Non-ASCII characters are escaped, just as json.dumps() does.
+            return encode_text(type_, data, indent).encode('ascii')
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+
+        # Modules can not be pickled, but imported by name.
+        if isinstance(self._json_backend, ModuleType):
+            state['_json_backend'] = self._json_backend.__name__
+
+        return state
+
+    def __setstate__(self, state):
+        json_backend = state['_json_backend']
+
+        if isinstance(json_backend, str):
+            state['_json_backend'] = import_module(json_backend)
+
+        self.__dict__.update(state)
 
     def __repr__(self):
         return repr(self._type)
 
 
+class ArrayReader(object):
+    """Iterate over the values in a JSON array read in chunks from given
+    binary file object `fileobj`. Only unread data and the value
+    being decoded are kept in memory.
+
+    """
+
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self._utf8_decoder = codecs.getincrementaldecoder('utf-8')()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = u''
+        self._offset = 0
+        self._eof = False
+
+    def __iter__(self):
+        self.read_character('[', "'['")
+
+        if self.peek_character() == ']':
+            self._offset += 1
+        else:
+            while True:
+                yield self.read_value()
+
+                if self.read_character(',]', "',' or ']'") == ']':
+                    break
+
+        character = self.peek_character()
+
+        if character:
+            raise DecodeError(
+                "Expected end of data, but got '{}'.".format(character))
+
+    def read(self, size):
+        """Append at most `size` bytes read from the file object to the
+        buffer, and drop already decoded characters from it.
+
+        """
+
+        if self._eof:
+            return
+
+        data = self._fileobj.read(size)
+
+        if not data:
+            self._eof = True
+
+        self._buffer = (self._buffer[self._offset:]
+                        + self._utf8_decoder.decode(data, self._eof))
+        self._offset = 0
+
+    def peek_character(self):
+        """Returns the next non-whitespace character, or an empty string
+        at end of data.
+
+        """
+
+        while True:
+            mo = NON_WHITESPACE_RE.search(self._buffer, self._offset)
+
+            if mo:
+                self._offset = mo.start()
+
+                return self._buffer[self._offset]
+
+            self._offset = len(self._buffer)
+
+            if self._eof:
+                return ''
+
+            self.read(ITER_DECODE_READ_SIZE)
+
+    def read_character(self, characters, expected):
+        character = self.peek_character()
+
+        if not character or character not in characters:
+            raise DecodeError(
+                "Expected {}, but got '{}'.".format(expected, character))
+
+        self._offset += 1
+
+        return character
+
+    def read_value(self):
+        self.peek_character()
+        size = ITER_DECODE_READ_SIZE
+
+        # Read more data until the value is complete. A value ending at
+        # the end of the buffer may continue, for example a number, while
+        # an error before the end of it is not fixed by more data.
+        while True:
+            try:
+                value, offset = self._json_decoder.raw_decode(self._buffer,
+                                                              self._offset)
+            except ValueError as e:
+                offset = getattr(e, 'pos', len(self._buffer))
+
+                if self._eof or not INCOMPLETE_VALUE_RE.match(self._buffer, offset):
+                    raise DecodeError(
+                        "Expected a value, but got '{}'.".format(
+                            self._buffer[offset:offset + 1]))
+            else:
+                if self._eof or not INCOMPLETE_VALUE_RE.match(self._buffer, offset):
+                    self._offset = offset
+
+                    return value
+
+            self.read(size)
+            size *= 2
+
+
 class Compiler(compiler.Compiler):
 
+    def __init__(self, specification, numeric_enums=False, json_backend=None):
+        super(Compiler, self).__init__(specification, numeric_enums)
+        self._json_backend = json_backend
+
     def process_type(self, type_name, type_descriptor, module_name):
-        compiled_type = self.compile_type(type_name,
-                                          type_descriptor,
-                                          module_name)
+        compiled_type = self.compile_user_type(type_name,
+                                               type_name,
+                                               module_name)
 
-        return CompiledType(compiled_type)
+        return CompiledType(compiled_type, self._json_backend)
 
     def compile_type(self, name, type_descriptor, module_name):
         type_name = type_descriptor['type']
@@ -669,8 +1187,11 @@ class Compiler(compiler.Compiler):
         return compiled
 
 
-def compile_dict(specification, numeric_enums=False):
-    return Compiler(specification, numeric_enums).process()
+def compile_dict(specification,
+                 numeric_enums=False,
+                 json_backend=None,
+                 lazy=False):
+    return Compiler(specification, numeric_enums, json_backend).process(lazy)
 
 
 def decode_length(_data):
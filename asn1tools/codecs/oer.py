@@ -26,6 +26,9 @@ from .ber import decode_object_identifier
 from . import der
 
 
+ITER_DECODE_WINDOW_SIZE = 256
+
+
 def encode_tag(number, flags):
     if number < 63:
         tag = bytearray([flags | number])
@@ -281,6 +284,8 @@ class Decoder(object):
 
 class Type(object):
 
+    __slots__ = ('name', 'type_name', 'optional', 'default', 'tag')
+
     def __init__(self, name, type_name, number, flags=0):
         self.name = name
         self.type_name = type_name
@@ -308,9 +313,20 @@ class Type(object):
     def is_default(self, value):
         return value == self.default
 
+    def skip(self, decoder):
+        """Skip the encoding of this type. Types with cheaper ways to find
+        the end of their encoding than decoding it override this
+        method.
+
+        """
+
+        self.decode(decoder)
+
 
 class KnownMultiplierStringType(Type):
 
+    __slots__ = ('number_of_bytes',)
+
     TAG = None
     ENCODING = None
 
@@ -346,6 +362,14 @@ class KnownMultiplierStringType(Type):
 
         return decoder.read_bytes(number_of_bytes).decode(self.ENCODING)
 
+    def skip(self, decoder):
+        if self.number_of_bytes is None:
+            number_of_bytes = decoder.read_length_determinant()
+        else:
+            number_of_bytes = self.number_of_bytes
+
+        decoder.skip_bits(8 * number_of_bytes)
+
     def __repr__(self):
         return '{}({})'.format(self.__class__.__name__,
                                self.name)
@@ -353,6 +377,8 @@ class KnownMultiplierStringType(Type):
 
 class MembersType(Type):
 
+    __slots__ = ('root_members', 'additions', 'optionals')
+
     def __init__(self, name, type_name, tag, root_members, additions):
         super(MembersType, self).__init__(name,
                                           type_name,
@@ -510,6 +536,39 @@ class MembersType(Type):
 
         return decoded
 
+    def skip(self, decoder):
+        if self.additions is not None:
+            if decoder.read_bit():
+                self.skip_root(decoder)
+                self.skip_additions(decoder)
+            else:
+                self.skip_root(decoder)
+        else:
+            self.skip_root(decoder)
+
+    def skip_root(self, decoder):
+        optionals = {
+            optional: decoder.read_bit()
+            for optional in self.optionals
+        }
+
+        decoder.align()
+
+        for member in self.root_members:
+            if optionals.get(member, True):
+                member.skip(decoder)
+
+    def skip_additions(self, decoder):
+        # All extension additions are prefixed by their length.
+        length = decoder.read_length_determinant()
+        decoder.read_byte()
+        presence_bits = decoder.read_non_negative_binary_integer(length)
+        decoder.align()
+
+        for i in range(length):
+            if presence_bits & (1 << (length - i - 1)):
+                decoder.skip_bits(8 * decoder.read_length_determinant())
+
     def __repr__(self):
         return '{}({}, [{}])'.format(
             self.__class__.__name__,
@@ -519,6 +578,8 @@ class MembersType(Type):
 
 class ArrayType(Type):
 
+    __slots__ = ('element_type',)
+
     def __init__(self, name, type_name, tag, element_type):
         super(ArrayType, self).__init__(name,
                                         type_name,
@@ -541,6 +602,10 @@ class ArrayType(Type):
 
         return decoded
 
+    def skip(self, decoder):
+        for _ in range(decoder.read_integer()):
+            self.element_type.skip(decoder)
+
     def __repr__(self):
         return '{}({}, {})'.format(self.__class__.__name__,
                                    self.name,
@@ -549,6 +614,8 @@ class ArrayType(Type):
 
 class Boolean(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(Boolean, self).__init__(name,
                                       'BOOLEAN',
@@ -566,6 +633,8 @@ class Boolean(Type):
 
 class Integer(Type):
 
+    __slots__ = ('has_extension_marker', 'length', 'fmt')
+
     def __init__(self, name):
         super(Integer, self).__init__(name,
                                       'INTEGER',
@@ -624,6 +693,8 @@ class Integer(Type):
 
 class Real(Type):
 
+    __slots__ = ('length', 'fmt')
+
     def __init__(self, name, with_components):
         super(Real, self).__init__(name, 'REAL', Tag.REAL)
 
@@ -699,6 +770,8 @@ class Real(Type):
 
 class Null(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(Null, self).__init__(name, 'NULL', Tag.NULL)
 
@@ -714,6 +787,8 @@ class Null(Type):
 
 class BitString(Type):
 
+    __slots__ = ('number_of_bits',)
+
     def __init__(self, name, minimum, maximum, has_extension_marker):
         super(BitString, self).__init__(name,
                                         'BIT STRING',
@@ -766,6 +841,8 @@ class BitString(Type):
 
 class OctetString(Type):
 
+    __slots__ = ('number_of_bytes',)
+
     def __init__(self, name, minimum, maximum, has_extension_marker):
         super(OctetString, self).__init__(name,
                                           'OCTET STRING',
@@ -792,12 +869,22 @@ class OctetString(Type):
 
         return decoder.read_bytes(number_of_bytes)
 
+    def skip(self, decoder):
+        if self.number_of_bytes is None:
+            number_of_bytes = decoder.read_length_determinant()
+        else:
+            number_of_bytes = self.number_of_bytes
+
+        decoder.skip_bits(8 * number_of_bytes)
+
     def __repr__(self):
         return 'OctetString({})'.format(self.name)
 
 
 class ObjectIdentifier(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(ObjectIdentifier, self).__init__(name,
                                                'OBJECT IDENTIFIER',
@@ -820,6 +907,8 @@ class ObjectIdentifier(Type):
 
 class Enumerated(Type):
 
+    __slots__ = ('has_extension_marker', 'value_to_data', 'data_to_value')
+
     def __init__(self, name, values, numeric):
         super(Enumerated, self).__init__(name,
                                          'ENUMERATED',
@@ -879,6 +968,8 @@ class Enumerated(Type):
 
 class Sequence(MembersType):
 
+    __slots__ = ()
+
     def __init__(self, name, root_members, additions):
         super(Sequence, self).__init__(name,
                                        'SEQUENCE',
@@ -889,6 +980,8 @@ class Sequence(MembersType):
 
 class SequenceOf(ArrayType):
 
+    __slots__ = ()
+
     def __init__(self, name, element_type):
         super(SequenceOf, self).__init__(name,
                                          'SEQUENCE OF',
@@ -898,6 +991,8 @@ class SequenceOf(ArrayType):
 
 class Set(MembersType):
 
+    __slots__ = ()
+
     def __init__(self, name, root_members, additions):
         super(Set, self).__init__(name,
                                   'SET',
@@ -908,6 +1003,8 @@ class Set(MembersType):
 
 class SetOf(ArrayType):
 
+    __slots__ = ()
+
     def __init__(self, name, element_type):
         super(SetOf, self).__init__(name,
                                     'SET OF',
@@ -917,6 +1014,10 @@ class SetOf(ArrayType):
 
 class Choice(Type):
 
+    __slots__ = ('root_members', 'name_to_root_member', 'tag_to_root_member',
+                 'additions', 'name_to_addition', 'tag_to_addition',
+                 'has_extension_marker')
+
     def __init__(self, name, root_members, additions):
         super(Choice, self).__init__(name, 'CHOICE', None)
         self.root_members = root_members
@@ -1008,6 +1109,19 @@ class Choice(Type):
 
         return (member.name, decoded)
 
+    def skip(self, decoder):
+        tag = decoder.read_tag()
+
+        if tag in self.tag_to_root_member:
+            self.tag_to_root_member[tag].skip(decoder)
+        elif tag in self.tag_to_addition or self.has_extension_marker:
+            decoder.skip_bits(8 * decoder.read_length_determinant())
+        else:
+            raise DecodeError(
+                "Expected choice member tag {}, but got '{}'.".format(
+                    self.format_tags(),
+                    self.format_tag(tag)))
+
     def __repr__(self):
         return 'Choice({}, [{}])'.format(
             self.name,
@@ -1016,71 +1130,95 @@ class Choice(Type):
 
 class UTF8String(KnownMultiplierStringType):
 
+    __slots__ = ()
+
     TAG = Tag.UTF8_STRING
     ENCODING = 'utf-8'
 
 
 class NumericString(KnownMultiplierStringType):
 
+    __slots__ = ()
+
     TAG = Tag.NUMERIC_STRING
     ENCODING = 'ascii'
 
 
 class PrintableString(KnownMultiplierStringType):
 
+    __slots__ = ()
+
     TAG = Tag.PRINTABLE_STRING
     ENCODING = 'ascii'
 
 
 class IA5String(KnownMultiplierStringType):
 
+    __slots__ = ()
+
     TAG = Tag.IA5_STRING
     ENCODING = 'ascii'
 
 
 class VisibleString(KnownMultiplierStringType):
 
+    __slots__ = ()
+
     TAG = Tag.VISIBLE_STRING
     ENCODING = 'ascii'
 
 
 class GeneralString(KnownMultiplierStringType):
 
+    __slots__ = ()
+
     TAG = Tag.GENERAL_STRING
     ENCODING = 'latin-1'
 
 
 class BMPString(KnownMultiplierStringType):
 
+    __slots__ = ()
+
     TAG = Tag.BMP_STRING
     ENCODING = 'utf-16-be'
 
 
 class GraphicString(KnownMultiplierStringType):
 
+    __slots__ = ()
+
     TAG = Tag.GENERAL_STRING
     ENCODING = 'latin-1'
 
 
 class UniversalString(KnownMultiplierStringType):
 
+    __slots__ = ()
+
     TAG = Tag.UNIVERSAL_STRING
     ENCODING = 'utf-32-be'
 
 
 class TeletexString(KnownMultiplierStringType):
 
+    __slots__ = ()
+
     TAG = Tag.T61_STRING
     ENCODING = 'iso-8859-1'
 
 
 class ObjectDescriptor(GraphicString):
 
+    __slots__ = ()
+
     TAG = Tag.OBJECT_DESCRIPTOR
 
 
 class UTCTime(VisibleString):
 
+    __slots__ = ()
+
     TAG = Tag.UTC_TIME
 
     def encode(self, data, encoder):
@@ -1096,6 +1234,8 @@ class UTCTime(VisibleString):
 
 class GeneralizedTime(VisibleString):
 
+    __slots__ = ()
+
     TAG = Tag.GENERALIZED_TIME
 
     def encode(self, data, encoder):
@@ -1111,6 +1251,8 @@ class GeneralizedTime(VisibleString):
 
 class Date(Type):
 
+    __slots__ = ('_inner',)
+
     def __init__(self, name):
         super(Date, self).__init__(name, 'DATE', None)
         year = Integer('year')
@@ -1141,6 +1283,8 @@ class Date(Type):
 
 class TimeOfDay(Type):
 
+    __slots__ = ('_inner',)
+
     def __init__(self, name):
         super(TimeOfDay, self).__init__(name, 'TIME-OF-DAY', None)
         hours = Integer('hours')
@@ -1172,6 +1316,8 @@ class TimeOfDay(Type):
 
 class DateTime(Type):
 
+    __slots__ = ('_date', '_time')
+
     def __init__(self, name):
         super(DateTime, self).__init__(name, 'DATE-TIME', None)
         self._date = Date('date')
@@ -1195,6 +1341,8 @@ class DateTime(Type):
 
 class Any(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(Any, self).__init__(name, 'ANY', None)
 
@@ -1210,6 +1358,8 @@ class Any(Type):
 
 class AnyDefinedBy(Type):
 
+    __slots__ = ('type_member', 'choices')
+
     def __init__(self, name, type_member, choices):
         super(AnyDefinedBy, self).__init__(name,
                                            'ANY DEFINED BY',
@@ -1230,6 +1380,8 @@ class AnyDefinedBy(Type):
 
 class Recursive(Type, compiler.Recursive):
 
+    __slots__ = ('module_name', 'tag_number', 'tag_flags', 'inner')
+
     def __init__(self, name, type_name, module_name):
         super(Recursive, self).__init__(name, 'RECURSIVE', None)
         self.type_name = type_name
@@ -1250,6 +1402,9 @@ class Recursive(Type, compiler.Recursive):
     def decode(self, decoder):
         return self.inner.decode(decoder)
 
+    def skip(self, decoder):
+        self.inner.skip(decoder)
+
     def __repr__(self):
         return 'Recursive({})'.format(self.type_name)
 
@@ -1275,6 +1430,52 @@ class CompiledType(compiler.CompiledType):
 
         return self._type.decode(decoder)
 
+    def iter_decode(self, data):
+        # The decoder converts all given data to an integer, so decode
+        # each message from a window that is doubled until the message
+        # fits.
+        data = memoryview(data)
+        offset = 0
+        window = ITER_DECODE_WINDOW_SIZE
+
+        while offset < len(data):
+            decoder = Decoder(data[offset:offset + window])
+
+            try:
+                decoded = self._type.decode(decoder)
+            except OutOfDataError:
+                if offset + window >= len(data):
+                    # Trailing partial data.
+                    return
+
+                window *= 2
+                continue
+
+            end_offset = offset + (decoder.number_of_read_bits() + 7) // 8
+
+            yield decoded, offset, end_offset
+
+            window = max(ITER_DECODE_WINDOW_SIZE, 2 * (end_offset - offset))
+            offset = end_offset
+
+    def decode_length(self, data):
+        data = memoryview(data)
+        window = ITER_DECODE_WINDOW_SIZE
+
+        while True:
+            decoder = Decoder(data[:window])
+
+            try:
+                self._type.skip(decoder)
+            except OutOfDataError:
+                if window >= len(data):
+                    return None
+
+                window *= 2
+                continue
+
+            return (decoder.number_of_read_bits() + 7) // 8
+
     def __repr__(self):
         return repr(self._type)
 
@@ -1282,9 +1483,9 @@ class CompiledType(compiler.CompiledType):
 class Compiler(compiler.Compiler):
 
     def process_type(self, type_name, type_descriptor, module_name):
-        compiled_type = self.compile_type(type_name,
-                                          type_descriptor,
-                                          module_name)
+        compiled_type = self.compile_user_type(type_name,
+                                               type_name,
+                                               module_name)
 
         return CompiledType(compiled_type)
 
@@ -1473,8 +1674,8 @@ class Compiler(compiler.Compiler):
             additions.append(compiled_member)
 
 
-def compile_dict(specification, numeric_enums=False):
-    return Compiler(specification, numeric_enums).process()
+def compile_dict(specification, numeric_enums=False, lazy=False):
+    return Compiler(specification, numeric_enums).process(lazy)
 
 
 def decode_length(_data):
@@ -31,6 +31,9 @@ from .permitted_alphabet import IA5_STRING
 from .permitted_alphabet import VISIBLE_STRING
 
 
+DECODE_LENGTH_WINDOW_SIZE = 256
+
+
 def is_unbound(minimum, maximum):
     return minimum in [None, 'MIN'] or maximum in [None, 'MAX']
 
@@ -522,6 +525,8 @@ class Decoder(object):
 
 class Type(object):
 
+    __slots__ = ('name', 'type_name', 'optional', 'default', 'tag')
+
     def __init__(self, name, type_name):
         self.name = name
         self.type_name = type_name
@@ -538,9 +543,21 @@ class Type(object):
     def is_default(self, value):
         return value == self.default
 
+    def skip(self, decoder):
+        """Skip the encoding of this type. Types with cheaper ways to find
+        the end of their encoding than decoding it override this
+        method.
+
+        """
+
+        self.decode(decoder)
+
 
 class KnownMultiplierStringType(Type):
 
+    __slots__ = ('permitted_alphabet', 'bits_per_character', 'minimum',
+                 'maximum', 'has_extension_marker', 'number_of_bits')
+
     PERMITTED_ALPHABET = PermittedAlphabet({}, {})
 
     def __init__(self,
@@ -662,6 +679,8 @@ class KnownMultiplierStringType(Type):
 
 class StringType(Type):
 
+    __slots__ = ()
+
     ENCODING = None
     LENGTH_MULTIPLIER = 1
 
@@ -693,6 +712,8 @@ class StringType(Type):
 
 class MembersType(Type):
 
+    __slots__ = ('root_members', 'additions', 'optionals')
+
     def __init__(self,
                  name,
                  root_members,
@@ -873,6 +894,36 @@ class MembersType(Type):
 
         return decoded
 
+    def skip(self, decoder):
+        if self.additions is not None:
+            if decoder.read_bit():
+                self.skip_root(decoder)
+                self.skip_additions(decoder)
+            else:
+                self.skip_root(decoder)
+        else:
+            self.skip_root(decoder)
+
+    def skip_root(self, decoder):
+        optionals = {
+            optional: decoder.read_bit()
+            for optional in self.optionals
+        }
+
+        for member in self.root_members:
+            if optionals.get(member, True):
+                member.skip(decoder)
+
+    def skip_additions(self, decoder):
+        # All extension additions are embedded in open types.
+        length = decoder.read_normally_small_length()
+        presence_bits = decoder.read_non_negative_binary_integer(length)
+        decoder.align()
+
+        for i in range(length):
+            if presence_bits & (1 << (length - i - 1)):
+                decoder.skip_bits(8 * decoder.read_length_determinant())
+
     def __repr__(self):
         return '{}({}, [{}])'.format(
             self.__class__.__name__,
@@ -882,6 +933,9 @@ class MembersType(Type):
 
 class ArrayType(Type):
 
+    __slots__ = ('element_type', 'minimum', 'maximum', 'has_extension_marker',
+                 'number_of_bits')
+
     def __init__(self,
                  name,
                  element_type,
@@ -971,6 +1025,36 @@ class ArrayType(Type):
 
         return decoded
 
+    def skip(self, decoder):
+        length = None
+
+        if self.has_extension_marker:
+            bit = decoder.read_bit()
+
+            if bit:
+                decoder.align()
+                length = decoder.read_length_determinant()
+
+        if length is not None:
+            pass
+        elif self.number_of_bits is None:
+            decoder.align()
+
+            for length in decoder.read_length_determinant_chunks():
+                for _ in range(length):
+                    self.element_type.skip(decoder)
+
+            return
+        else:
+            length = self.minimum
+
+            if self.minimum != self.maximum:
+                length += decoder.read_non_negative_binary_integer(
+                    self.number_of_bits)
+
+        for _ in range(length):
+            self.element_type.skip(decoder)
+
     def __repr__(self):
         return '{}({}, {})'.format(self.__class__.__name__,
                                    self.name,
@@ -979,6 +1063,8 @@ class ArrayType(Type):
 
 class Boolean(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(Boolean, self).__init__(name, 'BOOLEAN')
 
@@ -994,6 +1080,9 @@ class Boolean(Type):
 
 class Integer(Type):
 
+    __slots__ = ('minimum', 'maximum', 'has_extension_marker', 'number_of_bits',
+                 'number_of_indefinite_bits')
+
     def __init__(self, name):
         super(Integer, self).__init__(name, 'INTEGER')
         self.minimum = None
@@ -1081,6 +1170,8 @@ class Integer(Type):
 
 class Real(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(Real, self).__init__(name, 'REAL')
 
@@ -1100,6 +1191,8 @@ class Real(Type):
 
 class Null(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(Null, self).__init__(name, 'NULL')
 
@@ -1115,6 +1208,8 @@ class Null(Type):
 
 class BitString(Type):
 
+    __slots__ = ('minimum', 'maximum', 'has_named_bits', 'number_of_bits')
+
     def __init__(self, name, minimum, maximum, has_named_bits):
         super(BitString, self).__init__(name, 'BIT STRING')
         self.minimum = minimum
@@ -1206,6 +1301,8 @@ class BitString(Type):
 
 class OctetString(Type):
 
+    __slots__ = ('minimum', 'maximum', 'has_extension_marker', 'number_of_bits')
+
     def __init__(self, name, minimum, maximum, has_extension_marker):
         super(OctetString, self).__init__(name, 'OCTET STRING')
         self.minimum = minimum
@@ -1300,6 +1397,8 @@ class OctetString(Type):
 
 class ObjectIdentifier(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(ObjectIdentifier, self).__init__(name, 'OBJECT IDENTIFIER')
 
@@ -1322,6 +1421,10 @@ class ObjectIdentifier(Type):
 
 class Enumerated(Type):
 
+    __slots__ = ('root_index_to_data', 'root_data_to_index',
+                 'root_number_of_bits', 'additions_index_to_data',
+                 'additions_data_to_index')
+
     def __init__(self, name, values, numeric):
         super(Enumerated, self).__init__(name, 'ENUMERATED')
         root, additions = enum_values_split(values)
@@ -1418,6 +1521,8 @@ class Enumerated(Type):
 
 class Sequence(MembersType):
 
+    __slots__ = ()
+
     def __init__(self,
                  name,
                  root_members,
@@ -1430,6 +1535,8 @@ class Sequence(MembersType):
 
 class SequenceOf(ArrayType):
 
+    __slots__ = ()
+
     def __init__(self,
                  name,
                  element_type,
@@ -1446,6 +1553,8 @@ class SequenceOf(ArrayType):
 
 class Set(MembersType):
 
+    __slots__ = ()
+
     def __init__(self,
                  name,
                  root_members,
@@ -1458,6 +1567,8 @@ class Set(MembersType):
 
 class SetOf(ArrayType):
 
+    __slots__ = ()
+
     def __init__(self,
                  name,
                  element_type,
@@ -1474,6 +1585,10 @@ class SetOf(ArrayType):
 
 class Choice(Type):
 
+    __slots__ = ('root_index_to_member', 'root_name_to_index',
+                 'root_number_of_bits', 'additions_index_to_member',
+                 'additions_name_to_index')
+
     def __init__(self, name, root_members, additions):
         super(Choice, self).__init__(name, 'CHOICE')
 
@@ -1622,6 +1737,31 @@ class Choice(Type):
 
         return (name, decoded)
 
+    def skip(self, decoder):
+        if self.additions_index_to_member is not None:
+            if decoder.read_bit():
+                decoder.read_normally_small_non_negative_whole_number()
+                decoder.align()
+                decoder.skip_bits(8 * decoder.read_length_determinant())
+
+                return
+
+        if len(self.root_index_to_member) > 1:
+            index = decoder.read_non_negative_binary_integer(
+                self.root_number_of_bits)
+        else:
+            index = 0
+
+        try:
+            member = self.root_index_to_member[index]
+        except KeyError:
+            raise DecodeError(
+                'Expected choice index {}, but got {}.'.format(
+                    self.format_root_indexes(),
+                    index))
+
+        member.skip(decoder)
+
     def __repr__(self):
         return 'Choice({}, [{}])'.format(
             self.name,
@@ -1631,6 +1771,8 @@ class Choice(Type):
 
 class UTF8String(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(UTF8String, self).__init__(name, 'UTF8String')
 
@@ -1656,6 +1798,8 @@ class UTF8String(Type):
 
 class NumericString(KnownMultiplierStringType):
 
+    __slots__ = ()
+
     ALPHABET = bytearray(NUMERIC_STRING.encode('ascii'))
     ENCODE_MAP = {v: i for i, v in enumerate(ALPHABET)}
     DECODE_MAP = {i: v for i, v in enumerate(ALPHABET)}
@@ -1665,6 +1809,8 @@ class NumericString(KnownMultiplierStringType):
 
 class PrintableString(KnownMultiplierStringType):
 
+    __slots__ = ()
+
     ALPHABET = bytearray(PRINTABLE_STRING.encode('ascii'))
     ENCODE_MAP = {v: v for v in ALPHABET}
     DECODE_MAP = {v: v for v in ALPHABET}
@@ -1674,6 +1820,8 @@ class PrintableString(KnownMultiplierStringType):
 
 class IA5String(KnownMultiplierStringType):
 
+    __slots__ = ()
+
     ALPHABET = bytearray(IA5_STRING.encode('ascii'))
     ENCODE_DECODE_MAP = {v: v for v in ALPHABET}
     PERMITTED_ALPHABET = PermittedAlphabet(ENCODE_DECODE_MAP,
@@ -1682,6 +1830,8 @@ class IA5String(KnownMultiplierStringType):
 
 class VisibleString(KnownMultiplierStringType):
 
+    __slots__ = ()
+
     ALPHABET = bytearray(VISIBLE_STRING.encode('ascii'))
     ENCODE_DECODE_MAP = {v: v for v in ALPHABET}
     PERMITTED_ALPHABET = PermittedAlphabet(ENCODE_DECODE_MAP,
@@ -1690,37 +1840,49 @@ class VisibleString(KnownMultiplierStringType):
 
 class GeneralString(StringType):
 
+    __slots__ = ()
+
     ENCODING = 'latin-1'
 
 
 class BMPString(StringType):
 
+    __slots__ = ()
+
     ENCODING = 'utf-16-be'
     LENGTH_MULTIPLIER = 2
 
 
 class GraphicString(StringType):
 
+    __slots__ = ()
+
     ENCODING = 'latin-1'
 
 
 class TeletexString(StringType):
 
+    __slots__ = ()
+
     ENCODING = 'iso-8859-1'
 
 
 class UniversalString(StringType):
 
+    __slots__ = ()
+
     ENCODING = 'utf-32-be'
     LENGTH_MULTIPLIER = 4
 
 
 class ObjectDescriptor(GraphicString):
-    pass
+    __slots__ = ()
 
 
 class UTCTime(VisibleString):
 
+    __slots__ = ()
+
     def encode(self, data, encoder):
         encoded = restricted_utc_time_from_datetime(data)
 
@@ -1734,6 +1896,8 @@ class UTCTime(VisibleString):
 
 class GeneralizedTime(VisibleString):
 
+    __slots__ = ()
+
     def encode(self, data, encoder):
         enceded = restricted_generalized_time_from_datetime(data)
 
@@ -1747,6 +1911,8 @@ class GeneralizedTime(VisibleString):
 
 class Date(Type):
 
+    __slots__ = ('_inner',)
+
     def __init__(self, name):
         super(Date, self).__init__(name, 'DATE')
         immediate = Integer('immediate')
@@ -1796,6 +1962,8 @@ class Date(Type):
 
 class TimeOfDay(Type):
 
+    __slots__ = ('_inner',)
+
     def __init__(self, name):
         super(TimeOfDay, self).__init__(name, 'TIME-OF-DAY')
         hours = Integer('hours')
@@ -1827,6 +1995,8 @@ class TimeOfDay(Type):
 
 class DateTime(Type):
 
+    __slots__ = ('_inner',)
+
     def __init__(self, name):
         super(DateTime, self).__init__(name, 'DATE-TIME')
         self._inner = Sequence('DATE-TIME-ENCODING',
@@ -1854,6 +2024,8 @@ class DateTime(Type):
 
 class OpenType(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(OpenType, self).__init__(name, 'OpenType')
 
@@ -1868,12 +2040,18 @@ class OpenType(Type):
 
         return decoder.read_bytes(length)
 
+    def skip(self, decoder):
+        decoder.align()
+        decoder.skip_bits(8 * decoder.read_length_determinant())
+
     def __repr__(self):
         return 'OpenType({})'.format(self.name)
 
 
 class Any(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(Any, self).__init__(name, 'ANY')
 
@@ -1889,6 +2067,8 @@ class Any(Type):
 
 class Recursive(Type, compiler.Recursive):
 
+    __slots__ = ('module_name', '_inner')
+
     def __init__(self, name, type_name, module_name):
         super(Recursive, self).__init__(name, 'RECURSIVE')
         self.type_name = type_name
@@ -1904,16 +2084,21 @@ class Recursive(Type, compiler.Recursive):
     def decode(self, decoder):
         return self._inner.decode(decoder)
 
+    def skip(self, decoder):
+        self._inner.skip(decoder)
+
     def __repr__(self):
         return 'Recursive({})'.format(self.type_name)
 
 
 class AdditionGroup(Sequence):
-    pass
+    __slots__ = ()
 
 
 class CompiledType(compiler.CompiledType):
 
+    DECODER = Decoder
+
     def __init__(self, type_):
         super(CompiledType, self).__init__()
         self._type = type_
@@ -1933,6 +2118,27 @@ class CompiledType(compiler.CompiledType):
 
         return self._type.decode(decoder)
 
+    def decode_length(self, data):
+        # The decoder converts all given data to a string of bits, so
+        # skip the message in a window that is doubled until the
+        # message fits.
+        data = memoryview(data)
+        window = DECODE_LENGTH_WINDOW_SIZE
+
+        while True:
+            decoder = self.DECODER(data[:window])
+
+            try:
+                self._type.skip(decoder)
+            except OutOfDataError:
+                if window >= len(data):
+                    return None
+
+                window *= 2
+                continue
+
+            return (decoder.number_of_read_bits() + 7) // 8
+
     def __repr__(self):
         return repr(self._type)
 
@@ -1940,9 +2146,9 @@ class CompiledType(compiler.CompiledType):
 class Compiler(compiler.Compiler):
 
     def process_type(self, type_name, type_descriptor, module_name):
-        compiled_type = self.compile_type(type_name,
-                                          type_descriptor,
-                                          module_name)
+        compiled_type = self.compile_user_type(type_name,
+                                               type_name,
+                                               module_name)
 
         return CompiledType(compiled_type)
 
@@ -2172,8 +2378,8 @@ class Compiler(compiler.Compiler):
         return PermittedAlphabet(encode_map, decode_map)
 
 
-def compile_dict(specification, numeric_enums=False):
-    return Compiler(specification, numeric_enums).process()
+def compile_dict(specification, numeric_enums=False, lazy=False):
+    return Compiler(specification, numeric_enums).process(lazy)
 
 
 def decode_length(_data):
@@ -29,6 +29,8 @@ STRING_TYPES = [
 
 class Type(object):
 
+    __slots__ = ('name', 'optional', 'default')
+
     TYPE = None
 
     def __init__(self, name):
@@ -46,11 +48,15 @@ class Type(object):
 
 class Boolean(Type):
 
+    __slots__ = ()
+
     TYPE = bool
 
 
 class Integer(Type):
 
+    __slots__ = ()
+
     def encode(self, data):
         if sys.version_info[0] > 2:
             if not isinstance(data, (int, str)):
@@ -66,6 +72,8 @@ class Integer(Type):
 
 class Float(Type):
 
+    __slots__ = ()
+
     def encode(self, data):
         if sys.version_info[0] > 2:
             if not isinstance(data, (float, int)):
@@ -81,6 +89,8 @@ class Float(Type):
 
 class Null(Type):
 
+    __slots__ = ()
+
     def encode(self, data):
         if data is not None:
             raise EncodeError('Expected None, but got {}.'.format(data))
@@ -88,6 +98,8 @@ class Null(Type):
 
 class BitString(Type):
 
+    __slots__ = ()
+
     def encode(self, data):
         if (not isinstance(data, tuple)
             or len(data) != 2
@@ -106,6 +118,8 @@ class BitString(Type):
 
 class Bytes(Type):
 
+    __slots__ = ()
+
     def encode(self, data):
         if not isinstance(data, (bytes, bytearray)):
             raise EncodeError(
@@ -115,6 +129,8 @@ class Bytes(Type):
 
 class String(Type):
 
+    __slots__ = ()
+
     def encode(self, data):
         if sys.version_info[0] > 2:
             if not isinstance(data, str):
@@ -128,6 +144,8 @@ class String(Type):
 
 class Dict(Type):
 
+    __slots__ = ('members',)
+
     TYPE = dict
 
     def __init__(self, name, members):
@@ -150,6 +168,8 @@ class Dict(Type):
 
 class List(Type):
 
+    __slots__ = ('element_type',)
+
     TYPE = list
 
     def __init__(self, name, element_type):
@@ -165,6 +185,8 @@ class List(Type):
 
 class Enumerated(Type):
 
+    __slots__ = ('_numeric_enums',)
+
     def __init__(self, name, numeric_enums):
         super(Enumerated, self).__init__(name)
         self._numeric_enums = numeric_enums
@@ -200,6 +222,8 @@ class Enumerated(Type):
 
 class Choice(Type):
 
+    __slots__ = ('members', 'name_to_member')
+
     def __init__(self, name, members):
         super(Choice, self).__init__(name)
         self.members = members
@@ -241,6 +265,8 @@ class Choice(Type):
 
 class Date(Type):
 
+    __slots__ = ()
+
     def encode(self, data):
         if not isinstance(data, datetime.date):
             raise EncodeError(
@@ -250,6 +276,8 @@ class Date(Type):
 
 class TimeOfDay(Type):
 
+    __slots__ = ()
+
     def encode(self, data):
         if not isinstance(data, datetime.time):
             raise EncodeError(
@@ -259,6 +287,8 @@ class TimeOfDay(Type):
 
 class DateTime(Type):
 
+    __slots__ = ()
+
     def encode(self, data):
         if not isinstance(data, datetime.datetime):
             raise EncodeError(
@@ -268,12 +298,16 @@ class DateTime(Type):
 
 class Skip(Type):
 
+    __slots__ = ()
+
     def encode(self, data):
         pass
 
 
 class Recursive(Type, compiler.Recursive):
 
+    __slots__ = ('type_name', 'module_name', 'inner')
+
     def __init__(self, name, type_name, module_name):
         super(Recursive, self).__init__(name)
         self.type_name = type_name
@@ -304,9 +338,9 @@ class CompiledType(compiler.CompiledType):
 class Compiler(compiler.Compiler):
 
     def process_type(self, type_name, type_descriptor, module_name):
-        compiled_type = self.compile_type(type_name,
-                                          type_descriptor,
-                                          module_name)
+        compiled_type = self.compile_user_type(type_name,
+                                               type_name,
+                                               module_name)
 
         return CompiledType(compiled_type)
 
@@ -369,5 +403,5 @@ class Compiler(compiler.Compiler):
         return compiled
 
 
-def compile_dict(specification, numeric_enums=False):
-    return Compiler(specification, numeric_enums).process()
+def compile_dict(specification, numeric_enums=False, lazy=False):
+    return Compiler(specification, numeric_enums).process(lazy)
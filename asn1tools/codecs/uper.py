@@ -54,6 +54,8 @@ class Decoder(per.Decoder):
 
 class KnownMultiplierStringType(per.KnownMultiplierStringType):
 
+    __slots__ = ()
+
     PERMITTED_ALPHABET = ''
 
     def __init__(self,
@@ -117,6 +119,8 @@ class KnownMultiplierStringType(per.KnownMultiplierStringType):
 
 class Integer(Type):
 
+    __slots__ = ('minimum', 'maximum', 'has_extension_marker', 'number_of_bits')
+
     def __init__(self, name):
         super(Integer, self).__init__(name, 'INTEGER')
         self.minimum = None
@@ -168,6 +172,8 @@ class Integer(Type):
 
 class NumericString(KnownMultiplierStringType):
 
+    __slots__ = ()
+
     ALPHABET = bytearray(NUMERIC_STRING.encode('ascii'))
     ENCODE_MAP = {v: i for i, v in enumerate(ALPHABET)}
     DECODE_MAP = {i: v for i, v in enumerate(ALPHABET)}
@@ -177,6 +183,8 @@ class NumericString(KnownMultiplierStringType):
 
 class PrintableString(KnownMultiplierStringType):
 
+    __slots__ = ()
+
     ALPHABET = bytearray(PRINTABLE_STRING.encode('ascii'))
     ENCODE_MAP = {v: v for v in ALPHABET}
     DECODE_MAP = {v: v for v in ALPHABET}
@@ -186,6 +194,8 @@ class PrintableString(KnownMultiplierStringType):
 
 class IA5String(KnownMultiplierStringType):
 
+    __slots__ = ()
+
     ALPHABET = bytearray(IA5_STRING.encode('ascii'))
     ENCODE_DECODE_MAP = {v: v for v in ALPHABET}
     PERMITTED_ALPHABET = PermittedAlphabet(ENCODE_DECODE_MAP,
@@ -194,6 +204,8 @@ class IA5String(KnownMultiplierStringType):
 
 class VisibleString(KnownMultiplierStringType):
 
+    __slots__ = ()
+
     ALPHABET = bytearray(VISIBLE_STRING.encode('ascii'))
     ENCODE_DECODE_MAP = {v: v for v in ALPHABET}
     PERMITTED_ALPHABET = PermittedAlphabet(ENCODE_DECODE_MAP,
@@ -202,6 +214,8 @@ class VisibleString(KnownMultiplierStringType):
 
 class UTCTime(VisibleString):
 
+    __slots__ = ()
+
     def encode(self, data, encoder):
         encoded = restricted_utc_time_from_datetime(data)
 
@@ -215,6 +229,8 @@ class UTCTime(VisibleString):
 
 class GeneralizedTime(VisibleString):
 
+    __slots__ = ()
+
     def encode(self, data, encoder):
         enceded = restricted_generalized_time_from_datetime(data)
 
@@ -228,6 +244,8 @@ class GeneralizedTime(VisibleString):
 
 class Date(per.Date):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(Date, self).__init__(name)
         immediate = Integer('immediate')
@@ -252,6 +270,8 @@ class Date(per.Date):
 
 class TimeOfDay(per.TimeOfDay):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(TimeOfDay, self).__init__(name)
         hours = Integer('hours')
@@ -267,6 +287,8 @@ class TimeOfDay(per.TimeOfDay):
 
 class DateTime(per.DateTime):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(DateTime, self).__init__(name)
         self._inner = Sequence('DATE-TIME-ENCODING',
@@ -276,6 +298,8 @@ class DateTime(per.DateTime):
 
 class CompiledType(per.CompiledType):
 
+    DECODER = Decoder
+
     def encode(self, data):
         encoder = Encoder()
         self._type.encode(data, encoder)
@@ -291,9 +315,9 @@ class CompiledType(per.CompiledType):
 class Compiler(per.Compiler):
 
     def process_type(self, type_name, type_descriptor, module_name):
-        compiled_type = self.compile_type(type_name,
-                                          type_descriptor,
-                                          module_name)
+        compiled_type = self.compile_user_type(type_name,
+                                               type_name,
+                                               module_name)
 
         return CompiledType(compiled_type)
 
@@ -436,8 +460,8 @@ class Compiler(per.Compiler):
         return compiled
 
 
-def compile_dict(specification, numeric_enums=False):
-    return Compiler(specification, numeric_enums).process()
+def compile_dict(specification, numeric_enums=False, lazy=False):
+    return Compiler(specification, numeric_enums).process(lazy)
 
 
 def decode_length(_data):
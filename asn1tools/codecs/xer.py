@@ -7,10 +7,13 @@ import sys
 from xml.etree import ElementTree
 import binascii
 import datetime
+from copy import copy
+from xml.sax.saxutils import escape
 
 from ..parser import EXTENSION_MARKER
 from . import EncodeError
 from . import DecodeError
+from . import DecodeLimitError
 from . import compiler
 from . import format_or
 from . import utc_time_to_datetime
@@ -20,42 +23,60 @@ from . import generalized_time_from_datetime
 from .compiler import enum_values_as_dict
 
 
-def indent_xml(element, indent, level=0):
-    i = "\n" + level * indent
+FIND_MEMBER_ELEMENTS_MAXIMUM_NUMBER_OF_MEMBERS = 8
 
-    if len(element):
-        if not element.text or not element.text.strip():
-            element.text = i + indent
+# Number of characters given to the XML parser at a time when decoding
+# with limits.
+DECODE_WITH_LIMITS_FEED_SIZE = 65536
 
-        if not element.tail or not element.tail.strip():
-            element.tail = i
 
-        for element in element:
-            indent_xml(element, indent, level + 1)
-
-        if not element.tail or not element.tail.strip():
-            element.tail = i
-    else:
-        if level and (not element.tail or not element.tail.strip()):
-            element.tail = i
+class Type(object):
+    """Types are encoded by appending XML text to the list `encoded`.
+    `newline` is the newline and indentation before the end tag of
+    the encoded element, and `indent` is one level of indentation.
+    Both are empty strings if not indenting. Elements without
+    children are appended as a single string.
 
+    """
 
-class Type(object):
+    __slots__ = ('name', 'type_name', 'optional', 'default', 'start_tag',
+                 'end_tag', 'empty_tag')
 
     def __init__(self, name, type_name):
-        self.name = name.replace(' ', '_')
+        self.set_name(name)
         self.type_name = type_name
         self.optional = False
         self.default = None
 
+    def set_name(self, name):
+        self.name = name.replace(' ', '_')
+        self.start_tag = '<{}>'.format(self.name)
+        self.end_tag = '</{}>'.format(self.name)
+        self.empty_tag = '<{} />'.format(self.name)
+
     def set_size_range(self, minimum, maximum, has_extension_marker):
         pass
 
-    def encode(self, data):
+    def encode(self, data, encoded, newline, indent):
         raise NotImplementedError('To be implemented by subclasses.')
 
-    def encode_of(self, data):
-        return self.encode(data)
+    def encode_of(self, data, encoded, newline, indent):
+        self.encode(data, encoded, newline, indent)
+
+    def encode_text(self, text, encoded):
+        if text:
+            encoded.append(self.start_tag + text + self.end_tag)
+        else:
+            encoded.append(self.empty_tag)
+
+    def encode_children_end(self, encoded, start, newline):
+        # Replace the placeholder at index `start` with the start tag,
+        # or with an empty element tag if no children were appended.
+        if len(encoded) == start + 1:
+            encoded[start] = self.empty_tag
+        else:
+            encoded[start] = self.start_tag
+            encoded.append(newline + self.end_tag)
 
     def decode(self, element):
         raise NotImplementedError('To be implemented by subclasses.')
@@ -66,19 +87,16 @@ class Type(object):
 
 class StringType(Type):
 
+    __slots__ = ()
+
     def __init__(self, name, type_name=None):
         if type_name is None:
             type_name = self.__class__.__name__
 
         super(StringType, self).__init__(name, type_name)
 
-    def encode(self, data):
-        element = ElementTree.Element(self.name)
-
-        if len(data) > 0:
-            element.text = data
-
-        return element
+    def encode(self, data, encoded, newline, indent):
+        self.encode_text(escape(data), encoded)
 
     def decode(self, element):
         if element.text is None:
@@ -96,19 +114,31 @@ class StringType(Type):
 
 class MembersType(Type):
 
+    __slots__ = ('members', 'index_member_elements')
+
     def __init__(self, name, members, type_name):
         super(MembersType, self).__init__(name, type_name)
         self.members = members
 
-    def encode(self, data):
-        element = ElementTree.Element(self.name)
+        # Searching the children of an element for each member is
+        # fast for few members, but quadratic. Index them by name
+        # instead for types with many members.
+        self.index_member_elements = (
+            len(members) > FIND_MEMBER_ELEMENTS_MAXIMUM_NUMBER_OF_MEMBERS)
+
+    def encode(self, data, encoded, newline, indent):
+        start = len(encoded)
+        encoded.append(None)
+        member_newline = newline + indent
 
         for member in self.members:
             name = member.name
 
             if name in data:
+                encoded.append(member_newline)
+
                 try:
-                    member_element = member.encode(data[name])
+                    member.encode(data[name], encoded, member_newline, indent)
                 except EncodeError as e:
                     e.location.append(member.name)
                     raise
@@ -121,16 +151,24 @@ class MembersType(Type):
                         name,
                         data))
 
-            element.append(member_element)
-
-        return element
+        self.encode_children_end(encoded, start, newline)
 
     def decode(self, element):
         values = {}
 
+        if self.index_member_elements:
+            # Reversed to keep the first of repeated names, just as
+            # find() does.
+            find = {
+                member_element.tag: member_element
+                for member_element in reversed(element)
+            }.get
+        else:
+            find = element.find
+
         for member in self.members:
             name = member.name
-            member_element = element.find(name)
+            member_element = find(name)
 
             if member_element is not None:
                 value = member.decode(member_element)
@@ -151,17 +189,22 @@ class MembersType(Type):
 
 class ArrayType(Type):
 
+    __slots__ = ('element_type',)
+
     def __init__(self, name, element_type, type_name):
         super(ArrayType, self).__init__(name, type_name)
         self.element_type = element_type
 
-    def encode(self, data):
-        element = ElementTree.Element(self.name)
+    def encode(self, data, encoded, newline, indent):
+        start = len(encoded)
+        encoded.append(None)
+        element_newline = newline + indent
 
         for entry in data:
-            element.append(self.element_type.encode_of(entry))
+            encoded.append(element_newline)
+            self.element_type.encode_of(entry, encoded, element_newline, indent)
 
-        return element
+        self.encode_children_end(encoded, start, newline)
 
     def decode(self, element):
         values = []
@@ -180,20 +223,24 @@ class ArrayType(Type):
 
 class Boolean(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(Boolean, self).__init__(name, 'BOOLEAN')
 
-    def encode(self, data):
-        element = ElementTree.Element(self.name)
-        ElementTree.SubElement(element, 'true' if data else 'false')
-
-        return element
+    def encode(self, data, encoded, newline, indent):
+        encoded.append(self.start_tag)
+        encoded.append(newline
+                       + indent
+                       + ('<true />' if data else '<false />')
+                       + newline
+                       + self.end_tag)
 
     def decode(self, element):
         return element.find('true') is not None
 
-    def encode_of(self, data):
-        return ElementTree.Element('true' if data else 'false')
+    def encode_of(self, data, encoded, newline, indent):
+        encoded.append('<true />' if data else '<false />')
 
     def decode_of(self, element):
         return element.tag == 'true'
@@ -204,14 +251,13 @@ class Boolean(Type):
 
 class Integer(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(Integer, self).__init__(name, 'INTEGER')
 
-    def encode(self, data):
-        element = ElementTree.Element(self.name)
-        element.text = str(data)
-
-        return element
+    def encode(self, data, encoded, newline, indent):
+        encoded.append(self.start_tag + str(data) + self.end_tag)
 
     def decode(self, element):
         return int(element.text)
@@ -222,10 +268,12 @@ class Integer(Type):
 
 class Real(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(Real, self).__init__(name, 'REAL')
 
-    def encode(self, data):
+    def encode(self, data, encoded, newline, indent):
         data = float(data)
         exponent = 0
 
@@ -233,10 +281,10 @@ class Real(Type):
             data /= 10
             exponent += 1
 
-        element = ElementTree.Element(self.name)
-        element.text = '{}E{}'.format(data, exponent)
-
-        return element
+        encoded.append('{}{}E{}{}'.format(self.start_tag,
+                                          data,
+                                          exponent,
+                                          self.end_tag))
 
     def decode(self, element):
         return float(element.text)
@@ -247,11 +295,13 @@ class Real(Type):
 
 class Null(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(Null, self).__init__(name, 'NULL')
 
-    def encode(self, data):
-        return ElementTree.Element(self.name)
+    def encode(self, data, encoded, newline, indent):
+        encoded.append(self.empty_tag)
 
     def decode(self, element):
         return None
@@ -262,18 +312,20 @@ class Null(Type):
 
 class BitString(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(BitString, self).__init__(name, 'BIT STRING')
 
-    def encode(self, data):
-        element = ElementTree.Element(self.name)
-
+    def encode(self, data, encoded, newline, indent):
         if data[1] > 0:
-            encoded = int(binascii.hexlify(data[0]), 16)
-            encoded |= (0x80 << (8 * len(data[0])))
-            element.text = bin(encoded)[10:10 + data[1]].upper()
-
-        return element
+            value = int(binascii.hexlify(data[0]), 16)
+            value |= (0x80 << (8 * len(data[0])))
+            encoded.append(self.start_tag
+                           + bin(value)[10:10 + data[1]].upper()
+                           + self.end_tag)
+        else:
+            encoded.append(self.empty_tag)
 
     def decode(self, element):
         encoded = element.text
@@ -300,16 +352,14 @@ class BitString(Type):
 
 class OctetString(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(OctetString, self).__init__(name, 'OCTET STRING')
 
-    def encode(self, data):
-        element = ElementTree.Element(self.name)
-
-        if len(data) > 0:
-            element.text = binascii.hexlify(data).decode('ascii').upper()
-
-        return element
+    def encode(self, data, encoded, newline, indent):
+        self.encode_text(binascii.hexlify(data).decode('ascii').upper(),
+                         encoded)
 
     def decode(self, element):
         if element.text is None:
@@ -323,6 +373,8 @@ class OctetString(Type):
 
 class ObjectIdentifier(StringType):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(ObjectIdentifier, self).__init__(name, 'OBJECT IDENTIFIER')
 
@@ -335,6 +387,8 @@ class ObjectIdentifier(StringType):
 
 class Enumerated(Type):
 
+    __slots__ = ('has_extension_marker', 'data_to_value', 'value_to_data')
+
     def __init__(self, name, values, numeric):
         super(Enumerated, self).__init__(name, 'ENUMERATED')
 
@@ -355,7 +409,7 @@ class Enumerated(Type):
     def format_values(self):
         return format_or(sorted(list(self.value_to_data)))
 
-    def encode(self, data):
+    def encode(self, data, encoded, newline, indent):
         try:
             value = self.data_to_value[data]
         except KeyError:
@@ -364,10 +418,12 @@ class Enumerated(Type):
                     self.format_names(),
                     data))
 
-        element = ElementTree.Element(self.name)
-        element.append(ElementTree.Element(value))
-
-        return element
+        encoded.append(self.start_tag)
+        encoded.append('{}{}<{} />{}{}'.format(newline,
+                                               indent,
+                                               value,
+                                               newline,
+                                               self.end_tag))
 
     def decode(self, element):
         value = element[0].tag
@@ -382,7 +438,7 @@ class Enumerated(Type):
                     self.format_values(),
                     value))
 
-    def encode_of(self, data):
+    def encode_of(self, data, encoded, newline, indent):
         try:
             value = self.data_to_value[data]
         except KeyError:
@@ -391,7 +447,7 @@ class Enumerated(Type):
                     self.format_names(),
                     data))
 
-        return ElementTree.Element(value)
+        encoded.append('<{} />'.format(value))
 
     def decode_of(self, element):
         value = element.tag
@@ -410,12 +466,16 @@ class Enumerated(Type):
 
 class Sequence(MembersType):
 
+    __slots__ = ()
+
     def __init__(self, name, members):
         super(Sequence, self).__init__(name, members, 'SEQUENCE')
 
 
 class SequenceOf(ArrayType):
 
+    __slots__ = ()
+
     def __init__(self, name, element_type):
         super(SequenceOf, self).__init__(name,
                                          element_type,
@@ -424,12 +484,16 @@ class SequenceOf(ArrayType):
 
 class Set(MembersType):
 
+    __slots__ = ()
+
     def __init__(self, name, members):
         super(Set, self).__init__(name, members, 'SET')
 
 
 class SetOf(ArrayType):
 
+    __slots__ = ()
+
     def __init__(self, name, element_type):
         super(SetOf, self).__init__(name,
                                     element_type,
@@ -438,6 +502,8 @@ class SetOf(ArrayType):
 
 class Choice(Type):
 
+    __slots__ = ('members', 'name_to_member', 'has_extension_marker')
+
     def __init__(self, name, members, has_extension_marker):
         super(Choice, self).__init__(name, 'CHOICE')
         self.members = members
@@ -447,7 +513,7 @@ class Choice(Type):
     def format_names(self):
         return format_or(sorted([member.name for member in self.members]))
 
-    def encode(self, data):
+    def encode(self, data, encoded, newline, indent):
         try:
             member = self.name_to_member[data[0]]
         except KeyError:
@@ -456,15 +522,17 @@ class Choice(Type):
                     self.format_names(),
                     data[0]))
 
-        element = ElementTree.Element(self.name)
+        member_newline = newline + indent
+        encoded.append(self.start_tag)
+        encoded.append(member_newline)
 
         try:
-            element.append(member.encode(data[1]))
+            member.encode(data[1], encoded, member_newline, indent)
         except EncodeError as e:
             e.location.append(member.name)
             raise
 
-        return element
+        encoded.append(newline + self.end_tag)
 
     def decode(self, element):
         member_element = element[0]
@@ -482,7 +550,7 @@ class Choice(Type):
 
         return (name, member.decode(member_element))
 
-    def encode_of(self, data):
+    def encode_of(self, data, encoded, newline, indent):
         try:
             member = self.name_to_member[data[0]]
         except KeyError:
@@ -491,7 +559,7 @@ class Choice(Type):
                     self.format_names(),
                     data[0]))
 
-        return member.encode(data[1])
+        member.encode(data[1], encoded, newline, indent)
 
     def decode_of(self, element):
         name = element.tag
@@ -513,59 +581,60 @@ class Choice(Type):
 
 
 class UTF8String(StringType):
-    pass
+    __slots__ = ()
 
 
 class NumericString(StringType):
-    pass
+    __slots__ = ()
 
 
 class PrintableString(StringType):
-    pass
+    __slots__ = ()
 
 
 class IA5String(StringType):
-    pass
+    __slots__ = ()
 
 
 class VisibleString(StringType):
-    pass
+    __slots__ = ()
 
 
 class GeneralString(StringType):
-    pass
+    __slots__ = ()
 
 
 class BMPString(StringType):
-    pass
+    __slots__ = ()
 
 
 class GraphicString(StringType):
-    pass
+    __slots__ = ()
 
 
 class UniversalString(StringType):
-    pass
+    __slots__ = ()
 
 
 class TeletexString(StringType):
-    pass
+    __slots__ = ()
 
 
 class ObjectDescriptor(GraphicString):
-    pass
+    __slots__ = ()
 
 
 class UTCTime(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(UTCTime, self).__init__(name, 'UTCTime')
 
-    def encode(self, data):
-        element = ElementTree.Element(self.name)
-        element.text = utc_time_from_datetime(data)
-
-        return element
+    def encode(self, data, encoded, newline, indent):
+        encoded.append(self.start_tag
+                       + utc_time_from_datetime(data)
+                       + self.end_tag)
 
     def decode(self, element):
         return utc_time_to_datetime(element.text)
@@ -576,14 +645,15 @@ class UTCTime(Type):
 
 class GeneralizedTime(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(GeneralizedTime, self).__init__(name, 'GeneralizedTime')
 
-    def encode(self, data):
-        element = ElementTree.Element(self.name)
-        element.text = generalized_time_from_datetime(data)
-
-        return element
+    def encode(self, data, encoded, newline, indent):
+        encoded.append(self.start_tag
+                       + generalized_time_from_datetime(data)
+                       + self.end_tag)
 
     def decode(self, element):
         return generalized_time_to_datetime(element.text)
@@ -594,11 +664,10 @@ class GeneralizedTime(Type):
 
 class Date(StringType):
 
-    def encode(self, data):
-        element = ElementTree.Element(self.name)
-        element.text = str(data)
+    __slots__ = ()
 
-        return element
+    def encode(self, data, encoded, newline, indent):
+        encoded.append(self.start_tag + str(data) + self.end_tag)
 
     def decode(self, element):
         return datetime.date(*time.strptime(element.text, '%Y-%m-%d')[:3])
@@ -606,11 +675,10 @@ class Date(StringType):
 
 class TimeOfDay(StringType):
 
-    def encode(self, data):
-        element = ElementTree.Element(self.name)
-        element.text = str(data)
+    __slots__ = ()
 
-        return element
+    def encode(self, data, encoded, newline, indent):
+        encoded.append(self.start_tag + str(data) + self.end_tag)
 
     def decode(self, element):
         return datetime.time(*time.strptime(element.text, '%H:%M:%S')[3:6])
@@ -618,11 +686,12 @@ class TimeOfDay(StringType):
 
 class DateTime(StringType):
 
-    def encode(self, data):
-        element = ElementTree.Element(self.name)
-        element.text = str(data).replace(' ', 'T')
+    __slots__ = ()
 
-        return element
+    def encode(self, data, encoded, newline, indent):
+        encoded.append(self.start_tag
+                       + str(data).replace(' ', 'T')
+                       + self.end_tag)
 
     def decode(self, element):
         return datetime.datetime(*time.strptime(element.text,
@@ -631,10 +700,12 @@ class DateTime(StringType):
 
 class Any(Type):
 
+    __slots__ = ()
+
     def __init__(self, name):
         super(Any, self).__init__(name, 'ANY')
 
-    def encode(self, data):
+    def encode(self, data, encoded, newline, indent):
         raise NotImplementedError('ANY is not yet implemented.')
 
     def decode(self, element):
@@ -646,6 +717,8 @@ class Any(Type):
 
 class Recursive(Type, compiler.Recursive):
 
+    __slots__ = ('module_name', '_inner')
+
     def __init__(self, name, type_name, module_name):
         super(Recursive, self).__init__(name, 'RECURSIVE')
         self.type_name = type_name
@@ -653,13 +726,13 @@ class Recursive(Type, compiler.Recursive):
         self._inner = None
 
     def set_inner_type(self, inner):
-        self._inner = inner
+        # A copy of the inner type named as this type, as the inner
+        # type is encoded in an element named as this type.
+        self._inner = copy(inner)
+        self._inner.set_name(self.name)
 
-    def encode(self, data):
-        encoded = self._inner.encode(data)
-        encoded.tag = self.name
-
-        return encoded
+    def encode(self, data, encoded, newline, indent):
+        self._inner.encode(data, encoded, newline, indent)
 
     def decode(self, element):
         return self._inner.decode(element)
@@ -668,6 +741,80 @@ class Recursive(Type, compiler.Recursive):
         return 'Recursive({})'.format(self.name)
 
 
+class LimitsTreeBuilder(object):
+    """An XML parser target building an element tree, that raises a
+    DecodeLimitError as soon as the nesting depth, the number of
+    elements or the number of characters in a text exceeds given
+    limit. Texts are counted part by part as they are parsed, so a too
+    long text is never built.
+
+    """
+
+    def __init__(self,
+                 maximum_depth,
+                 maximum_number_of_elements,
+                 maximum_string_length):
+        if maximum_depth is None:
+            maximum_depth = float('inf')
+
+        if maximum_number_of_elements is None:
+            maximum_number_of_elements = float('inf')
+
+        if maximum_string_length is None:
+            maximum_string_length = float('inf')
+
+        self._maximum_depth = maximum_depth
+        self._maximum_number_of_elements = maximum_number_of_elements
+        self._maximum_string_length = maximum_string_length
+        self._depth = 0
+        self._number_of_elements = 0
+        self._string_length = 0
+
+        # Bound methods of the wrapped builder are called faster than
+        # methods of a subclass of it.
+        builder = ElementTree.TreeBuilder()
+        self._start = builder.start
+        self._data = builder.data
+        self._end = builder.end
+        self._close = builder.close
+
+    def start(self, tag, attrib):
+        self._depth += 1
+        self._number_of_elements += 1
+        self._string_length = 0
+
+        if self._depth > self._maximum_depth:
+            raise DecodeLimitError(
+                'Expected at most {} nesting levels.'.format(
+                    self._maximum_depth))
+
+        if self._number_of_elements > self._maximum_number_of_elements:
+            raise DecodeLimitError(
+                'Expected at most {} elements.'.format(
+                    self._maximum_number_of_elements))
+
+        return self._start(tag, attrib)
+
+    def data(self, data):
+        self._string_length += len(data)
+
+        if self._string_length > self._maximum_string_length:
+            raise DecodeLimitError(
+                'Expected at most {} characters in a string.'.format(
+                    self._maximum_string_length))
+
+        self._data(data)
+
+    def end(self, tag):
+        self._depth -= 1
+        self._string_length = 0
+
+        return self._end(tag)
+
+    def close(self):
+        return self._close()
+
+
 class CompiledType(compiler.CompiledType):
 
     def __init__(self, type_):
@@ -679,18 +826,73 @@ class CompiledType(compiler.CompiledType):
         return self._type
 
     def encode(self, data, indent=None):
-        element = self._type.encode(data)
+        encoded = []
 
-        if indent is not None:
-            indent_xml(element, indent * " ")
+        if indent is None:
+            self._type.encode(data, encoded, '', '')
+        else:
+            self._type.encode(data, encoded, '\n', indent * ' ')
 
-        return ElementTree.tostring(element)
+            # Like ElementTree, end with a newline if the element has
+            # children, that is, if more than one string was appended.
+            if len(encoded) > 1:
+                encoded.append('\n')
+
+        return ''.join(encoded).encode('ascii', 'xmlcharrefreplace')
 
     def decode(self, data):
         element = ElementTree.fromstring(data.decode('utf-8'))
 
         return self._type.decode(element)
 
+    def decode_with_limits(self,
+                           data,
+                           maximum_depth,
+                           maximum_number_of_elements,
+                           maximum_string_length):
+        builder = LimitsTreeBuilder(maximum_depth,
+                                    maximum_number_of_elements,
+                                    maximum_string_length)
+        parser = ElementTree.XMLParser(target=builder)
+        data = data.decode('utf-8')
+        size = DECODE_WITH_LIMITS_FEED_SIZE
+
+        # The parser scans all fed data even after an exceeded limit,
+        # so feed it in parts.
+        for offset in range(0, len(data), size):
+            parser.feed(data[offset:offset + size])
+
+        return self._type.decode(parser.close())
+
+    def iter_decode_xer(self, fileobj):
+        if not isinstance(self._type, ArrayType):
+            raise DecodeError(
+                'Expected a SEQUENCE OF or SET OF type, but got {}.'.format(
+                    self._type.type_name))
+
+        element_type = self._type.element_type
+        root = None
+        depth = 0
+
+        for event, element in ElementTree.iterparse(fileobj,
+                                                    events=('start', 'end')):
+            if event == 'start':
+                if root is None:
+                    root = element
+
+                depth += 1
+            else:
+                depth -= 1
+
+                if depth == 1:
+                    decoded = element_type.decode_of(element)
+
+                    # Drop the decoded element to keep memory usage
+                    # independent of the number of elements.
+                    root.clear()
+
+                    yield decoded
+
     def __repr__(self):
         return repr(self._type)
 
@@ -698,12 +900,18 @@ class CompiledType(compiler.CompiledType):
 class Compiler(compiler.Compiler):
 
     def process_type(self, type_name, type_descriptor, module_name):
-        compiled_type = self.compile_type(type_name,
-                                          type_descriptor,
-                                          module_name)
+        compiled_type = self.compile_user_type(type_name,
+                                               type_name,
+                                               module_name)
 
         return CompiledType(compiled_type)
 
+    def copy_with_name(self, compiled_type, name):
+        compiled_type = copy(compiled_type)
+        compiled_type.set_name(name)
+
+        return compiled_type
+
     def compile_type(self, name, type_descriptor, module_name):
         type_name = type_descriptor['type']
 
@@ -806,8 +1014,8 @@ class Compiler(compiler.Compiler):
         return compiled
 
 
-def compile_dict(specification, numeric_enums):
-    return Compiler(specification, numeric_enums).process()
+def compile_dict(specification, numeric_enums, lazy=False):
+    return Compiler(specification, numeric_enums).process(lazy)
 
 
 def decode_length(_data):
@@ -3,26 +3,106 @@ encode and decode types.
 
 """
 
-import diskcache
+import hashlib
+import importlib
+import threading
 
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+from .parser import merge_dicts
 from .parser import parse_files
+from .parser import parse_modules
+from .parser import read_modules
 from .parser import parse_string
 from .codecs import compiler
-from .codecs import ber
-from .codecs import der
-from .codecs import gser
-from .codecs import jer
-from .codecs import oer
-from .codecs import per
-from .codecs import uper
-from .codecs import xer
-from .codecs import type_checker
-from .codecs import constraints_checker
 from .errors import CompileError
 from .errors import EncodeError
 from .errors import DecodeError
 
 
+CODECS = ['ber', 'der', 'gser', 'jer', 'oer', 'per', 'uper', 'xer']
+
+
+def _import_codec(name):
+    """Import given codec module on first use, as importing all codecs
+    makes ``import asn1tools`` slow.
+
+    """
+
+    return importlib.import_module('.codecs.' + name, __package__)
+
+
+class LazyTypes(Mapping):
+    """A read-only dictionary of types, compiled by given function
+    `compile_type(module_name, type_name)` on first access.
+
+    """
+
+    def __init__(self, module_names, compile_type):
+        self._module_names = module_names
+        self._compile_type = compile_type
+        self._types = {}
+
+    def __getitem__(self, type_name):
+        try:
+            return self._types[type_name]
+        except KeyError:
+            module_name = self._module_names[type_name]
+
+        type_ = self._compile_type(module_name, type_name)
+        self._types[type_name] = type_
+
+        return type_
+
+    def __iter__(self):
+        return iter(self._module_names)
+
+    def __len__(self):
+        return len(self._module_names)
+
+
+class LazyCompiler(object):
+    """Compiles types and their type and constraints checkers on first
+    access. Thread-safe, given that all lazy compilers sharing
+    checkers share `lock`.
+
+    """
+
+    def __init__(self, types, type_checkers, constraints_checkers, lock):
+        self._types = types
+        self._type_checkers = type_checkers
+        self._constraints_checkers = constraints_checkers
+        self._compiled = {}
+        self._lock = lock
+
+    def compile_type(self, module_name, type_name):
+        key = (module_name, type_name)
+
+        try:
+            return self._compiled[key]
+        except KeyError:
+            pass
+
+        with self._lock:
+            try:
+                return self._compiled[key]
+            except KeyError:
+                pass
+
+            type_ = self._types.get(module_name, type_name)
+            type_.type_checker = self._type_checkers.get(module_name,
+                                                         type_name)
+            type_.constraints_checker = self._constraints_checkers.get(
+                module_name,
+                type_name)
+            self._compiled[key] = type_
+
+        return type_
+
+
 class Specification(object):
     """This class is used to encode and decode ASN.1 types found in an
     ASN.1 specification.
@@ -41,31 +121,48 @@ class Specification(object):
                  constraints_checkers):
         self._modules = modules
         self._decode_length = decode_length
-        self._types = {}
-
+        module_names = {}
         duplicated = set()
 
         for module_name in modules:
             types = modules[module_name]
 
-            for type_name, type_ in types.items():
-                type_.type_checker = type_checkers[module_name][type_name]
-                type_.constraints_checker = constraints_checkers[module_name][type_name]
+            # Lazily compiled types are given without checkers, as
+            # they are compiled together.
+            if type_checkers is not None:
+                module_type_checkers = type_checkers[module_name]
+                module_constraints_checkers = constraints_checkers[module_name]
+
+                for type_name, type_ in types.items():
+                    type_.type_checker = module_type_checkers[type_name]
+                    type_.constraints_checker = module_constraints_checkers[type_name]
 
+            for type_name in types:
                 if type_name in duplicated:
                     continue
 
-                if type_name in self._types:
-                    del self._types[type_name]
+                if type_name in module_names:
+                    del module_names[type_name]
                     duplicated.add(type_name)
                     continue
 
-                self._types[type_name] = type_
+                module_names[type_name] = module_name
+
+        if type_checkers is None:
+            self._types = LazyTypes(
+                module_names,
+                lambda module_name, type_name: modules[module_name][type_name])
+        else:
+            self._types = {
+                type_name: modules[module_name][type_name]
+                for type_name, module_name in module_names.items()
+            }
 
     @property
     def types(self):
         """A dictionary of all unique types in the specification. Types found
-        in two or more modules are not part of this dictionary.
+        in two or more modules are not part of this dictionary. Types
+        of lazily compiled specifications are compiled on first access.
 
         >>> question = foo.types['Question']
         >>> question
@@ -137,7 +234,13 @@ class Specification(object):
 
         return type_.encode(data, **kwargs)
 
-    def decode(self, name, data, check_constraints=False):
+    def decode(self,
+               name,
+               data,
+               check_constraints=False,
+               maximum_depth=None,
+               maximum_number_of_elements=None,
+               maximum_string_length=None):
         """Decode given bytes object `data` as given type `name` and return
         the decoded data as a dictionary.
 
@@ -149,6 +252,22 @@ class Specification(object):
         instead allow decoding of values not fulfilling the
         constraints.
 
+        Give `maximum_depth` and/or `maximum_number_of_elements` to
+        limit the nesting depth of constructed encodings and the total
+        number of decoded elements. A DecodeError exception is raised
+        as soon as a limit is exceeded. The BER and DER codecs then
+        decode using an explicit stack instead of Python recursion,
+        so deeply nested data does not raise ``RecursionError``.
+
+        The XER and JER codecs also accept `maximum_string_length`,
+        the maximum number of characters in a string. Their limits
+        are checked while the XML or JSON text is parsed, before any
+        decoded value is created, where the elements are XML elements
+        and JSON values respectively.
+
+        Decoding limits are only supported by the BER, DER, XER and
+        JER codecs.
+
         >>> foo.decode('Question', b'0\\x0e\\x02\\x01\\x01\\x16\\x09Is 1+1=3?')
         {'id': 1, 'question': 'Is 1+1=3?'}
 
@@ -160,27 +279,211 @@ class Specification(object):
             raise DecodeError(
                 "Type '{}' not found in types dictionary.".format(name))
 
-        decoded = type_.decode(data)
+        if (maximum_depth is None
+            and maximum_number_of_elements is None
+            and maximum_string_length is None):
+            decoded = type_.decode(data)
+        else:
+            decoded = type_.decode_with_limits(data,
+                                               maximum_depth,
+                                               maximum_number_of_elements,
+                                               maximum_string_length)
 
         if check_constraints:
             type_.check_constraints(decoded)
 
         return decoded
 
-    def decode_length(self, data):
+    def iter_decode(self, name, data, check_constraints=False):
+        """Decode all consecutive encodings of given type `name` in given
+        bytes-like object `data`, for example a bytes object, a
+        ``memoryview`` or a ``mmap``. Returns a generator of
+        ``(decoded, start, end)`` tuples, where `start` and `end` are
+        the offsets of the encoded message in `data`.
+
+        Iteration stops at trailing partial data, so the offset of
+        the next message is the `end` offset of the last yielded
+        message. Use it to resume once more data is available.
+
+        See :meth:`.decode()` for a description of
+        `check_constraints`.
+
+        This method only works for BER, DER and OER codecs.
+
+        >>> list(foo.iter_decode('Answer', b'0\\x06\\x02\\x01\\x01\\x01\\x01\\x00'
+        ...                                b'0\\x06\\x02\\x01\\x02\\x01\\x01\\xff'
+        ...                                b'0\\x06\\x02'))
+        [({'id': 1, 'answer': False}, 0, 8), ({'id': 2, 'answer': True}, 8, 16)]
+
+        """
+
+        try:
+            type_ = self._types[name]
+        except KeyError:
+            raise DecodeError(
+                "Type '{}' not found in types dictionary.".format(name))
+
+        messages = type_.iter_decode(data)
+
+        if check_constraints:
+            messages = _check_constraints_messages(type_, messages)
+
+        return messages
+
+    def iter_decode_xer(self, name, fileobj):
+        """Decode the XER encoded SEQUENCE OF or SET OF type `name` read from
+        given file object `fileobj`, element by element. Returns a
+        generator of the decoded elements.
+
+        The document is parsed incrementally and each element is
+        discarded once decoded, so memory usage does not grow with
+        the number of elements. There are no decoding limits, see
+        :meth:`.decode()`, so the size of each element is unbounded.
+
+        This method only works for the XER codec.
+
+        """
+
+        try:
+            type_ = self._types[name]
+        except KeyError:
+            raise DecodeError(
+                "Type '{}' not found in types dictionary.".format(name))
+
+        return type_.iter_decode_xer(fileobj)
+
+    def encode_jer_stream(self,
+                          name,
+                          iterable,
+                          fileobj,
+                          check_types=True,
+                          indent=None):
+        """Encode the elements in given iterable `iterable` as the JER
+        encoded SEQUENCE OF or SET OF type `name`, and write the
+        encoding to given binary file object `fileobj`. The elements
+        are encoded and written one by one, so `iterable` may be a
+        generator producing more elements than fits in memory.
+
+        The written data is identical to what :meth:`.encode()`
+        returns for a list of the elements.
+
+        See :meth:`.encode()` for a description of `check_types`.
+        Each element is checked before it is encoded.
+
+        This method only works for the JER codec.
+
+        """
+
+        try:
+            type_ = self._types[name]
+        except KeyError:
+            raise EncodeError(
+                "Type '{}' not found in types dictionary.".format(name))
+
+        if check_types:
+            iterable = _check_types_elements(type_, iterable)
+
+        type_.encode_jer_stream(iterable, fileobj, indent)
+
+    def iter_decode_jer(self, name, fileobj):
+        """Decode the JER encoded SEQUENCE OF or SET OF type `name` read from
+        given binary file object `fileobj`, element by element. Returns
+        a generator of the decoded elements.
+
+        The data is read in chunks and only the element being decoded
+        is kept in memory, so memory usage does not grow with the
+        number of elements. There are no decoding limits, see
+        :meth:`.decode()`, so the size of each element is unbounded.
+
+        This method only works for the JER codec.
+
+        """
+
+        try:
+            type_ = self._types[name]
+        except KeyError:
+            raise DecodeError(
+                "Type '{}' not found in types dictionary.".format(name))
+
+        return type_.iter_decode_jer(fileobj)
+
+    def validate(self, name, data, canonical=False):
+        """Check that given bytes object `data` is a well-formed encoding of
+        given type `name`, without creating any decoded Python
+        objects. Tags, lengths and choice alternatives are checked.
+
+        A DecodeError exception is raised if `data` is malformed. Its
+        `location` attribute has the same format as when decoding.
+
+        If `canonical` is ``True`` the DER canonical encoding rules
+        are checked as well, for example minimum length and integer
+        encodings, primitive string encodings and sorted SET OF
+        elements. Indefinite length SEQUENCE, SET, SEQUENCE OF and SET
+        OF encodings are always rejected, as they can not be decoded.
+
+        This method only works for BER and DER codecs.
+
+        >>> foo.validate('Question', b'0\\x0e\\x02\\x01\\x01\\x16\\x09Is 1+1=3?')
+        >>> foo.validate('Question', b'0\\x0e\\x02\\x01\\x01\\x16\\x0aIs 1+1=3?')
+        Traceback (most recent call last):
+          ...
+        DecodeError: question: Expected at least 10 contents byte(s) at ...
+
+        """
+
+        try:
+            type_ = self._types[name]
+        except KeyError:
+            raise DecodeError(
+                "Type '{}' not found in types dictionary.".format(name))
+
+        type_.validate(data, canonical)
+
+    def decode_length(self, data, name=None):
         """Decode the length of given data `data`. Returns None if not enough
         data was given to decode the length.
 
-        This method only works for BER and DER codecs with definite
-        length in the first data encoding. Other codecs and
-        combinations lacks length information in the data.
+        The BER and DER codecs decode the length from the first data
+        encoding, given that it has definite length, and `name` is
+        not needed.
+
+        The OER, PER and UPER codecs lacks length information in the
+        data, so `name` must be given. The length is found by skipping
+        the encoded value of given type in the beginning of `data`,
+        which is faster than decoding it. Other codecs and
+        combinations are not supported.
 
         >>> foo.decode_length(b'\\x30\\x0e\\x02\\x01\\x01')
         16
+        >>> foo.decode_length(b'\\x01\\x01\\x09Is 1+1=3?', 'Question')
+        12
 
         """
 
-        return self._decode_length(data)
+        if name is None:
+            return self._decode_length(data)
+
+        try:
+            type_ = self._types[name]
+        except KeyError:
+            raise DecodeError(
+                "Type '{}' not found in types dictionary.".format(name))
+
+        return type_.decode_length(data)
+
+
+def _check_constraints_messages(type_, messages):
+    for decoded, start, end in messages:
+        type_.check_constraints(decoded)
+
+        yield decoded, start, end
+
+
+def _check_types_elements(type_, iterable):
+    for entry in iterable:
+        type_.type_checker.type.element_type.encode(entry)
+
+        yield entry
 
 
 def _compile_any_defined_by_type(type_, choices):
@@ -213,40 +516,123 @@ def _compile_any_defined_by_choices(specification,
                 break
 
 
+def _parse_files_cache(filenames, encoding, number_of_workers, cache):
+    """Parse given files, using cached parse results of unchanged
+    modules.
+
+    """
+
+    modules = read_modules(filenames, encoding)
+    keys = []
+
+    for _, string in modules:
+        key = hashlib.sha256(string.encode('utf-8')).hexdigest()
+        keys.append('parsed-' + key)
+
+    parsed = [cache.get(key) for key in keys]
+    missing = [index for index, module in enumerate(parsed) if module is None]
+    missing_modules = parse_modules([modules[index] for index in missing],
+                                    number_of_workers)
+
+    for index, module in zip(missing, missing_modules):
+        cache[keys[index]] = module
+        parsed[index] = module
+
+    return merge_dicts(parsed)
+
+
 def _compile_files_cache(filenames,
                          codec,
                          any_defined_by_choices,
                          encoding,
                          cache_dir,
-                         numeric_enums):
-    key = [codec.encode('ascii')]
-
+                         numeric_enums,
+                         json_backend,
+                         number_of_workers,
+                         lazy,
+                         roots,
+                         codecs):
     if isinstance(filenames, str):
         filenames = [filenames]
 
+    if json_backend is None:
+        json_backend_name = None
+    else:
+        json_backend_name = _json_backend_name(json_backend)
+
+    if roots is not None:
+        roots = sorted(roots)
+
+    if codecs is not None:
+        codec = list(codecs)
+
+    key = hashlib.sha256(repr((codec,
+                               any_defined_by_choices,
+                               encoding,
+                               numeric_enums,
+                               json_backend_name,
+                               roots)).encode('utf-8'))
+
     for filename in filenames:
         with open(filename, 'rb') as fin:
-            key.append(fin.read())
+            key.update(hashlib.sha256(fin.read()).digest())
+
+    key = 'compiled-' + key.hexdigest()
+
+    import diskcache
 
-    key = b''.join(key)
     cache = diskcache.Cache(cache_dir)
 
+    # Lazily compiled specifications are not cached, only their parse
+    # results.
+    if lazy:
+        return compile_dict(_parse_files_cache(filenames,
+                                               encoding,
+                                               number_of_workers,
+                                               cache),
+                            codec,
+                            any_defined_by_choices,
+                            numeric_enums,
+                            json_backend,
+                            lazy,
+                            roots,
+                            codecs)
+
     try:
         return cache[key]
     except KeyError:
-        compiled = compile_dict(parse_files(filenames, encoding),
+        compiled = compile_dict(_parse_files_cache(filenames,
+                                                   encoding,
+                                                   number_of_workers,
+                                                   cache),
                                 codec,
                                 any_defined_by_choices,
-                                numeric_enums)
+                                numeric_enums,
+                                json_backend,
+                                lazy,
+                                roots,
+                                codecs)
         cache[key] = compiled
 
         return compiled
 
 
+def _json_backend_name(json_backend):
+    try:
+        return json_backend.__name__
+    except AttributeError:
+        return '{}.{}'.format(type(json_backend).__module__,
+                              type(json_backend).__name__)
+
+
 def compile_dict(specification,
                  codec='ber',
                  any_defined_by_choices=None,
-                 numeric_enums=False):
+                 numeric_enums=False,
+                 json_backend=None,
+                 lazy=False,
+                 roots=None,
+                 codecs=None):
     """Compile given ASN.1 specification dictionary and return a
     :class:`~asn1tools.compiler.Specification` object that can be used
     to encode and decode data structures with given codec
@@ -256,43 +642,115 @@ def compile_dict(specification,
     Give `numeric_enums` as ``True`` for numeric enumeration values
     instead of strings.
 
+    `json_backend` is the JSON library used by the JER codec, for
+    example a faster drop-in replacement of the standard library
+    module `json`. It must have the functions ``dumps(obj)`` and
+    ``loads(s)``, and ``dumps(obj, indent=indent)`` is used if
+    encoding with indentation. ``dumps()`` may return a string or
+    bytes, and ``loads()`` is given bytes. By default, the standard
+    library module `json` is used. Other codecs ignore this argument.
+
+    Give `lazy` as ``True`` to compile each type, and its type and
+    constraints checkers, on first use instead of compiling all types
+    up front. This reduces the compile time and memory usage of large
+    specifications when only a few of their types are used. The
+    result is the same as when compiling all types up front.
+
+    Give `roots` as a list of type names to only compile those types
+    and the types, values, object classes and object sets they refer
+    to, directly or indirectly. Other types are not part of the
+    returned specification.
+
+    Give `codecs` as a list of codecs to compile given specification
+    for all of them at once. `codec` is then ignored and a dictionary
+    of codec to :class:`~asn1tools.compiler.Specification` object is
+    returned. Pre-processing and the type and constraints checkers
+    are shared by all codecs.
+
     >>> foo = asn1tools.compile_dict(asn1tools.parse_files('foo.asn'))
+    >>> foos = asn1tools.compile_dict(asn1tools.parse_files('foo.asn'),
+    ...                               codecs=['uper', 'jer'])
+    >>> foos['jer'].encode('Question', {'id': 1, 'question': 'Is 1+1=3?'})
+    b'{"id":1,"question":"Is 1+1=3?"}'
 
     """
 
-    codecs = {
-        'ber': ber,
-        'der': der,
-        'gser': gser,
-        'jer': jer,
-        'oer': oer,
-        'per': per,
-        'uper': uper,
-        'xer': xer
-    }
+    if codecs is None:
+        codec_names = [codec]
+    else:
+        codec_names = codecs
 
-    try:
-        codec = codecs[codec]
-    except KeyError:
-        raise CompileError("Unsupported codec '{}'.".format(codec))
+    for codec_name in codec_names:
+        if codec_name not in CODECS:
+            raise CompileError("Unsupported codec '{}'.".format(codec_name))
 
     if any_defined_by_choices:
         _compile_any_defined_by_choices(specification,
                                         any_defined_by_choices)
 
-    return Specification(codec.compile_dict(specification,
-                                            numeric_enums),
-                         codec.decode_length,
-                         type_checker.compile_dict(specification,
-                                                   numeric_enums),
-                         constraints_checker.compile_dict(specification,
-                                                          numeric_enums))
+    if roots is not None:
+        specification = compiler.prune(specification, roots)
+
+    compiler.pre_process(specification)
+    type_checkers = _import_codec('type_checker').Compiler(
+        specification,
+        numeric_enums).process(lazy, True)
+    constraints_checkers = _import_codec('constraints_checker').Compiler(
+        specification,
+        numeric_enums).process(lazy, True)
+    lock = threading.Lock()
+    specifications = {}
+
+    for codec_name in codec_names:
+        codec = _import_codec(codec_name)
+
+        if codec_name == 'jer':
+            codec_compiler = codec.Compiler(specification,
+                                            numeric_enums,
+                                            json_backend)
+        else:
+            codec_compiler = codec.Compiler(specification, numeric_enums)
+
+        modules = codec_compiler.process(lazy, True)
+
+        if lazy:
+            compile_type = LazyCompiler(modules,
+                                        type_checkers,
+                                        constraints_checkers,
+                                        lock).compile_type
+            modules = {}
+
+            for module_name, module in specification.items():
+                types = module['types']
+
+                if types:
+                    modules[module_name] = LazyTypes(
+                        {type_name: module_name for type_name in types},
+                        compile_type)
+
+            compiled = Specification(modules, codec.decode_length, None, None)
+        else:
+            compiled = Specification(modules,
+                                     codec.decode_length,
+                                     type_checkers,
+                                     constraints_checkers)
+
+        specifications[codec_name] = compiled
+
+    if codecs is None:
+        return specifications[codec_names[0]]
+    else:
+        return specifications
 
 
 def compile_string(string,
                    codec='ber',
                    any_defined_by_choices=None,
-                   numeric_enums=False):
+                   numeric_enums=False,
+                   json_backend=None,
+                   lazy=False,
+                   roots=None,
+                   codecs=None):
     """Compile given ASN.1 specification string and return a
     :class:`~asn1tools.compiler.Specification` object that can be used
     to encode and decode data structures with given codec
@@ -302,6 +760,9 @@ def compile_string(string,
     Give `numeric_enums` as ``True`` for numeric enumeration values
     instead of strings.
 
+    See :func:`~asn1tools.compile_dict()` for a description of
+    `json_backend`, `lazy`, `roots` and `codecs`.
+
     >>> with open('foo.asn') as fin:
     ...     foo = asn1tools.compile_string(fin.read())
 
@@ -310,7 +771,11 @@ def compile_string(string,
     return compile_dict(parse_string(string),
                         codec,
                         any_defined_by_choices,
-                        numeric_enums)
+                        numeric_enums,
+                        json_backend,
+                        lazy,
+                        roots,
+                        codecs)
 
 
 def compile_files(filenames,
@@ -318,7 +783,12 @@ def compile_files(filenames,
                   any_defined_by_choices=None,
                   encoding='utf-8',
                   cache_dir=None,
-                  numeric_enums=False):
+                  numeric_enums=False,
+                  json_backend=None,
+                  number_of_workers=1,
+                  lazy=False,
+                  roots=None,
+                  codecs=None):
     """Compile given ASN.1 specification file(s) and return a
     :class:`~asn1tools.compiler.Specification` object that can be used
     to encode and decode data structures with given codec
@@ -330,15 +800,25 @@ def compile_files(filenames,
 
     `cache_dir` specifies the compiled files cache location in the
     file system. Give as ``None`` to disable the cache. By default the
-    cache is disabled. The cache key is the concatenated contents of
-    given files and the codec name. Using a cache will significantly
-    reduce the compile time when recompiling the same files. The cache
-    directory is automatically created if it does not exist. Remove
-    the cache directory `cache_dir` to clear the cache.
+    cache is disabled. The compiled specification is cached by a
+    SHA-256 hash of the contents of given files and the codec
+    options. Parse results are cached per module, so only changed
+    modules are parsed again when some files change. Using a cache
+    will significantly reduce the compile time when recompiling the
+    same files. The cache directory is automatically created if it
+    does not exist. Remove the cache directory `cache_dir` to clear
+    the cache.
 
     Give `numeric_enums` as ``True`` for numeric enumeration values
     instead of strings.
 
+    See :func:`~asn1tools.compile_dict()` for a description of
+    `json_backend`, `lazy`, `roots` and `codecs`. Lazily compiled
+    specifications are not cached, only their parse results.
+
+    `number_of_workers` is the number of processes parsing modules in
+    parallel, see :func:`~asn1tools.parse_files()`.
+
     >>> foo = asn1tools.compile_files('foo.asn')
 
     Give `cache_dir` as a string to use a cache.
@@ -348,23 +828,41 @@ def compile_files(filenames,
     """
 
     if cache_dir is None:
-        return compile_dict(parse_files(filenames, encoding),
+        return compile_dict(parse_files(filenames,
+                                        encoding,
+                                        number_of_workers),
                             codec,
                             any_defined_by_choices,
-                            numeric_enums)
+                            numeric_enums,
+                            json_backend,
+                            lazy,
+                            roots,
+                            codecs)
     else:
         return _compile_files_cache(filenames,
                                     codec,
                                     any_defined_by_choices,
                                     encoding,
                                     cache_dir,
-                                    numeric_enums)
+                                    numeric_enums,
+                                    json_backend,
+                                    number_of_workers,
+                                    lazy,
+                                    roots,
+                                    codecs)
 
 
-def pre_process_dict(specification):
+def pre_process_dict(specification, roots=None):
     """Pre-process given specification dictionary, expanding COMPONENTS OF
     and adding extension markers if EXTENSIBILITY IMPLIED is active.
 
+    Give `roots` as a list of type names to first prune the
+    specification to those types and everything they refer to. See
+    :func:`~asn1tools.compile_dict()`.
+
     """
 
+    if roots is not None:
+        specification = compiler.prune(specification, roots)
+
     return compiler.pre_process(specification)
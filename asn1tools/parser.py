@@ -3,8 +3,11 @@
 """
 
 import logging
+import marshal
 import re
 import sys
+import threading
+import zlib
 
 from pyparsing import Literal
 from pyparsing import Keyword
@@ -36,6 +39,20 @@ LOGGER = logging.getLogger(__name__)
 
 EXTENSION_MARKER = None
 
+# String literals and module ends in a specification with comments
+# replaced by spaces.
+MODULE_END_RE = re.compile(r'"(?:[^"]|"")*"|(?<![\w&-])(END)(?![\w-])')
+
+# The grammar is created once per process by get_grammar().
+_GRAMMAR = None
+_GRAMMAR_LOCK = threading.Lock()
+
+# The binary format of parsed specifications starts with this magic,
+# followed by the format version and the marshal version, one byte
+# each.
+BINARY_MAGIC = b'ASN1TOOLS-PARSED\n'
+BINARY_VERSION = 1
+
 
 class ParseError(Error):
     pass
@@ -1712,6 +1729,26 @@ def create_grammar():
     return specification
 
 
+def get_grammar():
+    """Return the ASN.1 grammar, created by the first call. Parsing does
+    not modify the grammar, so it is shared by all parse calls.
+
+    """
+
+    global _GRAMMAR
+
+    if _GRAMMAR is None:
+        with _GRAMMAR_LOCK:
+            if _GRAMMAR is None:
+                grammar = create_grammar()
+                # Streamline before sharing the grammar, as parsing
+                # otherwise does it on first use.
+                grammar.streamline()
+                _GRAMMAR = grammar
+
+    return _GRAMMAR
+
+
 def ignore_comments(string):
     """Ignore comments in given string by replacing them with spaces. This
     reduces the parsing time by roughly a factor of two.
@@ -1777,6 +1814,61 @@ def ignore_comments(string):
     return ''.join(chunks)
 
 
+def split_modules(string):
+    """Split given specification string, with comments replaced by
+    spaces, at module ends. Returns a list of offset and module string
+    tuples. Parts with only whitespace are left out.
+
+    """
+
+    offsets = [0]
+
+    for mo in MODULE_END_RE.finditer(string):
+        if mo.group(1) is not None:
+            offsets.append(mo.end())
+
+    offsets.append(len(string))
+    modules = []
+
+    for begin, end in zip(offsets, offsets[1:]):
+        module = string[begin:end]
+
+        if module.strip():
+            modules.append((begin, module))
+
+    return modules
+
+
+def create_parse_error(e, filename=None):
+    if filename is None:
+        location = ''
+    else:
+        location = " in '{}'".format(filename)
+
+    return ParseError(
+        "Invalid ASN.1 syntax{} at line {}, column {}: '{}': {}.".format(
+            location,
+            e.lineno,
+            e.column,
+            e.markInputline(),
+            e.msg))
+
+
+def parse_module(filename, string):
+    """Parse given module string, with comments replaced by spaces, and
+    return a dictionary of its contents. Runs in worker processes when
+    parsing files in parallel.
+
+    """
+
+    try:
+        tokens = get_grammar().parseString(string).asList()
+    except (ParseException, ParseSyntaxException) as e:
+        raise create_parse_error(e, filename)
+
+    return tokens[0]
+
+
 def parse_string(string):
     """Parse given ASN.1 specification string and return a dictionary of
     its contents.
@@ -1789,22 +1881,75 @@ def parse_string(string):
 
     """
 
-    grammar = create_grammar()
+    grammar = get_grammar()
 
     try:
         string = ignore_comments(string)
         tokens = grammar.parseString(string).asList()
     except (ParseException, ParseSyntaxException) as e:
-        raise ParseError("Invalid ASN.1 syntax at line {}, column {}: '{}': {}.".format(
-            e.lineno,
-            e.column,
-            e.markInputline(),
-            e.msg))
+        raise create_parse_error(e)
 
     return tokens[0]
 
 
-def parse_files(filenames, encoding='utf-8'):
+def read_file(filename, encoding):
+    if sys.version_info[0] < 3:
+        with open(filename, 'r') as fin:
+            return fin.read()
+    else:
+        with open(filename, 'r', encoding=encoding, errors='replace') as fin:
+            return fin.read()
+
+
+def read_modules(filenames, encoding='utf-8'):
+    """Read given ASN.1 specification file(s), remove comments and split
+    them into modules. Returns a list of filename and module string
+    tuples, to be parsed with :func:`parse_modules()`. Each module
+    string is padded to its position in its file for correct error
+    line numbers and columns.
+
+    """
+
+    if isinstance(filenames, str):
+        filenames = [filenames]
+
+    modules = []
+
+    for filename in filenames:
+        string = read_file(filename, encoding)
+
+        try:
+            string = ignore_comments(string)
+        except ParseSyntaxException as e:
+            raise create_parse_error(e, filename)
+
+        for offset, module in split_modules(string):
+            line = string.count('\n', 0, offset)
+            column = offset - string.rfind('\n', 0, offset) - 1
+            modules.append((filename, '\n' * line + ' ' * column + module))
+
+    if not modules:
+        modules.append((None, ''))
+
+    return modules
+
+
+def parse_modules(modules, number_of_workers=1):
+    """Parse given list of filename and module string tuples, as returned
+    by :func:`read_modules()`. Returns a list of module dictionaries.
+
+    """
+
+    if number_of_workers == 1 or len(modules) <= 1:
+        return [parse_module(filename, string) for filename, string in modules]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(number_of_workers) as executor:
+            return list(executor.map(parse_module, *zip(*modules)))
+
+
+def parse_files(filenames, encoding='utf-8', number_of_workers=1):
     """Parse given ASN.1 specification file(s) and return a dictionary of
     its/their contents.
 
@@ -1814,23 +1959,69 @@ def parse_files(filenames, encoding='utf-8'):
     `encoding` is the text encoding. This argument is passed to the
     built-in function `open()`.
 
+    `number_of_workers` is the number of processes parsing modules in
+    parallel. Each module is parsed separately, and error line numbers
+    refer to the file the module is in. By default all modules are
+    parsed in the calling process. Give as ``None`` to use one process
+    per CPU.
+
     >>> foo = asn1tools.parse_files('foo.asn')
 
     """
 
-    if isinstance(filenames, str):
-        filenames = [filenames]
+    return merge_dicts(parse_modules(read_modules(filenames, encoding),
+                                     number_of_workers))
 
-    string = ''
 
-    for filename in filenames:
-        if sys.version_info[0] < 3:
-            with open(filename, 'r') as fin:
-                string += fin.read()
-                string += '\n'
-        else:
-            with open(filename, 'r', encoding=encoding, errors='replace') as fin:
-                string += fin.read()
-                string += '\n'
+def dump_binary(specification):
+    """Returns given parsed specification dictionary encoded in a
+    compact, versioned binary format, as written by ``asn1tools parse
+    --format bin``. Load it with :func:`load_binary()`.
+
+    The dictionary is serialized with the `marshal` module, which
+    shares repeated names, and compressed with zlib.
+
+    """
+
+    header = bytearray(BINARY_MAGIC)
+    header.append(BINARY_VERSION)
+    header.append(marshal.version)
+
+    return bytes(header) + zlib.compress(marshal.dumps(specification,
+                                                       marshal.version))
+
+
+def is_binary(data):
+    """Returns True if given data starts with the binary format magic.
+
+    """
+
+    return data[:len(BINARY_MAGIC)] == BINARY_MAGIC
+
+
+def load_binary(data):
+    """Returns the parsed specification dictionary in given data, as
+    returned by :func:`dump_binary()`.
+
+    """
 
-    return parse_string(string)
+    if not is_binary(data):
+        raise ParseError('Not a binary specification.')
+
+    offset = len(BINARY_MAGIC)
+    version, marshal_version = bytearray(data[offset:offset + 2])
+
+    if version != BINARY_VERSION:
+        raise ParseError(
+            'Expected binary specification format version {}, but got '
+            '{}.'.format(BINARY_VERSION, version))
+
+    if marshal_version > marshal.version:
+        raise ParseError(
+            'Binary specification marshal version {} is not supported by '
+            'this Python version.'.format(marshal_version))
+
+    try:
+        return marshal.loads(zlib.decompress(data[offset + 2:]))
+    except (zlib.error, ValueError, EOFError, TypeError) as e:
+        raise ParseError('Invalid binary specification: {}'.format(e))
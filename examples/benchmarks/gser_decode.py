@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+
+"""A performance example decoding RRC 8.6.0 messages encoded using the
+text codecs GSER and XER.
+
+Example execution:
+
+$ ./gser_decode.py
+Decoding RRC 8.6.0 messages 1000 times. This may take a few seconds.
+
+MESSAGE              GSER-SECONDS  XER-SECONDS
+BCCH-DL-SCH-Message      0.204038     0.253782
+BCCH-BCH-Message         0.013498     0.016036
+$
+
+"""
+
+from __future__ import print_function
+
+import timeit
+import asn1tools
+
+from rrc_8_6_0 import RRC_8_6_0_ASN_PATH
+from rrc_8_6_0 import MESSAGES
+
+
+ITERATIONS = 1000
+
+
+def decode(rrc, name, decoded):
+    encoded = rrc.encode(name, decoded)
+
+    def decode():
+        rrc.decode(name, encoded)
+
+    return timeit.timeit(decode, number=ITERATIONS)
+
+
+print('Decoding RRC 8.6.0 messages {} times. This may take a few '
+      'seconds.'.format(ITERATIONS))
+
+rrc_dict = asn1tools.parse_files(RRC_8_6_0_ASN_PATH)
+rrc_gser = asn1tools.compile_dict(rrc_dict, 'gser')
+rrc_xer = asn1tools.compile_dict(rrc_dict, 'xer')
+
+print()
+print('MESSAGE              GSER-SECONDS  XER-SECONDS')
+
+for name, decoded in MESSAGES:
+    print('{:20s} {:12f} {:12f}'.format(name,
+                                        decode(rrc_gser, name, decoded),
+                                        decode(rrc_xer, name, decoded)))
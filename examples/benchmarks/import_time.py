@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+"""A performance example measuring the time it takes to import
+asn1tools using ``python -X importtime``. The codec modules, diskcache
+and prompt_toolkit are imported when first used, and are therefore
+not imported by ``import asn1tools``.
+
+Example execution:
+
+$ ./import_time.py
+Importing asn1tools 5 times. This may take a few seconds.
+
+MODULE                        TIME [ms]
+asn1tools                       118.385
+asn1tools.compiler               79.692
+asn1tools.parser                 59.432
+pyparsing                        43.941
+asn1tools.codecs.compiler         8.172
+asn1tools.codecs.uper                 -
+asn1tools.codecs.ber                  -
+diskcache                             -
+prompt_toolkit                        -
+$
+
+"""
+
+from __future__ import print_function
+
+import re
+import subprocess
+import sys
+
+
+ITERATIONS = 5
+MODULES = [
+    'asn1tools',
+    'asn1tools.compiler',
+    'asn1tools.parser',
+    'pyparsing',
+    'asn1tools.codecs.compiler',
+    'asn1tools.codecs.uper',
+    'asn1tools.codecs.ber',
+    'diskcache',
+    'prompt_toolkit'
+]
+IMPORT_TIME_RE = re.compile(r'import time:\s+\d+ \|\s+(\d+) \|\s+(\S+)')
+
+
+def import_asn1tools():
+    """Returns a dictionary of module name and cumulative import time in
+    microseconds.
+
+    """
+
+    output = subprocess.check_output(
+        [sys.executable, '-X', 'importtime', '-c', 'import asn1tools'],
+        stderr=subprocess.STDOUT,
+        universal_newlines=True)
+
+    return {
+        mo.group(2): int(mo.group(1))
+        for mo in IMPORT_TIME_RE.finditer(output)
+    }
+
+
+print('Importing asn1tools {} times. This may take a few seconds.'.format(
+    ITERATIONS))
+print()
+
+times = [import_asn1tools() for _ in range(ITERATIONS)]
+
+print('MODULE                        TIME [ms]')
+
+for module in MODULES:
+    module_times = [time[module] for time in times if module in time]
+
+    if module_times:
+        time = '{:.3f}'.format(min(module_times) / 1000)
+    else:
+        time = '-'
+
+    print('{:25s} {:>13s}'.format(module, time))
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+
+"""A performance example comparing JSON backends of the JER codec,
+using the message in codecs.py. Backends that are not installed are
+skipped.
+
+Example execution:
+
+$ ./jer_backends.py
+Starting encoding and decoding of a message 3000 times. This may take a few seconds.
+
+Encoding the message 3000 times took:
+
+BACKEND    SECONDS
+orjson     0.063690
+json       0.111947
+
+Decoding the message 3000 times took:
+
+BACKEND    SECONDS
+orjson     0.084406
+json       0.100296
+$
+
+"""
+
+from __future__ import print_function
+
+from datetime import datetime
+from importlib import import_module
+import timeit
+import asn1tools
+
+ITERATIONS = 3000
+
+BACKENDS = [
+    'json',
+    'orjson',
+    'rapidjson',
+    'simplejson',
+    'ujson'
+]
+
+
+def encode_decode(json_backend):
+    spec = asn1tools.compile_string(
+        'Ber DEFINITIONS ::= BEGIN '
+        '  A ::= SEQUENCE { '
+        '    a BOOLEAN, '
+        '    b INTEGER, '
+#        '    c REAL, '
+        '    d NULL, '
+        '    e BIT STRING, '
+        '    f OCTET STRING, '
+        '    g OBJECT IDENTIFIER, '
+        '    h ENUMERATED {a, b}, '
+        '    i SEQUENCE {}, '
+        '    j SEQUENCE OF NULL, '
+        '    k SET {}, '
+        '    l SET OF NULL, '
+        '    m CHOICE {a NULL}, '
+        '    n UTF8String, '
+        '    o UTCTime, '
+        '    p GeneralizedTime '
+        '} '
+        'END',
+        'jer',
+        json_backend=json_backend)
+
+    decoded = {
+        'a': True,
+        'b': 12345678,
+        # 'c': 3.14159,
+        'd': None,
+        'e': (b'\x11\x22\x33\x44\x55\x66\x77', 55),
+        'f': 10 * b'x11\x22\x33\x44\x55\x66\x77',
+        'g': '1.4.123.4325.23.1.44.22222',
+        'h': 'b',
+        'i': {},
+        'j': 5 * [None],
+        'k': {},
+        'l': 5 * [None],
+        'm': ('a', None),
+        'n': 40 * 'a',
+        'o': datetime(2018, 6, 13, 11, 1, 59),
+        'p': datetime(2018, 6, 13, 11, 1, 58, 5000)
+    }
+
+    encoded = spec.encode('A', decoded)
+
+    def encode():
+        spec.encode('A', decoded)
+
+    def decode():
+        spec.decode('A', encoded)
+
+    encode_time = timeit.timeit(encode, number=ITERATIONS)
+    decode_time = timeit.timeit(decode, number=ITERATIONS)
+
+    return encode_time, decode_time
+
+
+print('Starting encoding and decoding of a message {} times. This may '
+      'take a few seconds.'.format(ITERATIONS))
+
+encode_measurements = []
+decode_measurements = []
+
+for name in BACKENDS:
+    try:
+        json_backend = import_module(name)
+    except ImportError:
+        continue
+
+    # The standard library json module is the default backend.
+    if name == 'json':
+        json_backend = None
+
+    encode_time, decode_time = encode_decode(json_backend)
+    encode_measurements.append((name, encode_time))
+    decode_measurements.append((name, decode_time))
+
+# Encode comparison output.
+measurements = sorted(encode_measurements, key=lambda m: m[1])
+
+print()
+print('Encoding the message {} times took:'.format(ITERATIONS))
+print()
+print('BACKEND    SECONDS')
+
+for backend, seconds in measurements:
+    print('{:10s} {:f}'.format(backend, seconds))
+
+# Decode comparison output.
+measurements = sorted(decode_measurements, key=lambda m: m[1])
+
+print()
+print('Decoding the message {} times took:'.format(ITERATIONS))
+print()
+print('BACKEND    SECONDS')
+
+for backend, seconds in measurements:
+    print('{:10s} {:f}'.format(backend, seconds))
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+
+"""A performance example parsing ASN.1 specifications with a new
+grammar for each specification, the grammar shared by all parse
+calls, and the shared grammar with packrat memoization enabled.
+
+Example execution:
+
+$ ./parse.py
+Parsing ASN.1 specifications. This may take a minute.
+
+SPECIFICATION       NEW-GRAMMAR  SHARED-GRAMMAR  PACKRAT
+foo.asn                 0.03477         0.00198  0.00446
+rrc_8_6_0.asn           1.01717         0.97122  1.95363
+rrc_14_4_0.asn          4.81493         4.39427 10.07956
+s1ap_14_4_0.asn         4.48039         4.52796  4.89096
+lpp_14_3_0.asn          1.29926         1.08723  1.85247
+$
+
+"""
+
+from __future__ import print_function
+
+import os
+import timeit
+from pyparsing import ParserElement
+from asn1tools import parser
+
+
+SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))
+TESTS_FILES_DIR = os.path.realpath(os.path.join(SCRIPT_DIR,
+                                                '..',
+                                                '..',
+                                                'tests',
+                                                'files'))
+SPECIFICATIONS = [
+    'foo.asn',
+    os.path.join('3gpp', 'rrc_8_6_0.asn'),
+    os.path.join('3gpp', 'rrc_14_4_0.asn'),
+    os.path.join('3gpp', 's1ap_14_4_0.asn'),
+    os.path.join('3gpp', 'lpp_14_3_0.asn')
+]
+
+
+def parse_new_grammar(string):
+    def parse():
+        parser.create_grammar().parseString(parser.ignore_comments(string))
+
+    return min(timeit.repeat(parse, number=1, repeat=3))
+
+
+def parse_shared_grammar(string):
+    def parse():
+        parser.get_grammar().parseString(parser.ignore_comments(string))
+
+    return min(timeit.repeat(parse, number=1, repeat=3))
+
+
+def disable_packrat():
+    try:
+        ParserElement.disable_memoization()
+    except AttributeError:
+        # pyparsing 2.
+        ParserElement._packratEnabled = False
+        ParserElement._parse = ParserElement._parseNoCache
+
+
+def parse_packrat(string):
+    ParserElement.enablePackrat()
+
+    try:
+        return parse_shared_grammar(string)
+    finally:
+        disable_packrat()
+
+
+print('Parsing ASN.1 specifications. This may take a minute.')
+print()
+print('SPECIFICATION       NEW-GRAMMAR  SHARED-GRAMMAR  PACKRAT')
+
+for specification in SPECIFICATIONS:
+    with open(os.path.join(TESTS_FILES_DIR, specification)) as fin:
+        string = fin.read()
+
+    print('{:19s} {:11.5f} {:15.5f} {:8.5f}'.format(
+        os.path.basename(specification),
+        parse_new_grammar(string),
+        parse_shared_grammar(string),
+        parse_packrat(string)))
@@ -0,0 +1,191 @@
+"""RRC 8.6.0 messages shared by the benchmarks decoding RRC messages
+with different codecs.
+
+"""
+
+import os
+
+
+SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))
+RRC_8_6_0_ASN_PATH = os.path.realpath(os.path.join(SCRIPT_DIR,
+                                                   '..',
+                                                   '..',
+                                                   'tests',
+                                                   'files',
+                                                   '3gpp',
+                                                   'rrc_8_6_0.asn'))
+
+SYSTEM_INFORMATION = {
+    'message': (
+        'c1',
+        (
+            'systemInformation',
+            {
+                'criticalExtensions': (
+                    'systemInformation-r8',
+                    {
+                        'sib-TypeAndInfo': [
+                            (
+                                'sib2',
+                                {
+                                    'ac-BarringInfo': {
+                                        'ac-BarringForEmergency': True,
+                                        'ac-BarringForMO-Data': {
+                                            'ac-BarringFactor': 'p95',
+                                            'ac-BarringTime': 's128',
+                                            'ac-BarringForSpecialAC': (b'\xf0', 5)
+                                        }
+                                    },
+                                    'radioResourceConfigCommon': {
+                                        'rach-ConfigCommon': {
+                                            'preambleInfo': {
+                                                'numberOfRA-Preambles': 'n24',
+                                                'preamblesGroupAConfig': {
+                                                    'sizeOfRA-PreamblesGroupA': 'n28',
+                                                    'messageSizeGroupA': 'b144',
+                                                    'messagePowerOffsetGroupB': 'minusinfinity'
+                                                }
+                                            },
+                                            'powerRampingParameters': {
+                                                'powerRampingStep': 'dB0',
+                                                'preambleInitialReceivedTargetPower': 'dBm-102'
+                                            },
+                                            'ra-SupervisionInfo': {
+                                                'preambleTransMax': 'n8',
+                                                'ra-ResponseWindowSize': 'sf6',
+                                                'mac-ContentionResolutionTimer': 'sf48'
+                                            },
+                                            'maxHARQ-Msg3Tx': 8
+                                        },
+                                        'bcch-Config': {
+                                            'modificationPeriodCoeff': 'n2'
+                                        },
+                                        'pcch-Config': {
+                                            'defaultPagingCycle': 'rf256',
+                                            'nB': 'twoT'
+                                        },
+                                        'prach-Config': {
+                                            'rootSequenceIndex': 836,
+                                            'prach-ConfigInfo': {
+                                                'prach-ConfigIndex': 33,
+                                                'highSpeedFlag': False,
+                                                'zeroCorrelationZoneConfig': 10,
+                                                'prach-FreqOffset': 64
+                                            }
+                                        },
+                                        'pdsch-ConfigCommon': {
+                                            'referenceSignalPower': -60,
+                                            'p-b': 2
+                                        },
+                                        'pusch-ConfigCommon': {
+                                            'pusch-ConfigBasic': {
+                                                'n-SB': 1,
+                                                'hoppingMode': 'interSubFrame',
+                                                'pusch-HoppingOffset': 10,
+                                                'enable64QAM': False
+                                            },
+                                            'ul-ReferenceSignalsPUSCH': {
+                                                'groupHoppingEnabled': True,
+                                                'groupAssignmentPUSCH': 22,
+                                                'sequenceHoppingEnabled': False,
+                                                'cyclicShift': 5
+                                            }
+                                        },
+                                        'pucch-ConfigCommon': {
+                                            'deltaPUCCH-Shift': 'ds1',
+                                            'nRB-CQI': 98,
+                                            'nCS-AN': 4,
+                                            'n1PUCCH-AN': 2047
+                                        },
+                                        'soundingRS-UL-ConfigCommon': (
+                                            'setup',
+                                            {
+                                                'srs-BandwidthConfig': 'bw0',
+                                                'srs-SubframeConfig': 'sc4',
+                                                'ackNackSRS-SimultaneousTransmission': True
+                                            }),
+                                        'uplinkPowerControlCommon': {
+                                            'p0-NominalPUSCH': -126,
+                                            'alpha': 'al0',
+                                            'p0-NominalPUCCH': -127,
+                                            'deltaFList-PUCCH': {
+                                                'deltaF-PUCCH-Format1': 'deltaF-2',
+                                                'deltaF-PUCCH-Format1b': 'deltaF1',
+                                                'deltaF-PUCCH-Format2': 'deltaF0',
+                                                'deltaF-PUCCH-Format2a': 'deltaF-2',
+                                                'deltaF-PUCCH-Format2b': 'deltaF0'
+                                            },
+                                            'deltaPreambleMsg3': -1
+                                        },
+                                        'ul-CyclicPrefixLength': 'len1'
+                                    },
+                                    'ue-TimersAndConstants': {
+                                        't300': 'ms100',
+                                        't301': 'ms200',
+                                        't310': 'ms50',
+                                        'n310': 'n2',
+                                        't311': 'ms30000',
+                                        'n311': 'n2'
+                                    },
+                                    'freqInfo': {
+                                        'additionalSpectrumEmission': 3
+                                    },
+                                    'timeAlignmentTimerCommon': 'sf500'
+                                }
+                            ),
+                            (
+                                'sib3',
+                                {
+                                    'cellReselectionInfoCommon': {
+                                        'q-Hyst': 'dB0',
+                                        'speedStateReselectionPars': {
+                                            'mobilityStateParameters': {
+                                                't-Evaluation': 's180',
+                                                't-HystNormal': 's180',
+                                                'n-CellChangeMedium': 1,
+                                                'n-CellChangeHigh': 16
+                                            },
+                                            'q-HystSF': {
+                                                'sf-Medium': 'dB-6',
+                                                'sf-High': 'dB-4'
+                                            }
+                                        }
+                                    },
+                                    'cellReselectionServingFreqInfo': {
+                                        'threshServingLow': 7,
+                                        'cellReselectionPriority': 3
+                                    },
+                                    'intraFreqCellReselectionInfo': {
+                                        'q-RxLevMin': -33,
+                                        's-IntraSearch': 0,
+                                        'presenceAntennaPort1': False,
+                                        'neighCellConfig': (b'\x80', 2),
+                                        't-ReselectionEUTRA': 4
+                                    }
+                                }
+                            )
+                        ]
+                    }
+                )
+            }
+        )
+    )
+}
+
+
+MASTER_INFORMATION_BLOCK = {
+    'message': {
+        'dl-Bandwidth': 'n6',
+        'phich-Config': {
+            'phich-Duration': 'normal',
+            'phich-Resource': 'half'
+        },
+        'systemFrameNumber': (b'\x12', 8),
+        'spare': (b'\x34\x40', 10)
+    }
+}
+
+MESSAGES = [
+    ('BCCH-DL-SCH-Message', SYSTEM_INFORMATION),
+    ('BCCH-BCH-Message', MASTER_INFORMATION_BLOCK)
+]
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+
+"""A performance example decoding RRC 8.6.0 messages encoded using
+XER, with and without indexing of SEQUENCE and SET member elements by
+name.
+
+Example execution:
+
+$ ./xer_decode.py
+Decoding RRC 8.6.0 messages 1000 times. This may take a few seconds.
+
+MESSAGE              INDEX-SECONDS  FIND-SECONDS
+BCCH-DL-SCH-Message       0.238069      0.298321
+BCCH-BCH-Message          0.024673      0.025476
+$
+
+"""
+
+from __future__ import print_function
+
+import timeit
+import asn1tools
+from asn1tools.codecs import xer
+
+from rrc_8_6_0 import RRC_8_6_0_ASN_PATH
+from rrc_8_6_0 import MESSAGES
+
+
+ITERATIONS = 1000
+
+
+def decode(rrc, name, decoded):
+    encoded = rrc.encode(name, decoded)
+
+    def decode():
+        rrc.decode(name, encoded)
+
+    return timeit.timeit(decode, number=ITERATIONS)
+
+
+print('Decoding RRC 8.6.0 messages {} times. This may take a few '
+      'seconds.'.format(ITERATIONS))
+
+rrc_dict = asn1tools.parse_files(RRC_8_6_0_ASN_PATH)
+rrc = asn1tools.compile_dict(rrc_dict, 'xer')
+
+# Compile again without indexing of member elements to compare.
+maximum_number_of_members = xer.FIND_MEMBER_ELEMENTS_MAXIMUM_NUMBER_OF_MEMBERS
+xer.FIND_MEMBER_ELEMENTS_MAXIMUM_NUMBER_OF_MEMBERS = float('inf')
+rrc_find = asn1tools.compile_dict(rrc_dict, 'xer')
+xer.FIND_MEMBER_ELEMENTS_MAXIMUM_NUMBER_OF_MEMBERS = maximum_number_of_members
+
+print()
+print('MESSAGE              INDEX-SECONDS  FIND-SECONDS')
+
+for name, decoded in MESSAGES:
+    print('{:20s} {:13f} {:13f}'.format(name,
+                                        decode(rrc, name, decoded),
+                                        decode(rrc_find, name, decoded)))
@@ -11,6 +11,7 @@ from .utils import Asn1ToolsBaseTest
 
 import asn1tools
 from asn1tools.codecs import utc_time_to_datetime as ut2dt
+from asn1tools.codecs.ber import encode_length_definite
 from asn1tools.compat import timezone
 from asn1tools.compat import timedelta
 
@@ -1109,6 +1110,257 @@ class Asn1ToolsBerTest(Asn1ToolsBaseTest):
         for encoded in datas:
             self.assertIsNone(foo.decode_length(encoded))
 
+    def test_iter_decode(self):
+        foo = asn1tools.compile_files('tests/files/foo.asn')
+
+        encoded = (
+            b'\x30\x0e\x02\x01\x01\x16\x09Is 1+1=3?'
+            b'\x30\x11\x02\x02\x01\x00\x16\x0bIs 1+10=14?'
+            b'\x30\x0e\x02\x01\x01'
+        )
+        expected = [
+            ({'id': 1, 'question': 'Is 1+1=3?'}, 0, 16),
+            ({'id': 256, 'question': 'Is 1+10=14?'}, 16, 35)
+        ]
+
+        # The trailing partial message is not decoded.
+        for data in [encoded, bytearray(encoded), memoryview(encoded)]:
+            self.assertEqual(list(foo.iter_decode('Question', data)),
+                             expected)
+
+        self.assertEqual(list(foo.iter_decode('Question', b'')), [])
+        self.assertEqual(list(foo.iter_decode('Question', b'\x30')), [])
+
+        # Resume at the end offset of the last message.
+        encoded += b'\x16\x09Is 1+1=3?'
+        messages = list(foo.iter_decode('Question',
+                                        memoryview(encoded)[35:]))
+        self.assertEqual(messages,
+                         [({'id': 1, 'question': 'Is 1+1=3?'}, 0, 16)])
+
+        # Malformed message.
+        with self.assertRaises(asn1tools.DecodeError) as cm:
+            list(foo.iter_decode('Question',
+                                 b'\x30\x0e\x02\x01\x01\x16\x09Is 1+1=3?'
+                                 b'\x30\x0e\x02\x02\x01\x16\x09Is 1+1=3?'))
+
+        self.assertEqual(
+            str(cm.exception),
+            "question: Expected IA5String with tag '16' at offset 6, but got '09'.")
+
+    def test_validate(self):
+        foo = asn1tools.compile_files('tests/files/foo.asn')
+
+        # Well-formed encodings.
+        datas = [
+            ('Question', b'\x30\x0e\x02\x01\x01\x16\x09Is 1+1=3?'),
+            ('Answer', b'\x30\x06\x02\x01\x01\x01\x01\x00'),
+            ('Answer', b'\x30\x06\x02\x01\x01\x01\x01\x01')
+        ]
+
+        for type_name, encoded in datas:
+            self.assertIsNone(foo.validate(type_name, encoded))
+
+        # Malformed encodings.
+        datas = [
+            ('Question',
+             b'\x30\x0e\x02\x01\x01\x16\x0aIs 1+1=3?',
+             ['question'],
+             'question: Expected at least 10 contents byte(s) at offset 7, '
+             'but got 9.'),
+            ('Question',
+             b'\x30\x0e\x02\x02\x01\x16\x09Is 1+1=3?',
+             ['question'],
+             "question: Expected IA5String with tag '16' at offset 6, but "
+             "got '09'."),
+            ('Answer',
+             b'\x30\x07\x02\x01\x01\x01\x02\x00\x00',
+             ['answer'],
+             'answer: Expected BOOLEAN contents length 1 at offset 6, but '
+             'got 2.'),
+            ('Question',
+             b'\x30',
+             [],
+             'out of data')
+        ]
+
+        for type_name, encoded, location, message in datas:
+            with self.assertRaises(asn1tools.DecodeError) as cm:
+                foo.validate(type_name, encoded)
+
+            self.assertEqual(cm.exception.location, location)
+            self.assertEqual(str(cm.exception), message)
+
+            # Same error location when decoding.
+            if location:
+                with self.assertRaises(asn1tools.DecodeError) as cm:
+                    foo.decode(type_name, encoded)
+
+                self.assertEqual(cm.exception.location, location)
+
+        # Constructed strings and choices.
+        all_types = asn1tools.compile_files('tests/files/all_types.asn')
+        all_types.validate('Octetstring',
+                           b'\x24\x80\x04\x01\x00\x24\x80\x04\x01\x01'
+                           b'\x00\x00\x00\x00')
+
+        with self.assertRaises(asn1tools.DecodeError) as cm:
+            all_types.validate('Octetstring',
+                               b'\x24\x06\x04\x01\x00\x04\x01\x01',
+                               canonical=True)
+
+        self.assertEqual(
+            str(cm.exception),
+            'Expected OCTET STRING with primitive encoding at offset 0.')
+
+        # Canonical encoding rules.
+        datas = [
+            (b'\x30\x81\x0e\x02\x01\x01\x16\x09Is 1+1=3?',
+             'Expected length encoded in minimum number of octets at '
+             'offset 1.'),
+            (b'\x30\x0f\x02\x02\x00\x01\x16\x09Is 1+1=3?',
+             'id: Expected integer encoded in minimum number of octets at '
+             'offset 4.')
+        ]
+
+        for encoded, message in datas:
+            foo.validate('Question', encoded)
+
+            with self.assertRaises(asn1tools.DecodeError) as cm:
+                foo.validate('Question', encoded, canonical=True)
+
+            self.assertEqual(str(cm.exception), message)
+
+        with self.assertRaises(asn1tools.DecodeError) as cm:
+            foo.validate('Answer',
+                         b'\x30\x06\x02\x01\x01\x01\x01\x01',
+                         canonical=True)
+
+        self.assertEqual(
+            str(cm.exception),
+            'answer: Expected BOOLEAN contents 0x00 or 0xff at offset 7, but '
+            'got 0x01.')
+
+        # Indefinite length SEQUENCE, SET, SEQUENCE OF and SET OF
+        # encodings can not be decoded, and are therefore rejected.
+        foo = asn1tools.compile_string(
+            "Foo DEFINITIONS AUTOMATIC TAGS ::= "
+            "BEGIN "
+            "A ::= SEQUENCE { "
+            "  a SEQUENCE OF INTEGER, "
+            "  b INTEGER "
+            "} "
+            "B ::= SET OF INTEGER "
+            "END")
+
+        datas = [
+            ('A',
+             b'\x30\x80\xa0\x00\x81\x01\x01\x00\x00',
+             [],
+             'Expected definite length at offset 1, but got indefinite.'),
+            ('A',
+             b'\x30\x07\xa0\x80\x00\x00\x81\x01\x01',
+             ['a'],
+             'a: Expected definite length at offset 3, but got indefinite.'),
+            ('B',
+             b'\x31\x80\x02\x01\x01\x00\x00',
+             [],
+             'Expected definite length at offset 1, but got indefinite.')
+        ]
+
+        for type_name, encoded, location, message in datas:
+            for canonical in [False, True]:
+                with self.assertRaises(asn1tools.DecodeError) as cm:
+                    foo.validate(type_name, encoded, canonical=canonical)
+
+                self.assertEqual(cm.exception.location, location)
+                self.assertEqual(str(cm.exception), message)
+
+    def test_decode_limits(self):
+        foo = asn1tools.compile_string(
+            "Foo DEFINITIONS AUTOMATIC TAGS ::= "
+            "BEGIN "
+            "A ::= CHOICE { "
+            "  a A, "
+            "  b SEQUENCE OF INTEGER "
+            "} "
+            "B ::= SEQUENCE { "
+            "  a A OPTIONAL, "
+            "  b INTEGER OPTIONAL "
+            "} "
+            "END")
+
+        datas = [
+            ('A', ('b', [1, 2, 3]), b'\xa1\x09\x02\x01\x01\x02\x01\x02\x02\x01\x03'),
+            ('A', ('a', ('a', ('b', []))), b'\xa0\x04\xa0\x02\xa1\x00'),
+            ('B',
+             {'a': ('a', ('b', [1])), 'b': 5},
+             b'\x30\x0c\xa0\x07\xa0\x05\xa1\x03\x02\x01\x01\x81\x01\x05')
+        ]
+
+        for type_name, decoded, encoded in datas:
+            self.assertEqual(foo.decode(type_name,
+                                        encoded,
+                                        maximum_depth=4,
+                                        maximum_number_of_elements=6),
+                             decoded)
+
+        # Limits are not handled as errors in optional members.
+        encoded = b'\x30\x0c\xa0\x07\xa0\x05\xa1\x03\x02\x01\x01\x81\x01\x05'
+
+        with self.assertRaises(asn1tools.DecodeError) as cm:
+            foo.decode('B', encoded, maximum_depth=2)
+
+        self.assertEqual(str(cm.exception),
+                         'Expected at most 2 nesting levels.')
+
+        with self.assertRaises(asn1tools.DecodeError) as cm:
+            foo.decode('B', encoded, maximum_number_of_elements=4)
+
+        self.assertEqual(
+            str(cm.exception),
+            'Expected at most 4 elements, but got more at offset 8.')
+
+        with self.assertRaises(asn1tools.DecodeError) as cm:
+            foo.decode('B', encoded, maximum_string_length=10)
+
+        self.assertEqual(str(cm.exception),
+                         'String length limit is not supported for this codec.')
+
+        # Indefinite length SEQUENCE and SEQUENCE OF are not supported.
+        datas = [
+            ('B',
+             b'\x30\x80\x81\x01\x05\x00\x00',
+             [],
+             'Expected definite length at offset 1, but got indefinite.'),
+            ('A',
+             b'\xa0\x04\xa1\x80\x00\x00',
+             [],
+             'Expected definite length at offset 3, but got indefinite.')
+        ]
+
+        for type_name, encoded, location, message in datas:
+            with self.assertRaises(asn1tools.DecodeError) as cm:
+                foo.decode(type_name, encoded, maximum_depth=3)
+
+            self.assertEqual(cm.exception.location, location)
+            self.assertEqual(str(cm.exception), message)
+
+        # Nesting deeper than the Python recursion limit.
+        depth = sys.getrecursionlimit()
+        encoded = bytearray(b'\xa1\x00')
+
+        for _ in range(depth):
+            encoded = b'\xa0' + encode_length_definite(len(encoded)) + encoded
+
+        decoded = foo.decode('A', encoded, maximum_depth=depth + 1)
+
+        for _ in range(depth):
+            self.assertEqual(decoded[0], 'a')
+            decoded = decoded[1]
+
+        self.assertEqual(decoded, ('b', []))
+
     def test_complex(self):
         cmplx = asn1tools.compile_files('tests/files/complex.asn')
 
@@ -72,6 +72,32 @@ class Asn1ToolsCommandLineTest(unittest.TestCase):
 
         self.assertEqual(expected_output, stdout.getvalue())
 
+    def test_command_line_convert_jer_json_backend(self):
+        argv = [
+            'asn1tools',
+            'convert',
+            '--output-codec', 'jer',
+            '--json-backend', 'json',
+            'tests/files/foo.asn',
+            'Question',
+            '300e0201011609497320312b313d333f'
+        ]
+
+        expected_output = (
+            '{\n'
+            '    "id": 1,\n'
+            '    "question": "Is 1+1=3?"\n'
+            '}\n'
+        )
+
+        stdout = StringIO()
+
+        with patch('sys.stdout', stdout):
+            with patch('sys.argv', argv):
+                asn1tools._main()
+
+        self.assertEqual(expected_output, stdout.getvalue())
+
     def test_command_line_convert_ber_foo_question_stdin(self):
         argv = [
             'asn1tools',
@@ -474,6 +500,48 @@ ff0e0201011609497320312b313d333f
 
         self.assertEqual(expected_output, stdout.getvalue())
 
+    def test_command_line_convert_bin(self):
+        # Preparations.
+        argv = [
+            'asn1tools',
+            'parse',
+            '--format', 'bin',
+            'tests/files/foo.asn',
+            'test_command_line_convert_bin.bin'
+        ]
+
+        if os.path.exists('test_command_line_convert_bin.bin'):
+            os.remove('test_command_line_convert_bin.bin')
+
+        with patch('sys.argv', argv):
+            asn1tools._main()
+
+        # Test convert.
+        argv = [
+            'asn1tools',
+            'convert',
+            'test_command_line_convert_bin.bin',
+            'Question',
+            '300e0201011609497320312b313d333f'
+        ]
+
+        expected_output = (
+            'question Question ::= {\n'
+            '    id 1,\n'
+            '    question "Is 1+1=3?"\n'
+            '}\n'
+        )
+
+        stdout = StringIO()
+
+        with patch('sys.stdout', stdout):
+            with patch('sys.argv', argv):
+                asn1tools._main()
+
+        print(stdout.getvalue())
+
+        self.assertEqual(expected_output, stdout.getvalue())
+
     def test_command_line_convert_py_too_many_files(self):
         argv = [
             'asn1tools',
@@ -493,7 +561,7 @@ ff0e0201011609497320312b313d333f
 
                 self.assertEqual(
                     str(cm.exception),
-                    "error: Expected one .py-file, but got 2.")
+                    "error: Expected one .py-file or binary file, but got 2.")
 
     def test_command_line_shell(self):
         argv = ['asn1tools', 'shell']
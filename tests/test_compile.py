@@ -1,6 +1,10 @@
 import sys
+import pickle
+import subprocess
+import threading
 import unittest
 import asn1tools
+import diskcache
 from copy import deepcopy
 import shutil
 import os
@@ -172,6 +176,264 @@ class Asn1ToolsCompileTest(unittest.TestCase):
 
         self.assertEqual(encoded, encoded_cached)
 
+    def test_cache_keys(self):
+        """The compiled specification is cached per codec and codec
+        options, and parse results per module.
+
+        """
+
+        cache_dir = 'test_cache'
+        filename = 'test_compile_cache_keys.asn'
+
+        if os.path.exists(cache_dir):
+            shutil.rmtree(cache_dir)
+
+        with open('tests/files/bar.asn') as fin:
+            bar = fin.read()
+
+        with open(filename, 'w') as fout:
+            fout.write(bar)
+
+        def cache_keys():
+            cache = diskcache.Cache(cache_dir)
+            keys = [key.split('-')[0] for key in cache]
+            cache.close()
+
+            return sorted(keys)
+
+        filenames = ['tests/files/foo.asn', filename]
+
+        try:
+            asn1tools.compile_files(filenames, cache_dir=cache_dir)
+            self.assertEqual(cache_keys(), ['compiled', 'parsed', 'parsed'])
+            asn1tools.compile_files(filenames, cache_dir=cache_dir)
+            self.assertEqual(cache_keys(), ['compiled', 'parsed', 'parsed'])
+
+            # Other codec options.
+            asn1tools.compile_files(filenames, 'uper', cache_dir=cache_dir)
+            asn1tools.compile_files(filenames,
+                                    'uper',
+                                    cache_dir=cache_dir,
+                                    numeric_enums=True)
+            self.assertEqual(cache_keys(),
+                             3 * ['compiled'] + 2 * ['parsed'])
+
+            # Only the changed module is parsed again.
+            with open(filename, 'w') as fout:
+                fout.write(bar.replace('END', 'B ::= BOOLEAN END'))
+
+            bar = asn1tools.compile_files(filenames, cache_dir=cache_dir)
+            self.assertEqual(cache_keys(),
+                             4 * ['compiled'] + 3 * ['parsed'])
+            self.assertEqual(bar.encode('B', True), b'\x01\x01\xff')
+        finally:
+            os.remove(filename)
+
+    def test_shared_types(self):
+        foo = asn1tools.compile_string(
+            'Foo DEFINITIONS AUTOMATIC TAGS ::= BEGIN '
+            'A ::= SEQUENCE { a B, b B OPTIONAL } '
+            'B ::= SEQUENCE { c INTEGER } '
+            'END',
+            'uper')
+
+        # Members of the same type share everything but name, optional
+        # and default.
+        a, b = foo.types['A'].type.root_members
+        self.assertEqual((a.name, a.optional), ('a', False))
+        self.assertEqual((b.name, b.optional), ('b', True))
+        self.assertIs(a.root_members, foo.types['B'].type.root_members)
+        self.assertIs(b.root_members, foo.types['B'].type.root_members)
+
+    def test_pickle(self):
+        decoded = {'id': 1, 'question': 'Is 1+1=3?'}
+
+        for codec in ['ber', 'der', 'gser', 'jer', 'oer', 'per', 'uper', 'xer']:
+            foo = asn1tools.compile_files('tests/files/all_types.asn', codec)
+            unpickled = pickle.loads(pickle.dumps(foo))
+
+            for name in foo.types:
+                self.assertEqual(repr(unpickled.types[name]),
+                                 repr(foo.types[name]))
+
+            # Compiled types have no instance dictionary.
+            with self.assertRaises(AttributeError):
+                foo.types['Sequence3'].type.__dict__
+
+            foo = asn1tools.compile_files('tests/files/foo.asn', codec)
+            unpickled = pickle.loads(pickle.dumps(foo))
+            self.assertEqual(unpickled.encode('Question', decoded),
+                             foo.encode('Question', decoded))
+
+    def test_import(self):
+        # Codecs, diskcache and prompt_toolkit are imported on first
+        # use.
+        modules = subprocess.check_output(
+            [sys.executable,
+             '-c',
+             'import sys, asn1tools; print(" ".join(sorted(sys.modules)))'],
+            universal_newlines=True).split()
+
+        for module in ['asn1tools.codecs.ber',
+                       'asn1tools.codecs.type_checker',
+                       'diskcache',
+                       'prompt_toolkit']:
+            self.assertNotIn(module, modules)
+
+    def test_lazy(self):
+        spec = (
+            'Foo DEFINITIONS AUTOMATIC TAGS ::= BEGIN '
+            'A ::= SEQUENCE { a B } '
+            'B ::= CHOICE { b A, c NULL } '
+            'C ::= INTEGER (0..5) '
+            'D ::= Undefined '
+            'END'
+        )
+        decoded = {'a': ('b', {'a': ('c', None)})}
+
+        for codec in ['ber', 'der', 'gser', 'jer', 'oer', 'per', 'uper', 'xer']:
+            with self.assertRaises(asn1tools.CompileError):
+                asn1tools.compile_string(spec, codec)
+
+            eager = asn1tools.compile_string(spec.replace('Undefined', 'NULL'),
+                                             codec)
+            lazy = asn1tools.compile_string(spec, codec, lazy=True)
+            self.assertEqual(list(lazy.types), ['A', 'B', 'C', 'D'])
+            self.assertEqual(list(lazy.modules['Foo']), ['A', 'B', 'C', 'D'])
+
+            # Compile the recursive types in reverse order.
+            self.assertEqual(lazy.encode('B', decoded['a']),
+                             eager.encode('B', decoded['a']))
+            self.assertIs(lazy.types['B'], lazy.modules['Foo']['B'])
+            encoded = lazy.encode('A', decoded)
+            self.assertEqual(encoded, eager.encode('A', decoded))
+            self.assertEqual(lazy.decode('A', encoded), decoded)
+
+            # Type and constraints checkers.
+            with self.assertRaises(asn1tools.EncodeError):
+                lazy.encode('C', None)
+
+            with self.assertRaises(asn1tools.ConstraintsError):
+                lazy.encode('C', 6, check_constraints=True)
+
+            with self.assertRaises(asn1tools.CompileError):
+                lazy.types['D']
+
+    def test_lazy_threads(self):
+        foo = asn1tools.compile_files('tests/files/3gpp/rrc_8_6_0.asn',
+                                      'uper',
+                                      lazy=True)
+        names = 4 * ['DL-DCCH-Message', 'UL-DCCH-Message', 'BCCH-BCH-Message']
+        results = [None] * len(names)
+
+        def compile_type(index, name):
+            results[index] = foo.types[name]
+
+        threads = [
+            threading.Thread(target=compile_type, args=(index, name))
+            for index, name in enumerate(names)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        for name, result in zip(names, results):
+            self.assertIs(result, foo.types[name])
+
+    def test_roots(self):
+        spec = (
+            'A DEFINITIONS AUTOMATIC TAGS ::= BEGIN '
+            'IMPORTS C FROM B; '
+            'Root ::= SEQUENCE { a Sub, COMPONENTS OF Base, c C } '
+            'Sub ::= INTEGER (0..max-sub) '
+            'Base ::= SEQUENCE { b BOOLEAN } '
+            'Unused ::= SEQUENCE { a Unused2 } '
+            'Unused2 ::= INTEGER (0..max-unused) '
+            'max-sub INTEGER ::= 5 '
+            'max-unused INTEGER ::= 6 '
+            'END '
+            'B DEFINITIONS ::= BEGIN '
+            'C ::= OCTET STRING '
+            'D ::= NULL '
+            'END'
+        )
+        decoded = {'a': 5, 'b': True, 'c': b'\x12'}
+
+        for codec in ['ber', 'jer', 'uper']:
+            foo = asn1tools.compile_string(spec, codec)
+            pruned = asn1tools.compile_string(spec, codec, roots=['Root'])
+            self.assertEqual(sorted(pruned.types), ['Base', 'C', 'Root', 'Sub'])
+            self.assertEqual(pruned.encode('Root', decoded),
+                             foo.encode('Root', decoded))
+
+            with self.assertRaises(asn1tools.ConstraintsError):
+                pruned.encode('Root',
+                              {'a': 6, 'b': True, 'c': b''},
+                              check_constraints=True)
+
+        # Information object classes and sets.
+        pruned = asn1tools.pre_process_dict(
+            asn1tools.parse_files('tests/files/information_object.asn'),
+            roots=['ItemWithConstraints'])
+        actual = {
+            module_name: {
+                section: sorted(module[section])
+                for section in ['types', 'values', 'object-classes', 'object-sets']
+            }
+            for module_name, module in pruned.items()
+        }
+        expected = {
+            'InformationObject': {
+                'types': ['InnerSequence', 'ItemWithConstraints'],
+                'values': ['innerItem0'],
+                'object-classes': ['INNER-ITEM'],
+                'object-sets': ['InnerItems', 'Items']
+            },
+            'InformationObjectClass': {
+                'types': ['String'],
+                'values': [],
+                'object-classes': ['ITEM'],
+                'object-sets': []
+            }
+        }
+        self.assertEqual(actual, expected)
+
+        with self.assertRaises(asn1tools.CompileError) as cm:
+            asn1tools.compile_string(spec, roots=['Missing'])
+
+        self.assertEqual(str(cm.exception),
+                         "Type 'Missing' not found in any module.")
+
+    def test_codecs(self):
+        specs = asn1tools.compile_files('tests/files/foo.asn',
+                                        codecs=['ber', 'uper', 'jer'])
+        self.assertEqual(sorted(specs), ['ber', 'jer', 'uper'])
+        decoded = {'id': 1, 'question': 'Is 1+1=3?'}
+
+        for codec, spec in specs.items():
+            foo = asn1tools.compile_files('tests/files/foo.asn', codec)
+            self.assertEqual(spec.encode('Question', decoded),
+                             foo.encode('Question', decoded))
+
+        # Checkers are compiled once and shared by all codecs.
+        self.assertIs(specs['ber'].types['Question'].type_checker,
+                      specs['uper'].types['Question'].type_checker)
+
+        # Lazy compilation.
+        specs = asn1tools.compile_files('tests/files/foo.asn',
+                                        codecs=['ber', 'uper'],
+                                        lazy=True)
+        self.assertEqual(specs['uper'].encode('Question', decoded),
+                         b'\x01\x01\x09\x93\xcd\x03\x15\x6c\x5e\xb3\x7e')
+
+        with self.assertRaises(asn1tools.CompileError) as cm:
+            asn1tools.compile_files('tests/files/foo.asn', codecs=['foo'])
+
+        self.assertEqual(str(cm.exception), "Unsupported codec 'foo'.")
+
 
 if __name__ == '__main__':
     unittest.main()
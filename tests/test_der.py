@@ -386,6 +386,95 @@ class Asn1ToolsDerTest(Asn1ToolsBaseTest):
         for encoded in datas:
             self.assertIsNone(foo.decode_length(encoded))
 
+    def test_validate(self):
+        foo = asn1tools.compile_string(
+            "Foo DEFINITIONS AUTOMATIC TAGS ::= "
+            "BEGIN "
+            "A ::= SET OF INTEGER "
+            "B ::= SEQUENCE { "
+            "  a BIT STRING, "
+            "  b OCTET STRING "
+            "} "
+            "END",
+            'der')
+
+        # Well-formed encodings.
+        datas = [
+            ('A', b'\x31\x06\x02\x01\x01\x02\x01\x02'),
+            ('B', b'\x30\x07\x80\x02\x07\x80\x81\x01\x12')
+        ]
+
+        for type_name, encoded in datas:
+            foo.validate(type_name, encoded)
+            foo.validate(type_name, encoded, canonical=True)
+
+        # Only malformed according to the canonical encoding rules.
+        datas = [
+            ('A',
+             b'\x31\x06\x02\x01\x02\x02\x01\x01',
+             'Expected SET OF elements sorted by their encodings at offset 5.'),
+            ('B',
+             b'\x30\x07\x80\x02\x07\x81\x81\x01\x12',
+             'a: Expected unused bits set to zero at offset 5.')
+        ]
+
+        for type_name, encoded, message in datas:
+            foo.validate(type_name, encoded)
+
+            with self.assertRaises(asn1tools.DecodeError) as cm:
+                foo.validate(type_name, encoded, canonical=True)
+
+            self.assertEqual(str(cm.exception), message)
+
+        # Constructed encodings are not allowed.
+        with self.assertRaises(asn1tools.DecodeError) as cm:
+            foo.validate('B', b'\x30\x09\x80\x02\x07\x80\xa1\x03\x04\x01\x12')
+
+        self.assertEqual(
+            str(cm.exception),
+            "b: Expected OCTET STRING with tag '81' at offset 6, but got 'a1'.")
+
+        # Indefinite length is not allowed.
+        for type_name, encoded in [('A', b'\x31\x80\x02\x01\x01\x00\x00'),
+                                   ('B', b'\x30\x80\x80\x01\x00\x81\x00'
+                                         b'\x00\x00')]:
+            for canonical in [False, True]:
+                with self.assertRaises(asn1tools.DecodeError) as cm:
+                    foo.validate(type_name, encoded, canonical=canonical)
+
+                self.assertEqual(
+                    str(cm.exception),
+                    'Expected definite length at offset 1, but got indefinite.')
+
+    def test_set_of_sorting(self):
+        foo = asn1tools.compile_string(
+            "Foo DEFINITIONS AUTOMATIC TAGS ::= "
+            "BEGIN "
+            "A ::= SET OF INTEGER "
+            "B ::= SET OF OCTET STRING "
+            "C ::= SET OF IA5String "
+            "END",
+            'der')
+
+        # Elements are sorted by their encodings, not by their values.
+        datas = [
+            ('A',
+             [256, -1, 2, 1],
+             b'\x31\x0d\x02\x01\x01\x02\x01\x02\x02\x01\xff\x02\x02\x01\x00'),
+            ('A', [5], b'\x31\x03\x02\x01\x05'),
+            ('B',
+             [b'\x01\x02', b'\x01', b'', b'\x00\xff'],
+             b'\x31\x0d\x04\x00\x04\x01\x01\x04\x02\x00\xff\x04\x02\x01\x02'),
+            ('C',
+             ['abc', 'b', 'bcde', '', 'ab'],
+             b'\x31\x14\x16\x00\x16\x01b\x16\x02ab\x16\x03abc'
+             b'\x16\x04bcde')
+        ]
+
+        for type_name, decoded, encoded in datas:
+            self.assertEqual(foo.encode(type_name, decoded), encoded)
+            foo.validate(type_name, encoded, canonical=True)
+
     def test_long_tag(self):
         foo = asn1tools.compile_string(
             "Foo DEFINITIONS IMPLICIT TAGS ::= BEGIN "
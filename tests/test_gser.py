@@ -37,7 +37,7 @@ class Asn1ToolsGserTest(Asn1ToolsBaseTest):
         ]
 
         for name, decoded, encoded in datas:
-            self.assertEqual(foo.encode(name, decoded), encoded)
+            self.assert_encode_decode_string(foo, name, decoded, encoded)
 
     def test_real(self):
         foo = asn1tools.compile_string(
@@ -59,7 +59,7 @@ class Asn1ToolsGserTest(Asn1ToolsBaseTest):
         ]
 
         for name, decoded, encoded in datas:
-            self.assertEqual(foo.encode(name, decoded), encoded)
+            self.assert_encode_decode_string(foo, name, decoded, encoded)
 
     def test_null(self):
         foo = asn1tools.compile_string(
@@ -72,7 +72,7 @@ class Asn1ToolsGserTest(Asn1ToolsBaseTest):
         decoded = None
         encoded = b'a A ::= NULL'
 
-        self.assertEqual(foo.encode('A', decoded), encoded)
+        self.assert_encode_decode_string(foo, 'A', decoded, encoded)
 
     def test_octet_string(self):
         foo = asn1tools.compile_string(
@@ -89,7 +89,7 @@ class Asn1ToolsGserTest(Asn1ToolsBaseTest):
         ]
 
         for name, decoded, encoded in datas:
-            self.assertEqual(foo.encode(name, decoded), encoded)
+            self.assert_encode_decode_string(foo, name, decoded, encoded)
 
     def test_sequence(self):
         foo = asn1tools.compile_string(
@@ -108,11 +108,16 @@ class Asn1ToolsGserTest(Asn1ToolsBaseTest):
         datas = [
             ('A',             {'a': True}, b'a A ::= { a TRUE }'),
             ('A', {'a': False, 'b': True}, b'a A ::= { a FALSE, b TRUE }'),
-            ('B',                      {}, b'b B ::= { }')
+            ('B',             {'a': True}, b'b B ::= { a TRUE }')
         ]
 
         for name, decoded, encoded in datas:
-            self.assertEqual(foo.encode(name, decoded), encoded)
+            self.assert_encode_decode_string(foo, name, decoded, encoded)
+
+        # Non-symmetrical encoding and decoding because default values
+        # are not encoded, but part of the decoded.
+        self.assertEqual(foo.encode('B', {}), b'b B ::= { }')
+        self.assertEqual(foo.decode('B', b'b B ::= { }'), {'a': True})
 
         # Missing member.
         with self.assertRaises(asn1tools.EncodeError) as cm:
@@ -121,6 +126,13 @@ class Asn1ToolsGserTest(Asn1ToolsBaseTest):
         self.assertEqual(str(cm.exception),
                          "Sequence member 'a' not found in {}.")
 
+        # Unknown member.
+        with self.assertRaises(asn1tools.DecodeError) as cm:
+            foo.decode('A', b'a A ::= { a TRUE, c FALSE }')
+
+        self.assertEqual(str(cm.exception),
+                         "Expected member 'a' or 'b', but got 'c'.")
+
     def test_sequence_of(self):
         foo = asn1tools.compile_string(
             "Foo DEFINITIONS AUTOMATIC TAGS ::= "
@@ -136,7 +148,7 @@ class Asn1ToolsGserTest(Asn1ToolsBaseTest):
         ]
 
         for name, decoded, encoded in datas:
-            self.assertEqual(foo.encode(name, decoded), encoded)
+            self.assert_encode_decode_string(foo, name, decoded, encoded)
 
     def test_set(self):
         foo = asn1tools.compile_string(
@@ -155,11 +167,16 @@ class Asn1ToolsGserTest(Asn1ToolsBaseTest):
         datas = [
             ('A',             {'a': True}, b'a A ::= { a TRUE }'),
             ('A', {'a': False, 'b': True}, b'a A ::= { a FALSE, b TRUE }'),
-            ('B',                      {}, b'b B ::= { }')
+            ('B',             {'a': True}, b'b B ::= { a TRUE }')
         ]
 
         for name, decoded, encoded in datas:
-            self.assertEqual(foo.encode(name, decoded), encoded)
+            self.assert_encode_decode_string(foo, name, decoded, encoded)
+
+        # Non-symmetrical encoding and decoding because default values
+        # are not encoded, but part of the decoded.
+        self.assertEqual(foo.encode('B', {}), b'b B ::= { }')
+        self.assertEqual(foo.decode('B', b'b B ::= { }'), {'a': True})
 
         # Missing member.
         with self.assertRaises(asn1tools.EncodeError) as cm:
@@ -168,6 +185,13 @@ class Asn1ToolsGserTest(Asn1ToolsBaseTest):
         self.assertEqual(str(cm.exception),
                          "Set member 'a' not found in {}.")
 
+        # Unknown member.
+        with self.assertRaises(asn1tools.DecodeError) as cm:
+            foo.decode('A', b'a A ::= { a TRUE, c FALSE }')
+
+        self.assertEqual(str(cm.exception),
+                         "Expected member 'a' or 'b', but got 'c'.")
+
     def test_set_of(self):
         foo = asn1tools.compile_string(
             "Foo DEFINITIONS AUTOMATIC TAGS ::= "
@@ -183,7 +207,7 @@ class Asn1ToolsGserTest(Asn1ToolsBaseTest):
         ]
 
         for name, decoded, encoded in datas:
-            self.assertEqual(foo.encode(name, decoded), encoded)
+            self.assert_encode_decode_string(foo, name, decoded, encoded)
 
     def test_choice(self):
         foo = asn1tools.compile_string(
@@ -192,9 +216,21 @@ class Asn1ToolsGserTest(Asn1ToolsBaseTest):
             "A ::= CHOICE { "
             "  a NULL "
             "} "
+            "B ::= CHOICE { "
+            "  a NULL, "
+            "  ... "
+            "} "
             "END",
             'gser')
 
+        datas = [
+            ('A', ('a', None), b'a A ::= a : NULL'),
+            ('B', ('a', None), b'b B ::= a : NULL')
+        ]
+
+        for name, decoded, encoded in datas:
+            self.assert_encode_decode_string(foo, name, decoded, encoded)
+
         # Bad choice.
         with self.assertRaises(asn1tools.EncodeError) as cm:
             foo.encode('A', ('b', None))
@@ -202,6 +238,16 @@ class Asn1ToolsGserTest(Asn1ToolsBaseTest):
         self.assertEqual(str(cm.exception),
                          "Expected choice 'a', but got 'b'.")
 
+        with self.assertRaises(asn1tools.DecodeError) as cm:
+            foo.decode('A', b'a A ::= b : NULL')
+
+        self.assertEqual(str(cm.exception),
+                         "Expected choice 'a', but got 'b'.")
+
+        # Unknown choice in an extensible type.
+        self.assertEqual(foo.decode('B', b'b B ::= b : { c { 1, 2 }, d e : 3 }'),
+                         (None, None))
+
     def test_utf8_string(self):
         foo = asn1tools.compile_string(
             "Foo DEFINITIONS AUTOMATIC TAGS ::= "
@@ -212,11 +258,12 @@ class Asn1ToolsGserTest(Asn1ToolsBaseTest):
 
         datas = [
             ('A',      'foo', b'a A ::= "foo"'),
-            ('A',  u'\u0102', b'a A ::= "\xc4\x82"')
+            ('A',  u'\u0102', b'a A ::= "\xc4\x82"'),
+            ('A',     'a"b"', b'a A ::= "a""b"""')
         ]
 
         for name, decoded, encoded in datas:
-            self.assertEqual(foo.encode(name, decoded), encoded)
+            self.assert_encode_decode_string(foo, name, decoded, encoded)
 
     def test_numeric_string(self):
         foo = asn1tools.compile_string(
@@ -229,7 +276,7 @@ class Asn1ToolsGserTest(Asn1ToolsBaseTest):
         decoded = '01 23'
         encoded = b'a A ::= "01 23"'
 
-        self.assertEqual(foo.encode('A', decoded), encoded)
+        self.assert_encode_decode_string(foo, 'A', decoded, encoded)
 
     def test_printable_string(self):
         foo = asn1tools.compile_string(
@@ -242,7 +289,7 @@ class Asn1ToolsGserTest(Asn1ToolsBaseTest):
         decoded = 'foo'
         encoded = b'a A ::= "foo"'
 
-        self.assertEqual(foo.encode('A', decoded), encoded)
+        self.assert_encode_decode_string(foo, 'A', decoded, encoded)
 
     def test_visible_string(self):
         foo = asn1tools.compile_string(
@@ -255,7 +302,7 @@ class Asn1ToolsGserTest(Asn1ToolsBaseTest):
         decoded = 'foo'
         encoded = b'a A ::= "foo"'
 
-        self.assertEqual(foo.encode('A', decoded), encoded)
+        self.assert_encode_decode_string(foo, 'A', decoded, encoded)
 
     def test_general_string(self):
         foo = asn1tools.compile_string(
@@ -268,7 +315,7 @@ class Asn1ToolsGserTest(Asn1ToolsBaseTest):
         decoded = 'foo'
         encoded = b'a A ::= "foo"'
 
-        self.assertEqual(foo.encode('A', decoded), encoded)
+        self.assert_encode_decode_string(foo, 'A', decoded, encoded)
 
     def test_bmp_string(self):
         foo = asn1tools.compile_string(
@@ -284,7 +331,7 @@ class Asn1ToolsGserTest(Asn1ToolsBaseTest):
         ]
 
         for name, decoded, encoded in datas:
-            self.assertEqual(foo.encode(name, decoded), encoded)
+            self.assert_encode_decode_string(foo, name, decoded, encoded)
 
     def test_graphic_string(self):
         foo = asn1tools.compile_string(
@@ -297,7 +344,7 @@ class Asn1ToolsGserTest(Asn1ToolsBaseTest):
         decoded = 'foo'
         encoded = b'a A ::= "foo"'
 
-        self.assertEqual(foo.encode('A', decoded), encoded)
+        self.assert_encode_decode_string(foo, 'A', decoded, encoded)
 
     def test_teletex_string(self):
         foo = asn1tools.compile_string(
@@ -310,7 +357,7 @@ class Asn1ToolsGserTest(Asn1ToolsBaseTest):
         decoded = 'foo'
         encoded = b'a A ::= "foo"'
 
-        self.assertEqual(foo.encode('A', decoded), encoded)
+        self.assert_encode_decode_string(foo, 'A', decoded, encoded)
 
     def test_universal_string(self):
         foo = asn1tools.compile_string(
@@ -325,7 +372,7 @@ class Asn1ToolsGserTest(Asn1ToolsBaseTest):
         ]
 
         for type_name, decoded, encoded in datas:
-            self.assertEqual(foo.encode(type_name, decoded), encoded)
+            self.assert_encode_decode_string(foo, type_name, decoded, encoded)
 
     def test_utc_time(self):
         foo = asn1tools.compile_string(
@@ -338,7 +385,7 @@ class Asn1ToolsGserTest(Asn1ToolsBaseTest):
         decoded = ut2dt('010203040506Z')
         encoded = b'a A ::= "010203040506Z"'
 
-        self.assertEqual(foo.encode('A', decoded), encoded)
+        self.assert_encode_decode_string(foo, 'A', decoded, encoded)
 
     def test_generalized_time(self):
         foo = asn1tools.compile_string(
@@ -351,7 +398,7 @@ class Asn1ToolsGserTest(Asn1ToolsBaseTest):
         decoded = gt2dt('20001231235959.999Z')
         encoded = b'a A ::= "20001231235959.999Z"'
 
-        self.assertEqual(foo.encode('A', decoded), encoded)
+        self.assert_encode_decode_string(foo, 'A', decoded, encoded)
 
     def test_any(self):
         foo = asn1tools.compile_string(
@@ -369,7 +416,7 @@ class Asn1ToolsGserTest(Asn1ToolsBaseTest):
         ]
 
         for name, decoded, encoded in datas:
-            self.assertEqual(foo.encode(name, decoded), encoded)
+            self.assert_encode_decode_string(foo, name, decoded, encoded)
 
     def test_foo(self):
         foo = asn1tools.compile_files(['tests/files/foo.asn'], 'gser')
@@ -381,7 +428,7 @@ class Asn1ToolsGserTest(Asn1ToolsBaseTest):
         ]
 
         for name, decoded, encoded in datas:
-            self.assertEqual(foo.encode(name, decoded), encoded)
+            self.assert_encode_decode_string(foo, name, decoded, encoded)
 
     def test_foo_indent(self):
         foo = asn1tools.compile_files(['tests/files/foo.asn'], 'gser')
@@ -396,8 +443,56 @@ class Asn1ToolsGserTest(Asn1ToolsBaseTest):
         ]
 
         for name, decoded, encoded in datas:
-            actual = foo.encode(name, decoded, indent=2)
-            self.assertEqual(actual, encoded)
+            self.assert_encode_decode_string(foo,
+                                             name,
+                                             decoded,
+                                             encoded,
+                                             indent=2)
+
+    def test_decode_error(self):
+        foo = asn1tools.compile_string(
+            "Foo DEFINITIONS AUTOMATIC TAGS ::= "
+            "BEGIN "
+            "A ::= SEQUENCE { "
+            "  a INTEGER, "
+            "  b SEQUENCE OF BOOLEAN, "
+            "  ... "
+            "} "
+            "END",
+            'gser')
+
+        # Unknown members are skipped in extensible types.
+        self.assertEqual(
+            foo.decode('A', b'a A ::= { a 1, c { d NULL }, b { TRUE } }'),
+            {'a': 1, 'b': [True]})
+
+        # The value assignment is optional.
+        self.assertEqual(foo.decode('A', b'{ a 1, b { } }'), {'a': 1, 'b': []})
+
+        datas = [
+            (b'a A ::= { a 1',
+             "Expected ',' or '}', but got end of data."),
+            (b'a A ::= { a 1 } }',
+             "Expected end of data, but got '}'."),
+            (b'a A ::= { a one }',
+             "a: Expected an integer, but got 'one'."),
+            (b'a A ::= { a 1, b { TRUE FALSE } }',
+             "b: Expected ',' or '}', but got 'FALSE'."),
+            (b'a A ::= { a 1, b { TRUE, 1 } }',
+             "b: Expected 'TRUE' or 'FALSE', but got '1'."),
+            (b'a A ::= { a 1, c { d { NULL }',
+             "Expected '}', but got end of data."),
+            (b'a A ::= 5',
+             "Expected '{', but got '5'."),
+            (b'',
+             "Expected '{', but got end of data.")
+        ]
+
+        for encoded, message in datas:
+            with self.assertRaises(asn1tools.DecodeError) as cm:
+                foo.decode('A', encoded)
+
+            self.assertEqual(str(cm.exception), message)
 
     def test_rrc_8_6_0(self):
         rrc = asn1tools.compile_dict(deepcopy(RRC_8_6_0), 'gser')
@@ -808,8 +903,11 @@ class Asn1ToolsGserTest(Asn1ToolsBaseTest):
             b"}"
         )
 
-        self.assertEqual(rrc.encode('BCCH-DL-SCH-Message', decoded, indent=2),
-                         encoded)
+        self.assert_encode_decode_string(rrc,
+                                         'BCCH-DL-SCH-Message',
+                                         decoded,
+                                         encoded,
+                                         indent=2)
 
     def test_repr_all_types(self):
         all_types = asn1tools.compile_files('tests/files/all_types.asn',
@@ -929,8 +1027,11 @@ class Asn1ToolsGserTest(Asn1ToolsBaseTest):
             b"}"
         )
 
-        self.assertEqual(rfc4511.encode('LDAPMessage', decoded, indent=2),
-                         encoded)
+        self.assert_encode_decode_string(rfc4511,
+                                         'LDAPMessage',
+                                         decoded,
+                                         encoded,
+                                         indent=2)
 
 
 if __name__ == '__main__':
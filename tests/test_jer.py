@@ -2,11 +2,14 @@
 # -*- coding: utf-8 -*-
 
 import json
+import pickle
 import unittest
 import asn1tools
 import sys
 import math
 from copy import deepcopy
+from io import BytesIO
+from asn1tools.codecs import jer
 from asn1tools.codecs import utc_time_to_datetime as ut2dt
 from asn1tools.codecs import generalized_time_to_datetime as gt2dt
 
@@ -374,6 +377,148 @@ class Asn1ToolsJerTest(unittest.TestCase):
         self.assertEqual(str(cm.exception),
                          'Decode length is not supported for this codec.')
 
+    def test_stream(self):
+        foo = asn1tools.compile_string(
+            "Foo DEFINITIONS AUTOMATIC TAGS ::= "
+            "BEGIN "
+            "A ::= SEQUENCE OF SEQUENCE { "
+            "  a INTEGER, "
+            "  b UTF8String "
+            "} "
+            "B ::= SET OF INTEGER "
+            "C ::= SEQUENCE { a INTEGER } "
+            "END",
+            'jer')
+
+        datas = [
+            ('A', []),
+            ('A', [{'a': 1, 'b': u'åäö'}]),
+            ('A', [{'a': 12345, 'b': 'x'}, {'a': -1, 'b': '[],'}]),
+            ('B', [1, 22, 333, 4444])
+        ]
+
+        for type_name, decoded in datas:
+            for indent in [None, 0, 4, '\t']:
+                fileobj = BytesIO()
+                foo.encode_jer_stream(type_name,
+                                      iter(decoded),
+                                      fileobj,
+                                      indent=indent)
+                encoded = fileobj.getvalue()
+                self.assertEqual(encoded,
+                                 foo.encode(type_name, decoded, indent=indent))
+
+                # Read the data in chunks of different sizes, splitting
+                # numbers and multi-byte characters.
+                for read_size in [1, 3, 65536]:
+                    read_size_default = jer.ITER_DECODE_READ_SIZE
+                    jer.ITER_DECODE_READ_SIZE = read_size
+
+                    try:
+                        self.assertEqual(
+                            list(foo.iter_decode_jer(type_name, BytesIO(encoded))),
+                            decoded)
+                    finally:
+                        jer.ITER_DECODE_READ_SIZE = read_size_default
+
+        # Decode errors.
+        datas = [
+            (b'', "Expected '[', but got ''."),
+            (b' {}', "Expected '[', but got '{'."),
+            (b'[1 2]', "Expected ',' or ']', but got '2'."),
+            (b'[1, 2', "Expected ',' or ']', but got ''."),
+            (b'[1] 2', "Expected end of data, but got '2'."),
+            (b'[1, ', "Expected a value, but got ''."),
+            (b'[1, "2', "Expected a value, but got '\"'."),
+            (b'[1, 2x, 3]', "Expected ',' or ']', but got 'x'."),
+            (b'[1, {]', "Expected a value, but got ']'.")
+        ]
+
+        for encoded, message in datas:
+            with self.assertRaises(asn1tools.DecodeError) as cm:
+                list(foo.iter_decode_jer('B', BytesIO(encoded)))
+
+            self.assertEqual(str(cm.exception), message)
+
+        # A malformed element is not fixed by reading more data.
+        fileobj = BytesIO(b'[1, [2 3]' + 1000000 * b', 4' + b']')
+
+        with self.assertRaises(asn1tools.DecodeError) as cm:
+            list(foo.iter_decode_jer('B', fileobj))
+
+        self.assertEqual(str(cm.exception), "Expected a value, but got '3'.")
+        self.assertEqual(fileobj.tell(), jer.ITER_DECODE_READ_SIZE)
+
+        # Not a SEQUENCE OF or SET OF.
+        with self.assertRaises(asn1tools.EncodeError) as cm:
+            foo.encode_jer_stream('C', [], BytesIO())
+
+        self.assertEqual(str(cm.exception),
+                         'Expected a SEQUENCE OF or SET OF type, but got SEQUENCE.')
+
+        with self.assertRaises(asn1tools.DecodeError) as cm:
+            list(foo.iter_decode_jer('C', BytesIO(b'{"a":1}')))
+
+        self.assertEqual(str(cm.exception),
+                         'Expected a SEQUENCE OF or SET OF type, but got SEQUENCE.')
+
+        # Type error in an element.
+        with self.assertRaises(asn1tools.EncodeError) as cm:
+            foo.encode_jer_stream('B', [1, None], BytesIO())
+
+        self.assertEqual(str(cm.exception),
+                         'Expected data of type int or str, but got None.')
+
+    def test_json_backend(self):
+        class Backend(object):
+
+            def __init__(self):
+                self.dumps_kwargs = []
+                self.loads_data = []
+
+            def dumps(self, value, **kwargs):
+                self.dumps_kwargs.append(kwargs)
+
+                return json.dumps(value, sort_keys=True, **kwargs).encode('ascii')
+
+            def loads(self, data):
+                self.loads_data.append(data)
+
+                return json.loads(data.decode('ascii'))
+
+        backend = Backend()
+        foo = asn1tools.compile_files('tests/files/foo.asn',
+                                      'jer',
+                                      json_backend=backend)
+
+        decoded = {'question': 'Is 1+1=3?', 'id': 1}
+        encoded = b'{"id": 1, "question": "Is 1+1=3?"}'
+
+        self.assertEqual(foo.encode('Question', decoded), encoded)
+        self.assertEqual(foo.decode('Question', encoded), decoded)
+        self.assertEqual(foo.encode('Question', decoded, indent=2),
+                         b'{\n  "id": 1,\n  "question": "Is 1+1=3?"\n}')
+        self.assertEqual(backend.dumps_kwargs, [{}, {'indent': 2}])
+        self.assertEqual(backend.loads_data, [encoded])
+
+        # A module as backend can be pickled.
+        foo = asn1tools.compile_files('tests/files/foo.asn',
+                                      'jer',
+                                      json_backend=json)
+        foo = pickle.loads(pickle.dumps(foo))
+        foo_default = asn1tools.compile_files('tests/files/foo.asn', 'jer')
+
+        # The json module gives the same output as no backend.
+        for indent in [None, 2]:
+            self.assertEqual(foo.encode('Question', decoded, indent=indent),
+                             foo_default.encode('Question',
+                                                decoded,
+                                                indent=indent))
+
+        self.assertEqual(foo.encode('Question', decoded),
+                         b'{"id":1,"question":"Is 1+1=3?"}')
+        self.assertEqual(foo.decode('Question', encoded), decoded)
+
     def test_rrc_8_6_0(self):
         rrc = asn1tools.compile_dict(deepcopy(RRC_8_6_0), 'jer')
 
@@ -830,6 +975,47 @@ class Asn1ToolsJerTest(unittest.TestCase):
 
             self.assertEqual(str(cm.exception), message)
 
+    def test_decode_limits(self):
+        foo = asn1tools.compile_string(
+            "Foo DEFINITIONS AUTOMATIC TAGS ::= "
+            "BEGIN "
+            "A ::= SEQUENCE { "
+            "  a SEQUENCE OF INTEGER, "
+            "  b UTF8String "
+            "} "
+            "END",
+            'jer')
+
+        datas = [
+            ({'a': [1, 2, 3], 'b': 'hello'}, b'{"a":[1,2,3],"b":"hello"}'),
+            ({'a': [], 'b': 'a"{[,'}, b'{"a":[ ],"b":"\\u0061\\"{[,"}')
+        ]
+
+        for decoded, encoded in datas:
+            self.assertEqual(foo.decode('A',
+                                        encoded,
+                                        maximum_depth=2,
+                                        maximum_number_of_elements=6,
+                                        maximum_string_length=5),
+                             decoded)
+
+        encoded = b'{"a":[1,2,3],"b":"hello"}'
+
+        datas = [
+            ({'maximum_depth': 1},
+             'Expected at most 1 nesting levels.'),
+            ({'maximum_number_of_elements': 5},
+             'Expected at most 5 elements, but got 6.'),
+            ({'maximum_string_length': 4},
+             'Expected at most 4 characters in a string, but got 5.')
+        ]
+
+        for limits, message in datas:
+            with self.assertRaises(asn1tools.DecodeError) as cm:
+                foo.decode('A', encoded, **limits)
+
+            self.assertEqual(str(cm.exception), message)
+
     def test_indent(self):
         foo = asn1tools.compile_string(
             "Foo DEFINITIONS AUTOMATIC TAGS ::= "
@@ -866,6 +1052,62 @@ class Asn1ToolsJerTest(unittest.TestCase):
             for line in encoded.splitlines():
                 self.assertIn(line, encoded_lines)
 
+    def test_indent_nested(self):
+        foo = asn1tools.compile_string(
+            "Foo DEFINITIONS AUTOMATIC TAGS ::= "
+            "BEGIN "
+            "A ::= SEQUENCE { "
+            "  a CHOICE { "
+            "    b SEQUENCE OF BIT STRING, "
+            "    c NULL "
+            "  }, "
+            "  d SEQUENCE OF INTEGER, "
+            "  e SEQUENCE { } "
+            "} "
+            "END",
+            'jer')
+
+        decoded = {
+            'a': ('b', [(b'\x80', 1)]),
+            'd': [],
+            'e': {}
+        }
+
+        datas = [
+            (None,
+             b'{"a":{"b":[{"value":"80","length":1}]},"d":[],"e":{}}'),
+            (2,
+             b'{\n'
+             b'  "a": {\n'
+             b'    "b": [\n'
+             b'      {\n'
+             b'        "value": "80",\n'
+             b'        "length": 1\n'
+             b'      }\n'
+             b'    ]\n'
+             b'  },\n'
+             b'  "d": [],\n'
+             b'  "e": {}\n'
+             b'}'),
+            ('\t',
+             b'{\n'
+             b'\t"a": {\n'
+             b'\t\t"b": [\n'
+             b'\t\t\t{\n'
+             b'\t\t\t\t"value": "80",\n'
+             b'\t\t\t\t"length": 1\n'
+             b'\t\t\t}\n'
+             b'\t\t]\n'
+             b'\t},\n'
+             b'\t"d": [],\n'
+             b'\t"e": {}\n'
+             b'}')
+        ]
+
+        for indent, encoded in datas:
+            self.assertEqual(foo.encode('A', decoded, indent=indent), encoded)
+            self.assertEqual(foo.decode('A', encoded), decoded)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -899,6 +899,66 @@ class Asn1ToolsOerTest(Asn1ToolsBaseTest):
                                   decoded,
                                   encoded)
 
+    def test_iter_decode(self):
+        foo = asn1tools.compile_string(
+            "Foo DEFINITIONS AUTOMATIC TAGS ::= "
+            "BEGIN "
+            "A ::= SEQUENCE { "
+            "  a INTEGER, "
+            "  b OCTET STRING OPTIONAL "
+            "} "
+            "END",
+            'oer')
+
+        decoded = [
+            {'a': 1},
+            {'a': 2, 'b': 1000 * b'\x55'},
+            {'a': -3}
+        ]
+        encoded = b''.join([foo.encode('A', value) for value in decoded])
+        messages = list(foo.iter_decode('A', memoryview(encoded)))
+
+        self.assertEqual([message[0] for message in messages], decoded)
+        self.assertEqual([message[1:] for message in messages],
+                         [(0, 3), (3, 1009), (1009, 1012)])
+
+        # The trailing partial message is not decoded.
+        messages = list(foo.iter_decode('A', encoded[:1008]))
+        self.assertEqual([message[0] for message in messages], decoded[:1])
+
+    def test_decode_length(self):
+        foo = asn1tools.compile_string(
+            "Foo DEFINITIONS AUTOMATIC TAGS ::= "
+            "BEGIN "
+            "A ::= SEQUENCE { "
+            "  a INTEGER, "
+            "  b CHOICE { "
+            "    c OCTET STRING, "
+            "    d SEQUENCE OF IA5String, "
+            "    ... "
+            "  }, "
+            "  ... "
+            "} "
+            "END",
+            'oer')
+
+        with self.assertRaises(asn1tools.DecodeError) as cm:
+            foo.decode_length(b'')
+
+        self.assertEqual(str(cm.exception),
+                         'Decode length is not supported for this codec.')
+
+        datas = [
+            ({'a': 1, 'b': ('c', 1000 * b'\x55')}, 1007),
+            ({'a': 2, 'b': ('d', ['foo', 'bar'])}, 14)
+        ]
+
+        for decoded, length in datas:
+            encoded = foo.encode('A', decoded)
+            self.assertEqual(len(encoded), length)
+            self.assertEqual(foo.decode_length(encoded + b'\x00', 'A'), length)
+            self.assertIsNone(foo.decode_length(encoded[:-1], 'A'))
+
     def test_out_of_data(self):
         foo = asn1tools.compile_string(
             "Foo DEFINITIONS AUTOMATIC TAGS ::= "
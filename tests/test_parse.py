@@ -1,4 +1,6 @@
+import os
 import sys
+import threading
 import unittest
 import importlib
 
@@ -90,6 +92,76 @@ class Asn1ToolsParseTest(unittest.TestCase):
     def test_parse_lpp_14_3_0(self):
         self.parse_and_verify('lpp_14_3_0', '3gpp')
 
+    def test_parse_threads(self):
+        """The grammar is shared by all parse calls, also in different
+        threads.
+
+        """
+
+        import foo
+        import bar
+
+        datas = 4 * [('foo', foo.EXPECTED), ('bar', bar.EXPECTED)]
+        results = [None] * len(datas)
+
+        def parse(index, module):
+            results[index] = asn1tools.parse_files(
+                'tests/files/' + module + '.asn')
+
+        threads = [
+            threading.Thread(target=parse, args=(index, module))
+            for index, (module, _) in enumerate(datas)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, [expected for _, expected in datas])
+
+    def test_parse_files_number_of_workers(self):
+        import foo
+        import bar
+
+        expected = dict(foo.EXPECTED)
+        expected.update(bar.EXPECTED)
+
+        for number_of_workers in [1, 2, None]:
+            actual = asn1tools.parse_files(['tests/files/foo.asn',
+                                            'tests/files/bar.asn'],
+                                           number_of_workers=number_of_workers)
+            self.assertEqual(actual, expected)
+
+    def test_parse_files_error_line(self):
+        """Error line numbers refer to the file the module is in.
+
+        """
+
+        filename = 'test_parse_files_error_line.asn'
+
+        with open(filename, 'w') as fout:
+            fout.write('A DEFINITIONS ::= BEGIN\n'
+                       'END\n'
+                       '\n'
+                       '-- A comment.\n'
+                       'B DEFINITIONS ::= BEGIN\n'
+                       '  b INTEGER ::=\n'
+                       'END\n')
+
+        try:
+            for number_of_workers in [1, 2]:
+                with self.assertRaises(asn1tools.ParseError) as cm:
+                    asn1tools.parse_files(['tests/files/foo.asn', filename],
+                                          number_of_workers=number_of_workers)
+
+                self.assertTrue(str(cm.exception).startswith(
+                    "Invalid ASN.1 syntax in 'test_parse_files_error_line.asn' "
+                    "at line 7, column 1: '>!<END': "))
+        finally:
+            os.remove(filename)
+
     def test_parse_rfc1155(self):
         self.parse_and_verify('rfc1155', 'ietf')
 
@@ -515,6 +587,27 @@ class Asn1ToolsParseTest(unittest.TestCase):
     def test_parse_encoding(self):
         asn1tools.parse_files('tests/files/foo.asn', encoding='ascii')
 
+    def test_binary(self):
+        actual = asn1tools.parse_files('tests/files/3gpp/rrc_8_6_0.asn')
+        encoded = asn1tools.parser.dump_binary(actual)
+        self.assertEqual(asn1tools.parser.load_binary(encoded), actual)
+
+        with self.assertRaises(asn1tools.ParseError) as cm:
+            asn1tools.parser.load_binary(b'SPECIFICATION = {}')
+
+        self.assertEqual(str(cm.exception), 'Not a binary specification.')
+
+        # Unsupported format version.
+        encoded = bytearray(encoded)
+        encoded[len(asn1tools.parser.BINARY_MAGIC)] = 2
+
+        with self.assertRaises(asn1tools.ParseError) as cm:
+            asn1tools.parser.load_binary(bytes(encoded))
+
+        self.assertEqual(
+            str(cm.exception),
+            'Expected binary specification format version 1, but got 2.')
+
 
 if __name__ == '__main__':
     unittest.main()
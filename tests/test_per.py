@@ -1162,6 +1162,41 @@ class Asn1ToolsPerTest(Asn1ToolsBaseTest):
         self.assertEqual(str(cm.exception),
                          'Decode length is not supported for this codec.')
 
+        # The length is found by skipping the encoded value of given
+        # type.
+        encoded = b'\x01\x01\x09Is 1+1=3?'
+        self.assertEqual(foo.decode_length(encoded + b'\xff', 'Question'), 12)
+        self.assertIsNone(foo.decode_length(encoded[:-1], 'Question'))
+
+        # Open types are skipped using their length determinant.
+        information_object = asn1tools.compile_files(
+            'tests/files/information_object.asn', 'per')
+        encoded = (
+            b'\x01\x00\x01\x05\x06\x69\x74\x65\x6d\x20\x30\x01\x02'
+        )
+        self.assertEqual(
+            information_object.decode_length(encoded + 300 * b'\x00',
+                                             'ItemWithoutConstraints'),
+            13)
+        self.assertIsNone(
+            information_object.decode_length(encoded[:3],
+                                             'ItemWithoutConstraints'))
+
+        with self.assertRaises(asn1tools.DecodeError) as cm:
+            foo.decode_length(b'', 'Foo')
+
+        self.assertEqual(str(cm.exception),
+                         "Type 'Foo' not found in types dictionary.")
+
+    def test_iter_decode(self):
+        foo = asn1tools.compile_files('tests/files/foo.asn', 'per')
+
+        with self.assertRaises(asn1tools.DecodeError) as cm:
+            foo.iter_decode('Question', b'')
+
+        self.assertEqual(str(cm.exception),
+                         'Iterative decoding is not supported for this codec.')
+
     def test_versions(self):
         foo = asn1tools.compile_files('tests/files/versions.asn', 'per')
 
@@ -1394,6 +1394,12 @@ class Asn1ToolsUPerTest(Asn1ToolsBaseTest):
         self.assertEqual(str(cm.exception),
                          "Decode length is not supported for this codec.")
 
+        # The length is found by skipping the encoded value of given
+        # type.
+        encoded = b'\x01\x01\x09\x93\xcd\x03\x15\x6c\x5e\xb3\x7e'
+        self.assertEqual(foo.decode_length(encoded + b'\xff', 'Question'), 11)
+        self.assertIsNone(foo.decode_length(encoded[:-1], 'Question'))
+
     def test_versions(self):
         foo = asn1tools.compile_files('tests/files/versions.asn', 'uper')
 
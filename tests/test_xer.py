@@ -6,6 +6,7 @@ from .utils import Asn1ToolsBaseTest
 import asn1tools
 import sys
 from copy import deepcopy
+from io import BytesIO
 from asn1tools.codecs import utc_time_to_datetime as ut2dt
 from asn1tools.codecs import generalized_time_to_datetime as gt2dt
 
@@ -209,6 +210,49 @@ class Asn1ToolsXerTest(Asn1ToolsBaseTest):
         self.assertEqual(foo.encode('B', {}), b'<B />')
         self.assertEqual(foo.decode('B', b'<B />'), {'a': 4})
 
+    def test_sequence_many_members(self):
+        foo = asn1tools.compile_string(
+            "Foo DEFINITIONS AUTOMATIC TAGS ::= "
+            "BEGIN "
+            "A ::= SEQUENCE { "
+            "  a INTEGER, "
+            "  b INTEGER OPTIONAL, "
+            "  c INTEGER, "
+            "  d INTEGER DEFAULT 4, "
+            "  e INTEGER, "
+            "  f INTEGER OPTIONAL, "
+            "  g INTEGER, "
+            "  h INTEGER, "
+            "  i INTEGER, "
+            "  j BOOLEAN "
+            "} "
+            "END",
+            'xer')
+
+        datas = [
+            ('A',
+             {'a': 1, 'c': 3, 'd': 4, 'e': 5, 'g': 7, 'h': 8, 'i': 9, 'j': True},
+             b'<A><a>1</a><c>3</c><d>4</d><e>5</e><g>7</g><h>8</h><i>9</i>'
+             b'<j><true /></j></A>'),
+            ('A',
+             {
+                 'a': 1, 'b': 2, 'c': 3, 'd': 6, 'e': 5, 'f': 6, 'g': 7,
+                 'h': 8, 'i': 9, 'j': False
+             },
+             b'<A><a>1</a><b>2</b><c>3</c><d>6</d><e>5</e><f>6</f><g>7</g>'
+             b'<h>8</h><i>9</i><j><false /></j></A>')
+        ]
+
+        for type_name, decoded, encoded in datas:
+            self.assert_encode_decode_string(foo, type_name, decoded, encoded)
+
+        # Non-symmetrical encoding and decoding.
+        self.assertEqual(
+            foo.decode('A',
+                       b'<A><j><true /></j><i>9</i><h>8</h><g>7</g><e>5</e>'
+                       b'<c>3</c><a>1</a><a>2</a></A>'),
+            {'a': 1, 'c': 3, 'd': 4, 'e': 5, 'g': 7, 'h': 8, 'i': 9, 'j': True})
+
     def test_sequence_of(self):
         foo = asn1tools.compile_string(
             "Foo DEFINITIONS AUTOMATIC TAGS ::= "
@@ -440,6 +484,54 @@ class Asn1ToolsXerTest(Asn1ToolsBaseTest):
         self.assertEqual(str(cm.exception),
                          'Decode length is not supported for this codec.')
 
+    def test_iter_decode_xer(self):
+        foo = asn1tools.compile_string(
+            "Foo DEFINITIONS AUTOMATIC TAGS ::= "
+            "BEGIN "
+            "A ::= SEQUENCE OF SEQUENCE { "
+            "  a INTEGER, "
+            "  b CHOICE { c BOOLEAN, d SEQUENCE OF INTEGER } "
+            "} "
+            "B ::= SET OF INTEGER "
+            "C ::= SEQUENCE { a INTEGER } "
+            "END",
+            'xer')
+
+        datas = [
+            ('A', b'<A />', []),
+            ('A',
+             b'<A><SEQUENCE><a>1</a><b><c><true /></c></b></SEQUENCE>'
+             b'<SEQUENCE><a>2</a><b><d><INTEGER>3</INTEGER>'
+             b'<INTEGER>4</INTEGER></d></b></SEQUENCE></A>',
+             [{'a': 1, 'b': ('c', True)}, {'a': 2, 'b': ('d', [3, 4])}]),
+            ('B', b'<B><INTEGER>1</INTEGER><INTEGER>2</INTEGER></B>', [1, 2])
+        ]
+
+        for type_name, encoded, decoded in datas:
+            self.assertEqual(
+                list(foo.iter_decode_xer(type_name, BytesIO(encoded))),
+                decoded)
+
+        # Not a SEQUENCE OF or SET OF.
+        with self.assertRaises(asn1tools.DecodeError) as cm:
+            list(foo.iter_decode_xer('C', BytesIO(b'<C><a>1</a></C>')))
+
+        self.assertEqual(str(cm.exception),
+                         'Expected a SEQUENCE OF or SET OF type, but got SEQUENCE.')
+
+        # Other codecs.
+        foo = asn1tools.compile_string(
+            "Foo DEFINITIONS AUTOMATIC TAGS ::= "
+            "BEGIN "
+            "B ::= SET OF INTEGER "
+            "END")
+
+        with self.assertRaises(asn1tools.DecodeError) as cm:
+            foo.iter_decode_xer('B', BytesIO(b''))
+
+        self.assertEqual(str(cm.exception),
+                         'Iterative XER decoding is not supported for this codec.')
+
     def test_rrc_8_6_0(self):
         rrc = asn1tools.compile_dict(deepcopy(RRC_8_6_0), 'xer')
 
@@ -896,6 +988,66 @@ class Asn1ToolsXerTest(Asn1ToolsBaseTest):
         for type_name, decoded, encoded in datas:
             self.assert_encode_decode_string(foo, type_name, decoded, encoded)
 
+    def test_decode_limits(self):
+        foo = asn1tools.compile_string(
+            "Foo DEFINITIONS AUTOMATIC TAGS ::= "
+            "BEGIN "
+            "A ::= SEQUENCE { "
+            "  a SEQUENCE OF INTEGER, "
+            "  b UTF8String "
+            "} "
+            "END",
+            'xer')
+
+        decoded = {'a': [1, 2, 3], 'b': 'hello'}
+        encoded = (b'<A><a><INTEGER>1</INTEGER><INTEGER>2</INTEGER>'
+                   b'<INTEGER>3</INTEGER></a><b>hello</b></A>')
+
+        self.assertEqual(foo.decode('A',
+                                    encoded,
+                                    maximum_depth=3,
+                                    maximum_number_of_elements=6,
+                                    maximum_string_length=5),
+                         decoded)
+
+        datas = [
+            ({'maximum_depth': 2},
+             'Expected at most 2 nesting levels.'),
+            ({'maximum_number_of_elements': 5},
+             'Expected at most 5 elements.'),
+            ({'maximum_string_length': 4},
+             'Expected at most 4 characters in a string.')
+        ]
+
+        for limits, message in datas:
+            with self.assertRaises(asn1tools.DecodeError) as cm:
+                foo.decode('A', encoded, **limits)
+
+            self.assertEqual(str(cm.exception), message)
+
+        # Parsing stops at the first exceeded limit.
+        encoded = (b'<A><a>'
+                   + 100000 * b'<INTEGER>1</INTEGER>'
+                   + b'</a><b>hello</b></A>')
+
+        with self.assertRaises(asn1tools.DecodeError) as cm:
+            foo.decode('A', encoded, maximum_number_of_elements=10)
+
+        self.assertEqual(str(cm.exception), 'Expected at most 10 elements.')
+
+        # Text is counted as it is parsed, also when split by
+        # character references and entities.
+        encoded = b'<A><a /><b>he&#108;&amp;lo</b></A>'
+
+        self.assertEqual(foo.decode('A', encoded, maximum_string_length=6),
+                         {'a': [], 'b': 'hel&lo'})
+
+        with self.assertRaises(asn1tools.DecodeError) as cm:
+            foo.decode('A', encoded, maximum_string_length=5)
+
+        self.assertEqual(str(cm.exception),
+                         'Expected at most 5 characters in a string.')
+
     def test_indent(self):
         foo = asn1tools.compile_string(
             "Foo DEFINITIONS AUTOMATIC TAGS ::= "
@@ -929,6 +1081,74 @@ class Asn1ToolsXerTest(Asn1ToolsBaseTest):
                                              encoded,
                                              indent=4)
 
+    def test_indent_nested(self):
+        foo = asn1tools.compile_string(
+            "Foo DEFINITIONS AUTOMATIC TAGS ::= "
+            "BEGIN "
+            "A ::= SEQUENCE { "
+            "  a SEQUENCE OF CHOICE { "
+            "    b BOOLEAN, "
+            "    c ENUMERATED { d, e }, "
+            "    f SEQUENCE { } "
+            "  }, "
+            "  g SEQUENCE OF BOOLEAN, "
+            "  h SEQUENCE OF INTEGER, "
+            "  i UTF8String "
+            "} "
+            "END",
+            'xer')
+
+        decoded = {
+            'a': [('b', True), ('c', 'e'), ('f', {})],
+            'g': [False],
+            'h': [],
+            'i': ''
+        }
+
+        datas = [
+            (0,
+             b'<A>\n'
+             b'<a>\n'
+             b'<b>\n'
+             b'<true />\n'
+             b'</b>\n'
+             b'<c>\n'
+             b'<e />\n'
+             b'</c>\n'
+             b'<f />\n'
+             b'</a>\n'
+             b'<g>\n'
+             b'<false />\n'
+             b'</g>\n'
+             b'<h />\n'
+             b'<i />\n'
+             b'</A>\n'),
+            (2,
+             b'<A>\n'
+             b'  <a>\n'
+             b'    <b>\n'
+             b'      <true />\n'
+             b'    </b>\n'
+             b'    <c>\n'
+             b'      <e />\n'
+             b'    </c>\n'
+             b'    <f />\n'
+             b'  </a>\n'
+             b'  <g>\n'
+             b'    <false />\n'
+             b'  </g>\n'
+             b'  <h />\n'
+             b'  <i />\n'
+             b'</A>\n')
+        ]
+
+        for indent, encoded in datas:
+            self.assert_encode_decode_string(foo,
+                                             'A',
+                                             decoded,
+                                             encoded,
+                                             indent=indent)
+
     def test_issue_34(self):
         """Test that a choice type with a recursive member can be compiled and
         used.